@@ -5,6 +5,9 @@ from typing import Any
 from google.cloud import firestore  # type: ignore[attr-defined]
 from google.cloud.firestore_v1.base_query import FieldFilter
 
+# Firestore batch write 1회당 최대 쓰기 수
+MAX_BATCH_WRITES = 500
+
 
 class FirestoreClient:
     """Client for Firestore CRUD operations.
@@ -45,6 +48,25 @@ class FirestoreClient:
         """
         self._db.collection(collection).document(doc_id).set(data)
 
+    def set_many(
+        self, collection: str, documents: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Create or replace multiple documents with batched writes.
+
+        Documents are committed in batches of MAX_BATCH_WRITES, so N documents
+        take ceil(N / MAX_BATCH_WRITES) round-trips instead of N.
+
+        Args:
+            collection: Collection name.
+            documents: List of (doc_id, data) tuples.
+        """
+        col = self._db.collection(collection)
+        for start in range(0, len(documents), MAX_BATCH_WRITES):
+            batch = self._db.batch()
+            for doc_id, data in documents[start : start + MAX_BATCH_WRITES]:
+                batch.set(col.document(doc_id), data)
+            batch.commit()
+
     def update(self, collection: str, doc_id: str, data: dict[str, Any]) -> None:
         """Update specific fields in a document.
 
@@ -65,13 +87,23 @@ class FirestoreClient:
         self._db.collection(collection).document(doc_id).delete()
 
     def query(
-        self, collection: str, filters: list[tuple[str, str, Any]]
+        self,
+        collection: str,
+        filters: list[tuple[str, str, Any]],
+        fields: list[str] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Query documents with filters.
 
         Args:
             collection: Collection name.
             filters: List of (field, operator, value) tuples.
+            fields: Optional field projection (only these fields are returned).
+            order_by: Optional field to order results by.
+            descending: Order descending when order_by is given.
+            limit: Optional maximum number of documents to return.
 
         Returns:
             List of matching documents.
@@ -79,5 +111,14 @@ class FirestoreClient:
         query = self._db.collection(collection)
         for field, op, value in filters:
             query = query.where(filter=FieldFilter(field, op, value))
+        if fields:
+            query = query.select(fields)
+        if order_by:
+            direction = (
+                firestore.Query.DESCENDING if descending else firestore.Query.ASCENDING
+            )
+            query = query.order_by(order_by, direction=direction)
+        if limit is not None:
+            query = query.limit(limit)
 
         return [doc.to_dict() for doc in query.stream()]
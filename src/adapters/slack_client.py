@@ -1,5 +1,6 @@
 """Slack API client."""
 
+import ssl
 from typing import Any, cast
 
 from slack_sdk import WebClient
@@ -14,7 +15,9 @@ class SlackClient:
         Args:
             token: Slack Bot OAuth token (xoxb-...).
         """
-        self._client = WebClient(token=token)
+        # Build the TLS context once. Without it, every API call creates a
+        # fresh default context and reloads the system CA bundle.
+        self._client = WebClient(token=token, ssl=ssl.create_default_context())
 
     def post_message(
         self,
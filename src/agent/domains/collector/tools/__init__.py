@@ -4,8 +4,10 @@ RSS, YouTube, Web 수집 도구들.
 """
 
 from src.agent.domains.collector.tools.rss_tool import (
+    FeedCacheHeaders,
     RSSEntry,
     fetch_rss,
+    fetch_rss_many,
     parse_rss_feed,
 )
 from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -13,7 +15,10 @@ from src.agent.domains.collector.tools.web_scraper_tool import (
     ScrapedContent,
     ScrapingError,
     WebScraperConfig,
+    close_shared_browser,
+    close_shared_http_client,
     fetch_web,
+    fetch_web_many,
 )
 from src.agent.domains.collector.tools.youtube_tool import (
     YouTubeTranscript,
@@ -23,15 +28,20 @@ from src.agent.domains.collector.tools.youtube_tool import (
 )
 
 __all__ = [
+    "FeedCacheHeaders",
     "NetworkError",
     "RSSEntry",
     "ScrapedContent",
     "ScrapingError",
     "WebScraperConfig",
     "YouTubeTranscript",
+    "close_shared_browser",
+    "close_shared_http_client",
     "extract_video_id",
     "fetch_rss",
+    "fetch_rss_many",
     "fetch_web",
+    "fetch_web_many",
     "fetch_youtube",
     "get_transcript",
     "parse_rss_feed",
@@ -3,15 +3,70 @@
 feedparser를 사용하여 RSS 피드에서 콘텐츠를 수집합니다.
 """
 
+import asyncio
+import re
 import uuid
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Any, Literal
+from urllib.parse import urljoin
+from xml.etree import ElementTree
 
 import feedparser
+import httpx
 
-from src.models.content import Content, ProcessingStatus, generate_content_key
+from src.models.content import (
+    Content,
+    ProcessingStatus,
+    generate_content_hash,
+    generate_content_key,
+)
+from src.models.source import Source
 from src.repositories.content_repo import ContentRepository
 
+FEED_TIMEOUT_SECONDS = 30
+"""피드 다운로드 타임아웃 (초)"""
+
+DEFAULT_FETCH_CONCURRENCY = 4
+"""fetch_rss_many 기본 동시 수집 수"""
+
+_FEED_USER_AGENT = "Mozilla/5.0 (compatible; AXContentBot/1.0)"
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+
+# 엔트리 단위 요소 태그 (RSS 2.0 / Atom / RSS 1.0(RDF))
+_ENTRY_TAGS = frozenset({"item", f"{_ATOM_NS}entry", f"{_RSS1_NS}item"})
+
+FeedType = Literal["rss", "atom", "rdf"]
+
+# 본문 해시 중복 검사를 적용할 최소 본문 길이 (짧은 요약은 상용구일 수 있음)
+_CONTENT_HASH_MIN_BODY_LENGTH = 200
+
+# 피드 형식 판별에 사용할 앞부분 크기 (XML 선언/주석 뒤의 루트 요소까지)
+_FEED_HEAD_BYTES = 512
+
+_FEED_ROOT_PATTERNS: tuple[tuple[re.Pattern[bytes], FeedType], ...] = (
+    (re.compile(rb"<rss[\s>]"), "rss"),
+    (re.compile(rb"<(?:\w+:)?feed[\s>]"), "atom"),
+    (re.compile(rb"<rdf:RDF[\s>]"), "rdf"),
+)
+
+
+@dataclass
+class FeedCacheHeaders:
+    """HTTP 조건부 요청용 피드 캐시 검증자 (ETag / Last-Modified).
+
+    parse_rss_feed에 전달하면 요청 헤더로 사용되고, 응답의 새 값으로 갱신됩니다.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+
 
 @dataclass
 class RSSEntry:
@@ -23,15 +78,287 @@ class RSSEntry:
     published_at: datetime | None
 
 
+def _parse_published_at(entry: Any) -> datetime | None:
+    """엔트리 발행일 파싱.
+
+    feedparser가 파싱한 published_parsed(UTC struct_time)가 있으면 문자열 파싱 없이
+    바로 변환하고, 없을 때만 published 문자열을 RFC 822 / ISO 8601로 파싱합니다.
+
+    Args:
+        entry: feedparser 엔트리.
+
+    Returns:
+        발행일 (UTC) 또는 None.
+    """
+    published_parsed = entry.get("published_parsed")
+    if published_parsed:
+        try:
+            return datetime(*published_parsed[:6], tzinfo=UTC)
+        except (TypeError, ValueError):
+            pass
+
+    published = entry.get("published")
+    if not published:
+        return None
+
+    try:
+        published_at = parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        try:
+            published_at = datetime.fromisoformat(published)
+        except ValueError:
+            return None
+
+    if published_at.tzinfo is None:
+        return published_at.replace(tzinfo=UTC)
+    return published_at.astimezone(UTC)
+
+
+def _fetch_feed(
+    feed_url: str,
+    cache_headers: FeedCacheHeaders | None = None,
+) -> httpx.Response:
+    """피드 원문 다운로드.
+
+    Args:
+        feed_url: RSS 피드 URL.
+        cache_headers: 조건부 요청 검증자 (If-None-Match / If-Modified-Since).
+
+    Returns:
+        HTTP 응답 (변경 없으면 304).
+
+    Raises:
+        httpx.HTTPError: 요청 실패 또는 4xx/5xx 응답.
+    """
+    headers = {"User-Agent": _FEED_USER_AGENT}
+    if cache_headers is not None:
+        if cache_headers.etag:
+            headers["If-None-Match"] = cache_headers.etag
+        if cache_headers.last_modified:
+            headers["If-Modified-Since"] = cache_headers.last_modified
+
+    with httpx.Client(
+        timeout=FEED_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        headers=headers,
+    ) as client:
+        response = client.get(feed_url)
+        # 304는 raise_for_status에서 에러로 취급되므로 먼저 반환
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return response
+        response.raise_for_status()
+        return response
+
+
+def _truncate_feed(raw: bytes, limit: int) -> bytes:
+    """피드 XML을 앞쪽 limit개 엔트리까지만 남기도록 자르기.
+
+    iterparse로 스트리밍 파싱하다 limit번째 엔트리가 닫히면 즉시 중단하고
+    이후 엔트리를 제거하여, feedparser가 나머지 엔트리의 정규화/HTML sanitize를
+    수행하지 않도록 합니다. 엄격한 XML 파싱에 실패하면(HTML 엔티티 등) 원문을
+    그대로 반환하여 관대한 feedparser에 맡깁니다.
+
+    Args:
+        raw: 피드 원문 바이트.
+        limit: 남길 최대 엔트리 수.
+
+    Returns:
+        잘린 피드 XML 또는 원문.
+    """
+    stack: list[ElementTree.Element] = []
+    count = 0
+
+    try:
+        for event, elem in ElementTree.iterparse(BytesIO(raw), events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            if elem.tag in _ENTRY_TAGS:
+                count += 1
+                if count >= limit:
+                    break
+        else:
+            # limit에 도달하기 전에 문서가 끝남 - 자를 필요 없음
+            return raw
+    except ElementTree.ParseError:
+        return raw
+
+    # iterparse는 청크 단위로 트리를 만들므로 이미 읽힌 뒤쪽 엔트리를 제거
+    parent = stack[-1]
+    for extra in [child for child in parent if child.tag in _ENTRY_TAGS][limit:]:
+        parent.remove(extra)
+
+    return ElementTree.tostring(stack[0], encoding="utf-8", xml_declaration=True)
+
+
+class _NativeParseError(Exception):
+    """네이티브 파서가 처리하지 않는 구조 (feedparser로 폴백)."""
+
+
+def _detect_feed_type(head: bytes) -> FeedType | None:
+    """피드 앞부분의 루트 요소로 형식 판별.
+
+    Args:
+        head: 피드 원문 앞부분.
+
+    Returns:
+        피드 형식 또는 None (판별 불가).
+    """
+    for pattern, feed_type in _FEED_ROOT_PATTERNS:
+        if pattern.search(head):
+            return feed_type
+    return None
+
+
+def _element_text(elem: ElementTree.Element | None) -> str:
+    """요소의 텍스트 (하위 요소 포함, 앞뒤 공백 제거)."""
+    if elem is None:
+        return ""
+    return "".join(elem.itertext()).strip()
+
+
+def _atom_text(elem: ElementTree.Element | None) -> str:
+    """Atom 텍스트 구조 요소의 텍스트.
+
+    Raises:
+        _NativeParseError: type="xhtml" (마크업 보존이 필요하여 feedparser로 처리).
+    """
+    if elem is not None and elem.get("type") == "xhtml":
+        raise _NativeParseError("xhtml text construct")
+    return _element_text(elem)
+
+
+def _make_entry(
+    title: str, link: str, body: str, published: str, base_url: str
+) -> RSSEntry | None:
+    """추출한 필드로 RSSEntry 생성 (제목/링크 없으면 None)."""
+    if not title or not link:
+        return None
+    return RSSEntry(
+        title=title,
+        url=urljoin(base_url, link),
+        body=body or None,
+        published_at=_parse_published_at({"published": published}),
+    )
+
+
+def _rss_entry(item: ElementTree.Element, ns: str, base_url: str) -> RSSEntry | None:
+    """RSS 2.0 / RSS 1.0 item 요소에서 엔트리 추출."""
+    link = _element_text(item.find(f"{ns}link"))
+    if not link:
+        # isPermaLink guid는 링크로 사용 (feedparser와 동일)
+        guid = item.find(f"{ns}guid")
+        if guid is not None and guid.get("isPermaLink", "true") != "false":
+            link = _element_text(guid)
+
+    return _make_entry(
+        title=_element_text(item.find(f"{ns}title")),
+        link=link,
+        body=_element_text(item.find(f"{_CONTENT_NS}encoded"))
+        or _element_text(item.find(f"{ns}description")),
+        published=_element_text(item.find(f"{ns}pubDate")),
+        base_url=base_url,
+    )
+
+
+def _atom_entry(entry: ElementTree.Element, base_url: str) -> RSSEntry | None:
+    """Atom entry 요소에서 엔트리 추출."""
+    link = ""
+    for link_elem in entry.iter(f"{_ATOM_NS}link"):
+        if link_elem.get("rel", "alternate") == "alternate" and link_elem.get("href"):
+            link = link_elem.get("href", "")
+            break
+
+    return _make_entry(
+        title=_atom_text(entry.find(f"{_ATOM_NS}title")),
+        link=link,
+        body=_atom_text(entry.find(f"{_ATOM_NS}content"))
+        or _atom_text(entry.find(f"{_ATOM_NS}summary")),
+        published=_element_text(entry.find(f"{_ATOM_NS}published")),
+        base_url=base_url,
+    )
+
+
+def _parse_feed_native(
+    raw: bytes, feed_type: FeedType, base_url: str, limit: int
+) -> list[RSSEntry] | None:
+    """형식별 최소 파서로 피드 파싱.
+
+    iterparse로 엔트리 요소만 읽고 limit개에서 중단하여, feedparser의 형식 탐색과
+    HTML sanitize를 거치지 않습니다. 엄격한 XML 파싱에 실패하거나 처리하지 않는
+    구조를 만나면 None을 반환하여 feedparser로 폴백하게 합니다.
+
+    Args:
+        raw: 피드 원문 바이트.
+        feed_type: _detect_feed_type 결과.
+        base_url: 상대 링크 해석 기준 URL.
+        limit: 최대 엔트리 수.
+
+    Returns:
+        파싱된 엔트리 목록 또는 None (폴백 필요).
+    """
+    extract: Callable[[ElementTree.Element], RSSEntry | None]
+    if feed_type == "atom":
+        entry_tag = f"{_ATOM_NS}entry"
+
+        def extract(elem: ElementTree.Element) -> RSSEntry | None:
+            return _atom_entry(elem, base_url)
+
+    else:
+        ns = "" if feed_type == "rss" else _RSS1_NS
+        entry_tag = f"{ns}item"
+
+        def extract(elem: ElementTree.Element) -> RSSEntry | None:
+            return _rss_entry(elem, ns, base_url)
+
+    entries: list[RSSEntry] = []
+    count = 0
+
+    try:
+        for _, elem in ElementTree.iterparse(BytesIO(raw)):
+            if elem.tag != entry_tag:
+                continue
+            count += 1
+            entry = extract(elem)
+            if entry is not None:
+                entries.append(entry)
+            elem.clear()
+            if count >= limit:
+                break
+    except (ElementTree.ParseError, _NativeParseError):
+        return None
+
+    # 엔트리를 하나도 찾지 못하면 판별이 모호했던 것으로 보고 폴백
+    return entries if count else None
+
+
+def _feed_response_headers(response: httpx.Response) -> dict[str, str]:
+    """feedparser에 전달할 응답 헤더 (상대 URL 해석/인코딩 판별용)."""
+    headers = {"content-location": str(response.url)}
+    content_type = response.headers.get("content-type")
+    if content_type:
+        headers["content-type"] = content_type
+    return headers
+
+
 def parse_rss_feed(
     feed_url: str,
     limit: int = 20,
+    cache_headers: FeedCacheHeaders | None = None,
 ) -> list[RSSEntry]:
     """RSS 피드 파싱.
 
+    피드를 직접 내려받아 루트 요소로 RSS/Atom/RDF를 판별한 뒤 형식별 최소
+    파서로 앞쪽 limit개 엔트리만 읽습니다. 판별할 수 없거나 엄격한 XML 파싱에
+    실패하면 feedparser로 폴백합니다.
+    cache_headers가 주어지면 조건부 요청을 보내고, 서버가 304를 반환하면
+    다운로드/파싱 없이 빈 목록을 반환합니다.
+
     Args:
         feed_url: RSS 피드 URL.
         limit: 최대 엔트리 수.
+        cache_headers: 이전 응답의 ETag/Last-Modified (응답 값으로 갱신됨).
 
     Returns:
         파싱된 엔트리 목록.
@@ -39,7 +366,30 @@ def parse_rss_feed(
     Raises:
         ValueError: 피드 파싱 실패.
     """
-    feed = feedparser.parse(feed_url)
+    try:
+        response = _fetch_feed(feed_url, cache_headers)
+    except httpx.HTTPError as e:
+        raise ValueError(f"Failed to parse RSS feed: {e}") from e
+
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        return []
+
+    if cache_headers is not None:
+        cache_headers.etag = response.headers.get("etag")
+        cache_headers.last_modified = response.headers.get("last-modified")
+
+    raw = response.content
+    feed_type = _detect_feed_type(raw[:_FEED_HEAD_BYTES])
+    if feed_type is not None:
+        native_entries = _parse_feed_native(raw, feed_type, str(response.url), limit)
+        if native_entries is not None:
+            return native_entries
+
+    # 형식 판별/엄격 파싱 실패 시 feedparser로 폴백
+    feed = feedparser.parse(
+        _truncate_feed(raw, limit),
+        response_headers=_feed_response_headers(response),
+    )
 
     # 피드 파싱 에러 체크
     if feed.bozo and not feed.entries:
@@ -67,22 +417,7 @@ def parse_rss_feed(
         if not body:
             body = entry.get("summary") or entry.get("description")
 
-        # 발행일 파싱
-        published_at = None
-        published_parsed = entry.get("published_parsed")
-        if published_parsed:
-            try:
-                published_at = datetime(
-                    year=published_parsed[0],
-                    month=published_parsed[1],
-                    day=published_parsed[2],
-                    hour=published_parsed[3],
-                    minute=published_parsed[4],
-                    second=published_parsed[5],
-                    tzinfo=UTC,
-                )
-            except (TypeError, ValueError, IndexError):
-                pass
+        published_at = _parse_published_at(entry)
 
         entries.append(
             RSSEntry(
@@ -96,21 +431,43 @@ def parse_rss_feed(
     return entries
 
 
+def _entry_content_hash(entry: RSSEntry) -> str | None:
+    """재게시 판정용 엔트리 해시 (제목 + 본문).
+
+    피드 요약이 상용구인 경우 서로 다른 글이 같은 본문을 가질 수 있으므로
+    제목을 함께 해시하고, 짧은 본문은 해시하지 않습니다 (DB 조회도 생략).
+
+    Args:
+        entry: RSS 엔트리.
+
+    Returns:
+        content_hash 또는 None (본문이 짧거나 없는 경우).
+    """
+    if not entry.body or len(entry.body.strip()) < _CONTENT_HASH_MIN_BODY_LENGTH:
+        return None
+    return generate_content_hash(f"{entry.title}\n{entry.body}")
+
+
 def fetch_rss(
     source_id: str,
     source_url: str,
     content_repo: ContentRepository,
     limit: int = 20,
+    cache_headers: FeedCacheHeaders | None = None,
 ) -> list[Content]:
     """RSS 피드에서 새 콘텐츠 수집.
 
-    중복 콘텐츠(content_key 기준)는 건너뜁니다.
+    중복 콘텐츠(content_key 기준)는 건너뜁니다. 엔트리마다 content_key로
+    조회하므로 실행당 DB 조회는 피드 엔트리 수(limit)로 제한됩니다.
+    URL이 달라도 제목과 본문이 같은 엔트리(content_hash 기준)는 재게시로 보고
+    건너뜁니다.
 
     Args:
         source_id: 소스 ID.
         source_url: RSS 피드 URL.
         content_repo: ContentRepository 인스턴스.
         limit: 최대 수집 수.
+        cache_headers: 조건부 요청 검증자 (parse_rss_feed 참고).
 
     Returns:
         새로 수집된 Content 목록.
@@ -118,16 +475,31 @@ def fetch_rss(
     Raises:
         ValueError: 피드 파싱 실패.
     """
-    entries = parse_rss_feed(source_url, limit=limit)
+    entries = parse_rss_feed(source_url, limit=limit, cache_headers=cache_headers)
+    if not entries:
+        return []
+
     new_contents: list[Content] = []
     now = datetime.now(UTC)
 
+    # 이번 실행에서 수집한 키/해시 (저장은 마지막에 한 번에 하므로 별도 추적)
+    seen_keys: set[str] = set()
+    seen_hashes: set[str] = set()
+
     for entry in entries:
         # content_key 생성 (URL 정규화 포함)
         content_key = generate_content_key(source_id, entry.url)
 
         # 중복 체크
-        if content_repo.exists_by_content_key(content_key):
+        if content_key in seen_keys or content_repo.exists_by_content_key(content_key):
+            continue
+
+        # 제목+본문 기준 중복 체크 (같은 글이 다른 URL로 재게시된 경우)
+        content_hash = _entry_content_hash(entry)
+        if content_hash and (
+            content_hash in seen_hashes
+            or content_repo.exists_by_content_hash(source_id, content_hash)
+        ):
             continue
 
         # 새 Content 생성
@@ -135,6 +507,7 @@ def fetch_rss(
             id=f"cnt_{uuid.uuid4().hex[:12]}",
             source_id=source_id,
             content_key=content_key,
+            content_hash=content_hash,
             original_url=entry.url,
             original_title=entry.title,
             original_body=entry.body,
@@ -144,8 +517,58 @@ def fetch_rss(
             collected_at=now,
         )
 
-        # Firestore에 저장
-        content_repo.create(content)
+        seen_keys.add(content_key)
+        if content_hash:
+            seen_hashes.add(content_hash)
         new_contents.append(content)
 
+    # 새 콘텐츠를 batch write 한 번으로 Firestore에 저장
+    if new_contents:
+        content_repo.create_many(new_contents)
+
     return new_contents
+
+
+async def fetch_rss_many(
+    sources: Sequence[Source],
+    content_repo: ContentRepository,
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    limit: int = 20,
+    cache_headers: Mapping[str, FeedCacheHeaders] | None = None,
+) -> list[list[Content] | BaseException]:
+    """여러 RSS 소스를 동시에 수집.
+
+    동기 함수인 fetch_rss를 스레드에서 실행하고 세마포어로 동시 수집 수를
+    제한하여, 소스별 네트워크 대기를 겹치게 합니다.
+
+    Args:
+        sources: 수집할 RSS 소스 목록.
+        content_repo: ContentRepository 인스턴스.
+        concurrency: 최대 동시 수집 수.
+        limit: 소스별 최대 수집 수.
+        cache_headers: 소스 ID별 조건부 요청 검증자 (응답의 새 값으로 갱신됨).
+            없는 소스는 저장된 etag/last_modified로 조건부 요청합니다.
+
+    Returns:
+        소스 순서대로 수집된 Content 목록 또는 발생한 예외.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    cache_headers = cache_headers or {}
+
+    async def _fetch(source: Source) -> list[Content]:
+        headers = cache_headers.get(source.id) or FeedCacheHeaders(
+            etag=source.etag, last_modified=source.last_modified
+        )
+        async with semaphore:
+            return await asyncio.to_thread(
+                fetch_rss,
+                source_id=source.id,
+                source_url=str(source.url),
+                content_repo=content_repo,
+                limit=limit,
+                cache_headers=headers,
+            )
+
+    return await asyncio.gather(
+        *(_fetch(source) for source in sources), return_exceptions=True
+    )
@@ -6,22 +6,33 @@ RSS가 없는 웹사이트에서 콘텐츠를 수집하는 도구입니다.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import re
+import weakref
+from collections.abc import Callable, Coroutine, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin, urlparse
 
 import httpx
+import lxml.html
 import structlog
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from lxml.cssselect import CSSSelector
+from playwright.async_api import Browser, Playwright, async_playwright
 
 from src.config.settings import get_settings
-from src.models.content import Content, ProcessingStatus
+from src.models.content import (
+    Content,
+    ProcessingStatus,
+    generate_simhash,
+    simhash_distance,
+)
 
 if TYPE_CHECKING:
+    from src.models.source import Source
     from src.repositories.content_repo import ContentRepository
 
 logger = structlog.get_logger(__name__)
@@ -91,16 +102,32 @@ class WebScraperConfig:
 
     @classmethod
     def from_source_config(cls, config: dict) -> WebScraperConfig:
-        """Source.config에서 생성."""
-        return cls(
-            selector=config.get("selector"),
-            wait_for=config.get("wait_for"),
-            url_pattern=config.get("url_pattern"),
-            timeout_seconds=config.get("timeout_seconds", 30),
-            post_link_pattern=config.get("post_link_pattern"),
-            max_posts=config.get("max_posts", 10),
-            use_playwright_for_listing=config.get("use_playwright_for_listing", False),
+        """Source.config에서 생성.
+
+        frozen dataclass이므로 같은 설정 값에는 캐시된 인스턴스를 재사용합니다.
+        """
+        fields = (
+            config.get("selector"),
+            config.get("wait_for"),
+            config.get("url_pattern"),
+            config.get("timeout_seconds", 30),
+            config.get("post_link_pattern"),
+            config.get("max_posts", 10),
+            config.get("use_playwright_for_listing", False),
         )
+        try:
+            return _cached_scraper_config(cls, fields)
+        except TypeError:
+            # 해시 불가능한 값(잘못된 설정)은 캐시 없이 생성
+            return cls(*fields)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_scraper_config(
+    cls: type[WebScraperConfig], fields: tuple[object, ...]
+) -> WebScraperConfig:
+    """설정 값 튜플별 WebScraperConfig 캐시."""
+    return cls(*fields)  # type: ignore[arg-type]
 
 
 # ============================================================================
@@ -108,7 +135,7 @@ class WebScraperConfig:
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScrapedContent:
     """스크래핑된 콘텐츠 결과."""
 
@@ -136,26 +163,283 @@ class ScrapedContent:
 # Cloud Run 최적화 브라우저 인자
 # ============================================================================
 
+# 공유 브라우저에서 여러 context를 동시에 열므로 --single-process는 쓰지 않음
+# (단일 프로세스 모드는 렌더러 하나가 죽으면 브라우저 전체가 종료됨)
 BROWSER_ARGS = [
     "--no-sandbox",
     "--disable-setuid-sandbox",
     "--disable-dev-shm-usage",
     "--disable-gpu",
-    "--single-process",
     "--js-flags=--max-old-space-size=512",
 ]
 
 
+async def _close_on_loop(
+    loop: asyncio.AbstractEventLoop,
+    close: Callable[[], Coroutine[Any, Any, None]],
+) -> None:
+    """다른 이벤트 루프에 묶인 자원을 그 루프에서 종료.
+
+    루프가 다른 스레드에서 실행 중이면 그 루프에 종료 작업을 예약하고, 멈춰 있으면
+    작업 스레드에서 루프를 돌려 종료합니다.
+
+    Args:
+        loop: 자원을 만든 이벤트 루프
+        close: 자원을 종료하는 코루틴 함수
+
+    Raises:
+        RuntimeError: 루프가 이미 닫혀 자원을 종료할 수 없는 경우
+    """
+    if loop.is_closed():
+        raise RuntimeError("Cannot close a resource bound to a closed event loop")
+    if loop.is_running():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(close(), loop))
+    else:
+        await asyncio.to_thread(loop.run_until_complete, close())
+
+
+class _BrowserPool:
+    """프로세스 공유 Chromium 브라우저.
+
+    브라우저 실행(수백 ms)을 한 번만 하고, 호출마다 새 context/page만 만듭니다.
+    Playwright 연결은 이벤트 루프에 묶이므로 다른 루프에서 호출되면 기존 브라우저를
+    원래 루프에서 종료한 뒤 새로 띄웁니다.
+    """
+
+    _playwright: Playwright | None = None
+    _browser: Browser | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    async def get(cls) -> Browser:
+        """공유 브라우저 반환 (없거나 연결이 끊겼으면 실행).
+
+        Returns:
+            실행 중인 Chromium 브라우저
+
+        Raises:
+            RuntimeError: 이전 브라우저의 이벤트 루프가 닫혀 종료할 수 없는 경우
+                (브라우저 프로세스가 남으므로 루프를 닫기 전에 close_shared_browser 필요)
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            old_loop, playwright, browser = cls._loop, cls._playwright, cls._browser
+            cls._playwright = None
+            cls._browser = None
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+
+            if old_loop is not None and (playwright is not None or browser is not None):
+                logger.warning("shared_browser_loop_changed")
+                await _close_on_loop(
+                    old_loop, functools.partial(cls._shutdown, playwright, browser)
+                )
+
+        assert cls._lock is not None
+        async with cls._lock:
+            if cls._browser is None or not cls._browser.is_connected():
+                if cls._playwright is None:
+                    cls._playwright = await async_playwright().start()
+                cls._browser = await cls._playwright.chromium.launch(
+                    headless=True,
+                    args=BROWSER_ARGS,
+                )
+                logger.info("shared_browser_launched")
+
+        return cls._browser
+
+    @classmethod
+    async def close(cls) -> None:
+        """공유 브라우저 종료 (다른 루프에서 띄웠으면 그 루프에서 종료)."""
+        old_loop, playwright, browser = cls._loop, cls._playwright, cls._browser
+        cls._playwright = None
+        cls._browser = None
+        cls._loop = None
+        cls._lock = None
+
+        if old_loop is None:
+            return
+        if old_loop is asyncio.get_running_loop():
+            await cls._shutdown(playwright, browser)
+            return
+        try:
+            await _close_on_loop(
+                old_loop, functools.partial(cls._shutdown, playwright, browser)
+            )
+        except RuntimeError as e:
+            logger.error("shared_browser_close_failed", error=str(e))
+
+    @staticmethod
+    async def _shutdown(playwright: Playwright | None, browser: Browser | None) -> None:
+        """브라우저와 Playwright 드라이버 종료."""
+        if browser is not None:
+            await browser.close()
+        if playwright is not None:
+            await playwright.stop()
+
+
+async def close_shared_browser() -> None:
+    """공유 Playwright 브라우저 종료 (애플리케이션 shutdown 시 호출)."""
+    await _BrowserPool.close()
+
+
+# 스트리밍 다운로드 청크 크기
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# 공유 HTTP 클라이언트 연결 풀 설정
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=30
+)
+_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+_HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; AXContentBot/1.0)"}
+
+
+class _HttpClientPool:
+    """프로세스 공유 httpx.AsyncClient.
+
+    keep-alive 연결을 재사용하여 같은 호스트로의 연속 요청에서 TCP/TLS 핸드셰이크를
+    생략합니다. 연결 풀은 이벤트 루프에 묶이므로 다른 루프에서 호출되면 기존
+    클라이언트를 원래 루프에서 닫고 새로 만듭니다.
+    """
+
+    _client: httpx.AsyncClient | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    async def get(cls) -> httpx.AsyncClient:
+        """공유 클라이언트 반환 (없거나 닫혔으면 생성).
+
+        Returns:
+            연결 풀을 공유하는 AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop or cls._client is None or cls._client.is_closed:
+            old_loop, old_client = cls._loop, cls._client
+            cls._client = httpx.AsyncClient(
+                headers=_HTTP_HEADERS,
+                limits=_HTTP_LIMITS,
+                timeout=_HTTP_TIMEOUT,
+                follow_redirects=True,
+            )
+            cls._loop = loop
+
+            if (
+                old_loop is not None
+                and old_loop is not loop
+                and old_client is not None
+                and not old_client.is_closed
+            ):
+                await cls._close_client(old_loop, old_client)
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """공유 클라이언트 종료 (다른 루프에서 만들었으면 그 루프에서 종료)."""
+        old_loop, old_client = cls._loop, cls._client
+        cls._client = None
+        cls._loop = None
+
+        if old_loop is None or old_client is None:
+            return
+        if old_loop is asyncio.get_running_loop():
+            await old_client.aclose()
+        else:
+            await cls._close_client(old_loop, old_client)
+
+    @staticmethod
+    async def _close_client(
+        loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> None:
+        """다른 루프에 묶인 클라이언트의 연결을 그 루프에서 닫음."""
+        try:
+            await _close_on_loop(loop, client.aclose)
+        except RuntimeError as e:
+            logger.error("shared_http_client_close_failed", error=str(e))
+
+
+async def close_shared_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 shutdown 시 호출)."""
+    await _HttpClientPool.close()
+
+
+# 이벤트 루프별 동시 페이지 요청 제한 (asyncio.Semaphore는 루프에 묶임)
+_FETCH_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _fetch_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 페이지 요청 세마포어 반환.
+
+    정적 HTTP 요청과 Playwright 페이지 로드가 함께 SCRAPING_MAX_CONCURRENT_FETCHES를
+    넘지 않도록 제한하여, 여러 소스를 동시에 수집할 때 연결 폭주를 막습니다.
+
+    Returns:
+        동시 요청 수를 제한하는 세마포어
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _FETCH_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().SCRAPING_MAX_CONCURRENT_FETCHES)
+        _FETCH_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+async def _fetch_html(url: str, timeout: float) -> str:
+    """정적 HTML 다운로드 (최대 크기 제한).
+
+    응답을 스트리밍으로 읽다가 SCRAPING_MAX_RESPONSE_BYTES에 도달하면 중단하여,
+    비정상적으로 큰 페이지가 메모리를 점유하지 않도록 합니다.
+
+    Args:
+        url: 다운로드할 URL
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        디코딩된 HTML (제한 초과 시 앞부분만)
+
+    Raises:
+        httpx.HTTPError: 요청 실패 또는 4xx/5xx 응답
+    """
+    max_bytes = get_settings().SCRAPING_MAX_RESPONSE_BYTES
+    chunks: list[bytes] = []
+    total = 0
+
+    client = await _HttpClientPool.get()
+    async with (
+        _fetch_semaphore(),
+        client.stream("GET", url, timeout=timeout) as response,
+    ):
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(_STREAM_CHUNK_BYTES):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= max_bytes:
+                logger.warning("response_truncated", url=url, max_bytes=max_bytes)
+                break
+        encoding = response.encoding or "utf-8"
+
+    return b"".join(chunks)[:max_bytes].decode(encoding, errors="replace")
+
+
 # ============================================================================
 # T020: Stage 1 - Static HTML 추출
 # ============================================================================
 
 
+# 이 크기 이상의 HTML은 워커 스레드에서 파싱 (lxml은 파싱 중 GIL을 해제)
+_THREAD_PARSE_MIN_CHARS = 64 * 1024
+
+
 async def _extract_stage1_static(
     url: str,
     config: WebScraperConfig,
 ) -> ScrapedContent | None:
-    """Stage 1: Static HTML 추출 (httpx + BeautifulSoup).
+    """Stage 1: Static HTML 추출 (httpx + lxml).
+
+    큰 문서는 파싱/추출을 워커 스레드로 넘겨 동시 수집 중인 다른 요청이
+    이벤트 루프에서 막히지 않도록 합니다.
 
     Args:
         url: 수집할 URL
@@ -167,62 +451,83 @@ async def _extract_stage1_static(
     settings = get_settings()
 
     try:
-        async with httpx.AsyncClient(timeout=config.timeout_seconds) as client:
-            response = await client.get(
+        html = await _fetch_html(url, timeout=config.timeout_seconds)
+
+        if len(html) >= _THREAD_PARSE_MIN_CHARS:
+            return await asyncio.to_thread(
+                _extract_static_content,
                 url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; AXContentBot/1.0)",
-                },
-                follow_redirects=True,
+                html,
+                config,
+                settings.SCRAPING_MIN_CONTENT_LENGTH,
             )
-            response.raise_for_status()
-            html = response.text
+        return _extract_static_content(
+            url, html, config, settings.SCRAPING_MIN_CONTENT_LENGTH
+        )
 
-        soup = BeautifulSoup(html, "lxml")
+    except httpx.HTTPStatusError as e:
+        logger.warning("http_error", url=url, status=e.response.status_code)
+        return None
+    except Exception as e:
+        logger.warning("stage1_extraction_failed", url=url, error=str(e))
+        return None
 
-        # selector가 있으면 해당 요소에서 추출
-        if config.selector:
-            element = soup.select_one(config.selector)
-            if not element:
-                logger.debug("selector_not_found", selector=config.selector, url=url)
-                return None
-            title = _extract_title(element) or _extract_title(soup)
-            body = element.get_text(separator=" ", strip=True)
-        else:
-            # 기본 추출
-            title = _extract_title(soup)
-            body = _extract_body_text(soup)
 
-        if not title:
-            title = soup.title.string if soup.title else ""
+def _extract_static_content(
+    url: str,
+    html: str,
+    config: WebScraperConfig,
+    min_content_length: int,
+) -> ScrapedContent | None:
+    """정적 HTML에서 콘텐츠 추출 (동기, CPU 작업만 수행).
 
-        # 콘텐츠 길이 검증
-        if len(body) < settings.SCRAPING_MIN_CONTENT_LENGTH:
-            logger.debug(
-                "content_too_short",
-                url=url,
-                length=len(body),
-                min_length=settings.SCRAPING_MIN_CONTENT_LENGTH,
-            )
-            return None
+    Args:
+        url: 원본 URL
+        html: 페이지 HTML
+        config: 스크래핑 설정
+        min_content_length: 최소 본문 길이
 
-        published_at = _extract_published_date(soup)
+    Returns:
+        ScrapedContent 또는 None (selector 미매칭/본문 부족)
+    """
+    doc = _parse_html(html)
 
-        return ScrapedContent(
+    # selector가 있으면 해당 요소에서 추출
+    if config.selector:
+        element = _select_one(doc, config.selector)
+        if element is None:
+            logger.debug("selector_not_found", selector=config.selector, url=url)
+            return None
+        title = _extract_title(element) or _extract_title(doc)
+        body = _get_text(element)
+    else:
+        # 기본 추출
+        title = _extract_title(doc)
+        body = _extract_body_text(doc)
+
+    if not title:
+        title = _document_title(doc)
+
+    # 콘텐츠 길이 검증
+    if len(body) < min_content_length:
+        logger.debug(
+            "content_too_short",
             url=url,
-            title=title.strip() if title else "",
-            body=body,
-            published_at=published_at,
-            extraction_stage=1,
+            length=len(body),
+            min_length=min_content_length,
         )
-
-    except httpx.HTTPStatusError as e:
-        logger.warning("http_error", url=url, status=e.response.status_code)
-        return None
-    except Exception as e:
-        logger.warning("stage1_extraction_failed", url=url, error=str(e))
         return None
 
+    published_at = _extract_published_date(doc)
+
+    return ScrapedContent(
+        url=url,
+        title=title.strip() if title else "",
+        body=body,
+        published_at=published_at,
+        extraction_stage=1,
+    )
+
 
 # ============================================================================
 # T021: Stage 2 - Dynamic JS 추출
@@ -245,17 +550,15 @@ async def _extract_stage2_dynamic(
     settings = get_settings()
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=BROWSER_ARGS,
-            )
+        browser = await _BrowserPool.get()
+
+        async with _fetch_semaphore():
             context = await browser.new_context(
                 user_agent="Mozilla/5.0 (compatible; AXContentBot/1.0)",
             )
-            page = await context.new_page()
 
             try:
+                page = await context.new_page()
                 await page.goto(url, timeout=config.timeout_seconds * 1000)
 
                 # wait_for selector가 있으면 대기
@@ -267,24 +570,24 @@ async def _extract_stage2_dynamic(
 
                 html = await page.content()
             finally:
-                await browser.close()
+                await context.close()
 
-        soup = BeautifulSoup(html, "lxml")
+        doc = _parse_html(html)
 
         # selector가 있으면 해당 요소에서 추출
         if config.selector:
-            element = soup.select_one(config.selector)
-            if not element:
+            element = _select_one(doc, config.selector)
+            if element is None:
                 logger.debug("selector_not_found", selector=config.selector, url=url)
                 return None
-            title = _extract_title(element) or _extract_title(soup)
-            body = element.get_text(separator=" ", strip=True)
+            title = _extract_title(element) or _extract_title(doc)
+            body = _get_text(element)
         else:
-            title = _extract_title(soup)
-            body = _extract_body_text(soup)
+            title = _extract_title(doc)
+            body = _extract_body_text(doc)
 
         if not title:
-            title = soup.title.string if soup.title else ""
+            title = _document_title(doc)
 
         # 콘텐츠 길이 검증
         if len(body) < settings.SCRAPING_MIN_CONTENT_LENGTH:
@@ -294,7 +597,7 @@ async def _extract_stage2_dynamic(
             url=url,
             title=title.strip() if title else "",
             body=body,
-            published_at=_extract_published_date(soup),
+            published_at=_extract_published_date(doc),
             extraction_stage=2,
         )
 
@@ -322,34 +625,27 @@ async def _extract_stage3_structural(url: str) -> ScrapedContent | None:
     settings = get_settings()
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; AXContentBot/1.0)"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            html = response.text
+        html = await _fetch_html(url, timeout=30)
 
-        soup = BeautifulSoup(html, "lxml")
+        doc = _parse_html(html)
 
         # 시맨틱 태그 우선순위
         content_elements = ["main", "article", "[role='main']", ".content", "#content"]
 
         for selector in content_elements:
-            element = soup.select_one(selector)
-            if element:
-                body = element.get_text(separator=" ", strip=True)
+            element = _select_one(doc, selector)
+            if element is not None:
+                body = _get_text(element)
                 if len(body) >= settings.SCRAPING_MIN_CONTENT_LENGTH:
-                    title = _extract_title(element) or _extract_title(soup)
+                    title = _extract_title(element) or _extract_title(doc)
                     if not title:
-                        title = soup.title.string if soup.title else ""
+                        title = _document_title(doc)
 
                     return ScrapedContent(
                         url=url,
                         title=title.strip() if title else "",
                         body=body,
-                        published_at=_extract_published_date(soup),
+                        published_at=_extract_published_date(doc),
                         extraction_stage=3,
                     )
 
@@ -384,25 +680,17 @@ async def _extract_stage4_url_pattern(
         return []
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; AXContentBot/1.0)"},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            html = response.text
+        html = await _fetch_html(url, timeout=30)
 
-        soup = BeautifulSoup(html, "lxml")
-        pattern = re.compile(config.url_pattern)
+        match = _compile_pattern(config.url_pattern).search
 
+        # 내비게이션 등 반복 링크는 한 번만 urljoin/패턴 매칭
         matched_urls: list[str] = []
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for href in dict.fromkeys(_iter_hrefs(_parse_html(html))):
             # 상대 경로를 절대 경로로 변환
             full_url = urljoin(url, href)
 
-            if pattern.search(full_url):
+            if match(full_url):
                 matched_urls.append(full_url)
 
         # 중복 제거
@@ -434,56 +722,46 @@ async def _extract_post_links(
     if not config.post_link_pattern:
         return []
 
-    pattern = re.compile(config.post_link_pattern)
+    match = _compile_pattern(config.post_link_pattern).search
     matched_urls: list[str] = []
 
     try:
         if config.use_playwright_for_listing:
             # Playwright로 JavaScript 렌더링 후 링크 추출
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=BROWSER_ARGS,
-                )
-                page = await browser.new_page()
-                await page.goto(
-                    listing_url,
-                    wait_until="domcontentloaded",
-                    timeout=config.timeout_seconds * 1000,
-                )
-                # 추가 렌더링 대기
-                await page.wait_for_timeout(2000)
-
-                # 모든 링크 추출
-                links = await page.evaluate(
-                    """() => {
-                    return Array.from(document.querySelectorAll('a[href]'))
-                        .map(a => a.getAttribute('href'));
-                }"""
-                )
-                await browser.close()
+            browser = await _BrowserPool.get()
+
+            async with _fetch_semaphore():
+                context = await browser.new_context()
+                try:
+                    page = await context.new_page()
+                    await page.goto(
+                        listing_url,
+                        wait_until="domcontentloaded",
+                        timeout=config.timeout_seconds * 1000,
+                    )
+                    # 추가 렌더링 대기
+                    await page.wait_for_timeout(2000)
+
+                    # 모든 링크 추출
+                    links = await page.evaluate(
+                        """() => {
+                        return Array.from(document.querySelectorAll('a[href]'))
+                            .map(a => a.getAttribute('href'));
+                    }"""
+                    )
+                finally:
+                    await context.close()
 
-                for href in links:
-                    if href and pattern.search(href):
-                        full_url = urljoin(listing_url, href)
-                        matched_urls.append(full_url)
+            for href in dict.fromkeys(links):
+                if href and match(href):
+                    full_url = urljoin(listing_url, href)
+                    matched_urls.append(full_url)
         else:
             # Static HTML에서 링크 추출
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    listing_url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; AXContentBot/1.0)"
-                    },
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
-                html = response.text
+            html = await _fetch_html(listing_url, timeout=30)
 
-            soup = BeautifulSoup(html, "lxml")
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-                if pattern.search(href):
+            for href in dict.fromkeys(_iter_hrefs(_parse_html(html))):
+                if match(href):
                     full_url = urljoin(listing_url, href)
                     matched_urls.append(full_url)
 
@@ -544,6 +822,7 @@ async def _fetch_listing_page(
 
     # 2. 각 포스트 URL에서 콘텐츠 수집
     collected_contents: list[Content] = []
+    simhashes = _recent_simhashes(content_repo, source_id)
 
     for post_url in post_urls:
         try:
@@ -560,6 +839,7 @@ async def _fetch_listing_page(
                     source_id=source_id,
                     scraped=scraped,
                     content_repo=content_repo,
+                    simhashes=simhashes,
                 )
                 if content:
                     collected_contents.append(content)
@@ -637,18 +917,9 @@ async def fetch_web(
                 config=config,
             )
 
-        # Stage 1: Static HTML
-        scraped = await _extract_stage1_static(source_url, config)
-
-        # Stage 2: Dynamic JS (Stage 1 실패 시)
-        if scraped is None:
-            logger.debug("fallback_to_stage2", url=source_url)
-            scraped = await _extract_stage2_dynamic(source_url, config)
-
-        # Stage 3: Structural (Stage 2 실패 시)
-        if scraped is None:
-            logger.debug("fallback_to_stage3", url=source_url)
-            scraped = await _extract_stage3_structural(source_url)
+        # Stage 1~3: 도메인에서 마지막으로 성공한 스테이지부터 시도
+        scraped = await _extract_single_page(source_url, config)
+        simhashes = _recent_simhashes(content_repo, source_id)
 
         # Stage 4: URL Pattern (Stage 3 실패 시)
         if scraped is None and config.url_pattern:
@@ -666,6 +937,7 @@ async def fetch_web(
                         source_id=source_id,
                         scraped=url_scraped,
                         content_repo=content_repo,
+                        simhashes=simhashes,
                     )
                     if content:
                         collected_contents.append(content)
@@ -679,6 +951,7 @@ async def fetch_web(
                 source_id=source_id,
                 scraped=scraped,
                 content_repo=content_repo,
+                simhashes=simhashes,
             )
             if content:
                 collected_contents.append(content)
@@ -709,29 +982,177 @@ async def fetch_web(
         raise ScrapingError(str(e), url=source_url) from e
 
 
+async def fetch_web_many(
+    sources: Sequence[Source],
+    content_repo: ContentRepository,
+) -> list[list[Content] | BaseException]:
+    """여러 WEB 소스를 동시에 수집.
+
+    소스별 fetch_web을 함께 실행하고, 실제 페이지 요청 수는 공유 세마포어
+    (SCRAPING_MAX_CONCURRENT_FETCHES)로 제한합니다.
+
+    Args:
+        sources: 수집할 WEB 소스 목록
+        content_repo: 콘텐츠 저장소 인스턴스
+
+    Returns:
+        소스 순서대로 수집된 Content 목록 또는 발생한 예외
+    """
+    return await asyncio.gather(
+        *(
+            fetch_web(
+                source_id=source.id,
+                source_url=str(source.url),
+                content_repo=content_repo,
+                config=WebScraperConfig.from_source_config(source.config),
+            )
+            for source in sources
+        ),
+        return_exceptions=True,
+    )
+
+
 # ============================================================================
 # Helper functions
 # ============================================================================
 
 
+# 도메인별 마지막 성공 스테이지 (프로세스 메모리, Stage 1~2)
+_STAGE_HINTS: dict[str, int] = {}
+
+_SINGLE_PAGE_STAGES = (1, 2, 3)
+
+# 힌트로 기록하는 스테이지: Stage 3은 config.selector를 무시하므로 제외
+_HINTED_STAGES = (1, 2)
+
+
+async def _extract_single_page(
+    url: str, config: WebScraperConfig
+) -> ScrapedContent | None:
+    """단일 페이지 추출 (Stage 1 → 2 → 3 폴백).
+
+    같은 도메인에서 마지막으로 성공한 스테이지부터 시도하여, JS 렌더링이 필요한
+    사이트에서 매번 실패할 Stage 1 요청을 생략합니다. 실패하면 나머지 스테이지를
+    원래 순서대로 시도합니다. 힌트는 Stage 1/2 사이의 선택에만 쓰이며, Stage 3은
+    항상 selector를 사용하는 스테이지 다음에 시도됩니다.
+
+    Args:
+        url: 수집할 URL
+        config: 스크래핑 설정
+
+    Returns:
+        ScrapedContent 또는 None (모든 스테이지 실패 시)
+    """
+    host = urlparse(url).netloc.lower()
+    start = _STAGE_HINTS.get(host, 1)
+    if start not in _HINTED_STAGES:
+        start = 1
+    order = [start, *(stage for stage in _SINGLE_PAGE_STAGES if stage != start)]
+
+    for stage in order:
+        if stage != order[0]:
+            logger.debug("stage_fallback", url=url, stage=stage)
+
+        if stage == 1:
+            scraped = await _extract_stage1_static(url, config)
+        elif stage == 2:
+            scraped = await _extract_stage2_dynamic(url, config)
+        else:
+            scraped = await _extract_stage3_structural(url)
+
+        if scraped is not None:
+            if stage in _HINTED_STAGES:
+                _STAGE_HINTS[host] = stage
+            else:
+                # Stage 1/2가 모두 실패했으므로 기존 힌트는 더 이상 유효하지 않음
+                _STAGE_HINTS.pop(host, None)
+            return scraped
+
+    return None
+
+
+class _RecentSimHashes:
+    """근사 중복 판정용 소스의 최근 SimHash 지문.
+
+    URL(content_key) 기준 중복이면 비교할 필요가 없으므로 첫 content_key 미스 때
+    SCRAPING_NEAR_DUPLICATE_WINDOW건만 한 번 조회하고, 같은 실행에서 저장한 지문은
+    이어서 추가합니다. 조회가 실패하면(복합 인덱스 누락 등) 수집을 막지 않고
+    이번 실행에서 저장한 지문끼리만 비교합니다.
+    """
+
+    def __init__(self, content_repo: ContentRepository, source_id: str) -> None:
+        self._content_repo = content_repo
+        self._source_id = source_id
+        self._hashes: list[int] | None = None
+
+    def _load(self) -> list[int]:
+        """최근 지문 목록 (최초 호출 시 조회)."""
+        if self._hashes is None:
+            try:
+                self._hashes = self._content_repo.load_simhashes(
+                    self._source_id,
+                    limit=get_settings().SCRAPING_NEAR_DUPLICATE_WINDOW,
+                )
+            except Exception as e:
+                logger.error(
+                    "simhash_load_failed", source_id=self._source_id, error=str(e)
+                )
+                self._hashes = []
+        return self._hashes
+
+    def is_near_duplicate(self, simhash: int, max_distance: int) -> bool:
+        """기존 지문 중 해밍 거리가 max_distance 이하인 것이 있는지 확인."""
+        return any(
+            simhash_distance(simhash, seen) <= max_distance for seen in self._load()
+        )
+
+    def add(self, simhash: int) -> None:
+        """저장한 콘텐츠의 지문 추가."""
+        self._load().append(simhash)
+
+
+def _recent_simhashes(
+    content_repo: ContentRepository, source_id: str
+) -> _RecentSimHashes | None:
+    """근사 중복 판정용 지문 모음 생성 (비활성화 시 None, 조회는 지연됨).
+
+    Args:
+        content_repo: 콘텐츠 저장소
+        source_id: 소스 ID
+
+    Returns:
+        _RecentSimHashes 또는 None
+    """
+    if not get_settings().SCRAPING_NEAR_DUPLICATE_ENABLED:
+        return None
+    return _RecentSimHashes(content_repo, source_id)
+
+
 async def _save_scraped_content(
     source_id: str,
     scraped: ScrapedContent,
     content_repo: ContentRepository,
+    simhashes: _RecentSimHashes | None = None,
 ) -> Content | None:
     """스크래핑된 콘텐츠를 저장.
 
+    simhashes가 주어지면 본문 SimHash가 기존 지문과 가까운(해밍 거리
+    SCRAPING_NEAR_DUPLICATE_MAX_DISTANCE 이하) 근사 중복 콘텐츠를 건너뜁니다.
+
     Args:
         source_id: 소스 ID
         scraped: 스크래핑된 콘텐츠
         content_repo: 콘텐츠 저장소
+        simhashes: 소스의 최근 SimHash 지문 (optional, 저장 시 추가됨)
 
     Returns:
         생성된 Content 또는 None (중복 시)
     """
     # content_key 생성 (멱등성)
     normalized_url = _normalize_url(scraped.url)
-    url_hash = hashlib.sha256(normalized_url.encode()).hexdigest()
+    url_hash = hashlib.sha256(
+        normalized_url.encode(), usedforsecurity=False
+    ).hexdigest()
     content_key = f"{source_id}:{url_hash}"
 
     # 중복 체크
@@ -739,21 +1160,33 @@ async def _save_scraped_content(
         logger.debug("duplicate_content_skipped", content_key=content_key)
         return None
 
+    # 근사 중복 체크 (날짜/방문자 수 등만 다른 본문)
+    simhash = generate_simhash(scraped.body)
+    if simhashes is not None and simhashes.is_near_duplicate(
+        simhash, get_settings().SCRAPING_NEAR_DUPLICATE_MAX_DISTANCE
+    ):
+        logger.debug("near_duplicate_content_skipped", url=scraped.url)
+        return None
+
     # Content 생성
     now = datetime.now(UTC)
+    key_hash = hashlib.sha256(content_key.encode(), usedforsecurity=False)
     content = Content(
-        id=f"cnt_{hashlib.sha256(content_key.encode()).hexdigest()[:12]}",
+        id=f"cnt_{key_hash.hexdigest()[:12]}",
         source_id=source_id,
         content_key=content_key,
         original_url=scraped.url,
         original_title=scraped.title,
         original_body=scraped.body,
         original_published_at=scraped.published_at,
+        simhash=f"{simhash:016x}",
         processing_status=ProcessingStatus.PENDING,
         collected_at=now,
     )
 
     content_repo.create(content)
+    if simhashes is not None:
+        simhashes.add(simhash)
 
     logger.info(
         "content_created",
@@ -783,7 +1216,91 @@ def _normalize_url(url: str) -> str:
     return normalized
 
 
-def _extract_title(element: BeautifulSoup) -> str | None:
+# 텍스트 추출 시 제외할 요소 (BeautifulSoup get_text와 동일하게 스크립트/스타일 제외)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "noscript"})
+
+# 본문 추출 시 제거할 노이즈 요소
+_NOISE_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """소스 설정의 URL 패턴 컴파일 (패턴 문자열별 캐시)."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> CSSSelector:
+    """CSS selector를 XPath로 변환해 컴파일 (selector 문자열별 캐시).
+
+    element.cssselect()는 호출마다 CSS → XPath 변환을 다시 수행합니다.
+    """
+    return CSSSelector(selector, translator="html")
+
+
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """HTML 문자열을 lxml 트리로 파싱.
+
+    인코딩 선언이 포함된 문서도 처리할 수 있도록 UTF-8 바이트로 넘깁니다.
+
+    Raises:
+        lxml.etree.ParserError: 빈 문서인 경우.
+    """
+    return lxml.html.document_fromstring(
+        html.encode("utf-8"),
+        parser=lxml.html.HTMLParser(encoding="utf-8"),
+    )
+
+
+def _select_one(
+    element: lxml.html.HtmlElement, selector: str
+) -> lxml.html.HtmlElement | None:
+    """CSS selector에 매칭되는 첫 번째 하위 요소."""
+    matches = _compile_selector(selector)(element)
+    return matches[0] if matches else None
+
+
+def _get_text(element: lxml.html.HtmlElement, separator: str = " ") -> str:
+    """요소의 텍스트 노드를 공백 제거 후 separator로 연결.
+
+    script/style 등 비텍스트 요소와 주석은 제외합니다. 하위에 비텍스트 요소가
+    없으면 lxml의 itertext()로 텍스트 노드만 C 수준에서 순회합니다.
+    """
+    if element.tag in _NON_TEXT_TAGS:
+        return ""
+    if next(element.iter(*_NON_TEXT_TAGS), None) is None:
+        # itertext()는 주석/PI 내용은 건너뛰고 tail만 포함 (요소 자신의 tail 제외)
+        return separator.join(
+            text for node_text in element.itertext() if (text := node_text.strip())
+        )
+
+    parts: list[str] = []
+
+    def _collect(node: lxml.html.HtmlElement) -> None:
+        if isinstance(node.tag, str) and node.tag not in _NON_TEXT_TAGS:
+            if node.text and node.text.strip():
+                parts.append(node.text.strip())
+            for child in node:
+                _collect(child)
+        if node is not element and node.tail and node.tail.strip():
+            parts.append(node.tail.strip())
+
+    _collect(element)
+    return separator.join(parts)
+
+
+def _document_title(doc: lxml.html.HtmlElement) -> str:
+    """문서 <title> 텍스트 (없으면 빈 문자열)."""
+    title_tag = doc.find(".//title")
+    return title_tag.text or "" if title_tag is not None else ""
+
+
+def _iter_hrefs(doc: lxml.html.HtmlElement) -> list[str]:
+    """문서 내 모든 <a href> 값."""
+    return [str(href) for href in doc.xpath("//a/@href")]
+
+
+def _extract_title(element: lxml.html.HtmlElement) -> str | None:
     """요소에서 제목 추출.
 
     우선순위:
@@ -792,14 +1309,14 @@ def _extract_title(element: BeautifulSoup) -> str | None:
     3. h1 > h2 > h3 heading 태그
     """
     # 1. og:title 메타 태그 (SEO용으로 가장 정확한 제목)
-    og_title = element.find("meta", property="og:title")
-    if og_title and og_title.get("content"):
+    og_title = element.find(".//meta[@property='og:title']")
+    if og_title is not None and og_title.get("content"):
         return og_title.get("content").strip()
 
     # 2. <title> 태그
-    title_tag = element.find("title")
-    if title_tag and title_tag.string:
-        title = title_tag.string.strip()
+    title_tag = element.find(".//title")
+    if title_tag is not None and title_tag.text:
+        title = title_tag.text.strip()
         # 사이트명 분리자 처리 (예: "제목 | 사이트명" → "제목")
         for sep in [" | ", " - ", " \u2013 ", " \u2014 "]:  # EN DASH, EM DASH
             if sep in title:
@@ -809,9 +1326,9 @@ def _extract_title(element: BeautifulSoup) -> str | None:
 
     # 3. h1 > h2 > h3 순서로 검색
     for tag in ["h1", "h2", "h3"]:
-        heading = element.find(tag)
-        if heading:
-            text = heading.get_text(strip=True)
+        heading = element.find(f".//{tag}")
+        if heading is not None:
+            text = _get_text(heading, separator="")
             # "Related stories" 같은 일반적인 섹션 제목 제외
             if text.lower() not in [
                 "related stories",
@@ -823,37 +1340,46 @@ def _extract_title(element: BeautifulSoup) -> str | None:
     return None
 
 
-def _extract_body_text(soup: BeautifulSoup) -> str:
+def _extract_body_text(doc: lxml.html.HtmlElement) -> str:
     """본문 텍스트 추출 (노이즈 제거)."""
-    # 노이즈 요소 제거
-    for noise in soup.find_all(["script", "style", "nav", "header", "footer", "aside"]):
-        noise.decompose()
+    # 노이즈 요소 제거 (tail 텍스트는 유지)
+    # 순회 중 drop_tree로 트리를 바꾸면 iter가 조기 종료되므로 스냅샷을 순회하고,
+    # 이미 제거된 노이즈 내부에 있던 요소(header>nav 등)는 건너뜀
+    root = doc.getroottree().getroot()
+    for noise in list(doc.iter(*_NOISE_TAGS)):
+        if noise is doc or noise.getroottree().getroot() is not root:
+            continue
+        noise.drop_tree()
 
     # body 텍스트 추출
-    body = soup.find("body")
-    if body:
-        return body.get_text(separator=" ", strip=True)
-    return soup.get_text(separator=" ", strip=True)
+    body = doc.find(".//body")
+    if body is not None:
+        return _get_text(body)
+    return _get_text(doc)
 
 
-def _extract_published_date(soup: BeautifulSoup) -> datetime | None:
+def _extract_published_date(doc: lxml.html.HtmlElement) -> datetime | None:
     """발행일 추출."""
     # time 태그의 datetime 속성
-    time_tag = soup.find("time", datetime=True)
-    if time_tag:
+    time_tag = doc.find(".//time[@datetime]")
+    if time_tag is not None:
         try:
-            return datetime.fromisoformat(time_tag["datetime"].replace("Z", "+00:00"))
+            return datetime.fromisoformat(
+                time_tag.get("datetime").replace("Z", "+00:00")
+            )
         except (ValueError, TypeError):
             pass
 
     # meta 태그에서 추출
     for meta_name in ["article:published_time", "datePublished", "date"]:
-        meta = soup.find("meta", {"property": meta_name}) or soup.find(
-            "meta", {"name": meta_name}
-        )
-        if meta and meta.get("content"):
+        meta = doc.find(f".//meta[@property='{meta_name}']")
+        if meta is None:
+            meta = doc.find(f".//meta[@name='{meta_name}']")
+        if meta is not None and meta.get("content"):
             try:
-                return datetime.fromisoformat(meta["content"].replace("Z", "+00:00"))
+                return datetime.fromisoformat(
+                    meta.get("content").replace("Z", "+00:00")
+                )
             except (ValueError, TypeError):
                 pass
 
@@ -7,14 +7,19 @@ yt-dlp로 오디오 추출 후 faster-whisper로 전사합니다.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import json
 import os
 import tempfile
-from dataclasses import dataclass
-from pathlib import Path
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 
+import ctranslate2
 import structlog
 import yt_dlp
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.transcribe import TranscriptionInfo
 
 from src.config.settings import get_settings
 
@@ -57,7 +62,7 @@ class TranscriptionError(Exception):
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptionResult:
     """음성 인식 결과."""
 
@@ -101,19 +106,37 @@ def check_video_duration(
 # ============================================================================
 
 
-def cleanup_temp_files(file_path: str) -> None:
+def cleanup_temp_files(*paths: str) -> None:
     """임시 파일 삭제.
 
+    디렉토리를 넘기면 안의 파일을 모두 지운 뒤 디렉토리도 삭제합니다.
+    존재 여부를 미리 확인하지 않고 바로 unlink하므로 파일당 stat 호출이 없습니다.
+
     Args:
-        file_path: 삭제할 파일 경로
+        *paths: 삭제할 파일 또는 디렉토리 경로
     """
+    for path in paths:
+        try:
+            if os.path.isdir(path):
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        _unlink_quietly(entry.path)
+                os.rmdir(path)
+            else:
+                os.unlink(path)
+            logger.debug("temp_file_deleted", path=path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("temp_file_cleanup_failed", path=path, error=str(e))
+
+
+def _unlink_quietly(path: str) -> None:
+    """파일 삭제 (이미 없으면 무시)."""
     try:
-        path = Path(file_path)
-        if path.exists():
-            path.unlink()
-            logger.debug("temp_file_deleted", path=file_path)
-    except OSError as e:
-        logger.warning("temp_file_cleanup_failed", path=file_path, error=str(e))
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 # ============================================================================
@@ -121,15 +144,64 @@ def cleanup_temp_files(file_path: str) -> None:
 # ============================================================================
 
 
+# yt-dlp 동시 조각 다운로드 수 / Range 요청 청크 크기
+_CONCURRENT_FRAGMENTS = 4
+_HTTP_CHUNK_BYTES = 10 * 1024 * 1024
+
+# watch URL만 처리하므로 YouTube 추출기만 사용
+# (전체 추출기 목록을 순회하며 URL 매칭/로딩하는 비용 생략)
+_YOUTUBE_IE_KEY = "Youtube"
+
+
+def _duration_match_filter(
+    max_duration_seconds: float | None,
+    on_accepted: Callable[[], None] | None = None,
+) -> Callable[..., str | None]:
+    """길이 제한을 넘는 영상의 다운로드를 건너뛰는 yt-dlp match_filter 생성.
+
+    메타데이터만 받은 시점에 평가되므로 긴 영상의 오디오를 내려받지 않습니다.
+
+    Args:
+        max_duration_seconds: 최대 허용 길이 (초, None이면 제한 없음)
+        on_accepted: 영상이 다운로드 대상으로 확정되면 호출할 함수
+            (yt-dlp 작업 스레드에서 호출됨)
+
+    Returns:
+        건너뛸 사유(str) 또는 None을 반환하는 필터 함수
+    """
+
+    def _filter(info: dict, *, incomplete: bool = False) -> str | None:
+        duration = info.get("duration")
+        if (
+            max_duration_seconds is not None
+            and duration is not None
+            and duration > max_duration_seconds
+        ):
+            return f"duration {duration}s exceeds {max_duration_seconds}s"
+        if on_accepted is not None and not incomplete:
+            on_accepted()
+        return None
+
+    return _filter
+
+
 async def extract_audio(
     video_id: str,
     output_dir: str | None = None,
+    max_duration_seconds: float | None = None,
+    on_accepted: Callable[[], None] | None = None,
 ) -> tuple[str, float]:
     """YouTube 영상에서 오디오 추출.
 
+    max_duration_seconds를 넘는 영상은 다운로드하지 않고 메타데이터의
+    길이만 반환합니다 (반환된 경로에 파일이 없을 수 있음).
+
     Args:
         video_id: YouTube 영상 ID (11자)
         output_dir: 출력 디렉토리 (없으면 임시 디렉토리 사용)
+        max_duration_seconds: 다운로드할 최대 영상 길이 (초, None이면 제한 없음)
+        on_accepted: 메타데이터 확인 후 다운로드를 시작하기 직전에 호출할 함수
+            (yt-dlp 작업 스레드에서 호출됨)
 
     Returns:
         (오디오 파일 경로, 영상 길이(초)) 튜플
@@ -144,26 +216,28 @@ async def extract_audio(
 
     output_template = os.path.join(output_dir, f"{video_id}.%(ext)s")
 
+    # 원본 오디오 스트림(opus/m4a)을 그대로 저장 (재인코딩 없음).
+    # faster-whisper가 PyAV로 직접 디코딩하므로 FFmpeg 변환 단계가 필요 없습니다.
     ydl_opts = {
         "format": "bestaudio/best",
         "outtmpl": output_template,
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "m4a",
-                "preferredquality": "192",
-            }
-        ],
+        # DASH 조각 병렬 다운로드 + 큰 파일은 Range 요청으로 나눠 받아 속도 제한 회피
+        "concurrent_fragment_downloads": _CONCURRENT_FRAGMENTS,
+        "http_chunk_size": _HTTP_CHUNK_BYTES,
         "quiet": True,
         "no_warnings": True,
     }
+    if max_duration_seconds is not None or on_accepted is not None:
+        ydl_opts["match_filter"] = _duration_match_filter(
+            max_duration_seconds, on_accepted
+        )
 
     video_url = f"https://www.youtube.com/watch?v={video_id}"
 
     def _download_audio() -> dict:
         """동기 yt-dlp 다운로드 (to_thread용)."""
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            return ydl.extract_info(video_url, download=True)
+            return ydl.extract_info(video_url, download=True, ie_key=_YOUTUBE_IE_KEY)
 
     try:
         # yt-dlp는 동기 라이브러리이므로 to_thread로 실행
@@ -173,11 +247,14 @@ async def extract_audio(
             raise YouTubeExtractionError("Failed to get video info", video_id)
 
         duration = info.get("duration", 0)
-        audio_path = os.path.join(output_dir, f"{video_id}.m4a")
+        downloads = info.get("requested_downloads") or [{}]
+        audio_path = downloads[0].get("filepath") or os.path.join(
+            output_dir, f"{video_id}.{info.get('ext', 'm4a')}"
+        )
 
         if not os.path.exists(audio_path):
             # 확장자가 다를 수 있음
-            for ext in ["m4a", "mp3", "opus", "webm"]:
+            for ext in ["m4a", "webm", "opus", "mp3"]:
                 alt_path = os.path.join(output_dir, f"{video_id}.{ext}")
                 if os.path.exists(alt_path):
                     audio_path = alt_path
@@ -211,17 +288,149 @@ async def extract_audio(
 # ============================================================================
 
 
+# compute_type="auto"일 때 장치별 선호 순서 (앞에 있을수록 빠름)
+_COMPUTE_TYPE_PREFERENCES = {
+    "cuda": ("int8_float16", "float16", "int8", "float32"),
+    "cpu": ("int8", "int8_float32", "float32"),
+}
+
+
+def _resolve_device() -> str:
+    """사용할 장치 선택 (CUDA GPU가 있으면 cuda, 없으면 cpu)."""
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def _resolve_compute_type(device: str, compute_type: str) -> str:
+    """연산 타입 결정.
+
+    "auto"이면 장치가 지원하는 타입 중 가장 빠른 양자화 타입을 고릅니다
+    (GPU: int8_float16, CPU: int8 - AVX-512 VNNI 등 int8 내적 명령 활용).
+
+    Args:
+        device: 장치 (cpu, cuda)
+        compute_type: 요청한 연산 타입 또는 "auto"
+
+    Returns:
+        WhisperModel에 전달할 연산 타입
+    """
+    if compute_type != "auto":
+        return compute_type
+
+    supported = ctranslate2.get_supported_compute_types(device)
+    for candidate in _COMPUTE_TYPE_PREFERENCES.get(device, ()):
+        if candidate in supported:
+            return candidate
+    return "default"
+
+
+# cgroup v2 CPU 쿼터 ("<quota> <period>" 또는 "max <period>")
+_CGROUP_CPU_MAX_PATH = "/sys/fs/cgroup/cpu.max"
+
+
+def _cgroup_cpu_limit() -> int | None:
+    """cgroup v2 CPU 쿼터로 허용된 CPU 수 (제한이 없거나 읽을 수 없으면 None).
+
+    Cloud Run 등 컨테이너는 CPU를 쿼터로 제한하므로 affinity로 보이는 호스트
+    코어 수보다 적게 쓸 수 있습니다. 소수 CPU 할당은 올림합니다.
+    """
+    try:
+        with open(_CGROUP_CPU_MAX_PATH) as f:
+            quota, period = f.read().split()[:2]
+        if quota == "max":
+            return None
+        return max(1, -(-int(quota) // int(period)))
+    except (OSError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _cpu_threads() -> int:
+    """CTranslate2에 사용할 CPU 스레드 수 (컨테이너 CPU 할당 기준).
+
+    cgroup CPU 쿼터와 스케줄링 affinity 중 작은 값을 사용합니다.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 0
+    limit = _cgroup_cpu_limit()
+    if limit is None:
+        return available
+    return min(limit, available) if available else limit
+
+
+# (model_size, compute_type)별 로드된 Whisper 배치 파이프라인 (프로세스 공유)
+_WHISPER_MODELS: dict[tuple[str, str], BatchedInferencePipeline] = {}
+_WHISPER_LOCK = threading.Lock()
+
+# VAD로 분할할 때 구간 경계로 볼 최소 무음 길이
+_VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+
+def _get_whisper_model(model_size: str, compute_type: str) -> BatchedInferencePipeline:
+    """캐시된 Whisper 배치 파이프라인 반환 (없으면 모델 로드).
+
+    모델 로드는 수 초가 걸리므로 프로세스에서 한 번만 하고 재사용합니다.
+    동시 호출이 같은 모델을 중복 로드하지 않도록 lock으로 보호합니다.
+
+    Args:
+        model_size: Whisper 모델 크기
+        compute_type: 연산 타입 ("auto"면 장치에 맞게 선택)
+
+    Returns:
+        로드된 모델을 감싼 BatchedInferencePipeline
+    """
+    key = (model_size, compute_type)
+    with _WHISPER_LOCK:
+        model = _WHISPER_MODELS.get(key)
+        if model is None:
+            device = _resolve_device()
+            resolved_type = _resolve_compute_type(device, compute_type)
+            model = BatchedInferencePipeline(
+                WhisperModel(
+                    model_size,
+                    device=device,
+                    compute_type=resolved_type,
+                    cpu_threads=_cpu_threads(),
+                )
+            )
+            _WHISPER_MODELS[key] = model
+            logger.info(
+                "whisper_model_loaded",
+                model_size=model_size,
+                device=device,
+                compute_type=resolved_type,
+            )
+        return model
+
+
+async def _warm_up_whisper_model(model_size: str, compute_type: str) -> None:
+    """Whisper 모델을 미리 로드해 캐시에 올려둠.
+
+    실패해도 예외를 올리지 않습니다. 실제 전사 시 다시 로드를 시도하고
+    그때의 오류가 TranscriptionError로 보고됩니다.
+    """
+    try:
+        await asyncio.to_thread(_get_whisper_model, model_size, compute_type)
+    except Exception as e:
+        logger.warning("whisper_model_warmup_failed", error=str(e))
+
+
 async def transcribe_audio(
     audio_path: str,
     model_size: str = "small",
-    compute_type: str = "int8",
+    compute_type: str = "auto",
+    batch_size: int = 8,
 ) -> TranscriptionResult:
     """오디오 파일 전사.
 
+    VAD로 나눈 음성 구간을 batch_size개씩 묶어 인코더에 한 번에 넣는
+    배치 추론으로 전사합니다.
+
     Args:
         audio_path: 오디오 파일 경로
         model_size: Whisper 모델 크기 (tiny, base, small, medium)
-        compute_type: 연산 타입 (int8, float16, float32)
+        compute_type: 연산 타입 (auto, int8, int8_float16, float16, float32)
+        batch_size: 배치 추론 시 한 번에 처리할 음성 구간 수
 
     Returns:
         TranscriptionResult 전사 결과
@@ -230,24 +439,31 @@ async def transcribe_audio(
         TranscriptionError: 전사 실패
     """
     try:
-        model = WhisperModel(
-            model_size,
-            device="cpu",
-            compute_type=compute_type,
-        )
-
-        segments, info = model.transcribe(
-            audio_path,
-            beam_size=5,
-            vad_filter=True,  # VAD로 무음 구간 스킵
-        )
-
-        # 세그먼트에서 텍스트 추출
-        text_parts = []
-        for segment in segments:
-            text_parts.append(segment.text.strip())
+        # 모델 로드는 블로킹 작업이므로 to_thread로 실행 (이후 호출은 캐시 사용)
+        model = await asyncio.to_thread(_get_whisper_model, model_size, compute_type)
+
+        def _transcribe() -> tuple[str, TranscriptionInfo]:
+            """동기 전사 (to_thread용).
+
+            segments는 지연 생성기라 순회하는 동안 실제 디코딩이 일어나므로
+            순회까지 워커 스레드에서 끝냅니다.
+            """
+            segments, info = model.transcribe(
+                audio_path,
+                beam_size=5,
+                batch_size=batch_size,
+                vad_filter=True,  # VAD로 무음 구간 스킵 및 배치 단위 분할
+                vad_parameters=_VAD_PARAMETERS,
+            )
+            # 세그먼트에서 텍스트 추출 (빈 세그먼트는 제외해 공백이 겹치지 않도록)
+            text_parts = [
+                text for segment in segments if (text := segment.text.strip())
+            ]
+            return " ".join(text_parts), info
 
-        full_text = " ".join(text_parts)
+        # 전사는 수십 초~수 분 걸리는 CPU/GPU 작업이므로 이벤트 루프 밖에서 실행
+        # (CTranslate2가 GIL을 해제하므로 다른 수집 작업이 계속 진행됨)
+        full_text, info = await asyncio.to_thread(_transcribe)
 
         logger.info(
             "audio_transcribed",
@@ -269,6 +485,74 @@ async def transcribe_audio(
         raise TranscriptionError(str(e)) from e
 
 
+# ============================================================================
+# 전사 결과 디스크 캐시
+# ============================================================================
+
+
+def _transcript_cache_dir(cache_dir: str | None) -> str:
+    """전사 캐시 디렉토리 경로 (설정이 없으면 시스템 임시 디렉토리 아래)."""
+    return cache_dir or os.path.join(tempfile.gettempdir(), "ax_stt_cache")
+
+
+def _transcript_cache_path(
+    cache_dir: str, video_id: str, model_size: str, compute_type: str
+) -> str:
+    """(video_id, 모델 크기, 연산 타입)별 캐시 파일 경로."""
+    return os.path.join(cache_dir, f"{video_id}.{model_size}.{compute_type}.json")
+
+
+def _load_cached_transcript(path: str) -> TranscriptionResult | None:
+    """캐시된 전사 결과 로드 (없거나 손상되면 None).
+
+    LRU 정리를 위해 읽은 파일의 수정 시각을 갱신합니다.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        os.utime(path)
+        return TranscriptionResult(**data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("stt_cache_read_failed", path=path, error=str(e))
+        return None
+
+
+def _store_cached_transcript(
+    path: str, result: TranscriptionResult, max_entries: int
+) -> None:
+    """전사 결과를 캐시에 저장하고 오래된 항목 정리.
+
+    임시 파일에 쓴 뒤 교체하므로 동시에 읽는 쪽이 반쯤 쓰인 파일을 보지 않습니다.
+
+    Args:
+        path: 캐시 파일 경로
+        result: 저장할 전사 결과
+        max_entries: 보관할 최대 항목 수 (초과분은 가장 오래 쓰지 않은 것부터 삭제)
+    """
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(result), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with os.scandir(cache_dir) as entries:
+            cached = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in entries
+                if entry.name.endswith(".json")
+            ]
+        if len(cached) > max_entries:
+            cached.sort()
+            for _, stale_path in cached[: len(cached) - max_entries]:
+                _unlink_quietly(stale_path)
+    except OSError as e:
+        logger.warning("stt_cache_write_failed", path=path, error=str(e))
+
+
 # ============================================================================
 # 통합 함수: fetch_youtube_with_stt
 # ============================================================================
@@ -300,11 +584,45 @@ async def fetch_youtube_with_stt(
     if max_duration_minutes is None:
         max_duration_minutes = settings.STT_MAX_VIDEO_DURATION_MINUTES
 
-    audio_path: str | None = None
+    # 같은 영상을 같은 모델 설정으로 이미 전사했다면 다운로드 없이 재사용
+    cache_path: str | None = None
+    if settings.STT_CACHE_MAX_ENTRIES > 0:
+        cache_path = _transcript_cache_path(
+            _transcript_cache_dir(settings.STT_CACHE_DIR),
+            video_id,
+            settings.STT_MODEL_SIZE,
+            settings.STT_COMPUTE_TYPE,
+        )
+        cached = _load_cached_transcript(cache_path)
+        if cached is not None:
+            logger.info("stt_cache_hit", video_id=video_id)
+            return cached
+
+    output_dir = tempfile.mkdtemp(prefix="ax_stt_")
+    loop = asyncio.get_running_loop()
+    warm_ups: list[concurrent.futures.Future[None]] = []
+
+    def _start_warm_up() -> None:
+        """다운로드가 확정된 영상만 Whisper 모델 로드를 시작 (yt-dlp 스레드에서 호출)."""
+        if not warm_ups:
+            warm_ups.append(
+                asyncio.run_coroutine_threadsafe(
+                    _warm_up_whisper_model(
+                        settings.STT_MODEL_SIZE, settings.STT_COMPUTE_TYPE
+                    ),
+                    loop,
+                )
+            )
 
     try:
-        # 1. 오디오 추출
-        audio_path, duration = await extract_audio(video_id)
+        # 1. 오디오 추출 (길이 초과 영상은 yt-dlp가 다운로드 전에 건너뜀)
+        #    길이 확인을 통과한 영상만 다운로드하는 동안 Whisper 모델 로드를 함께 진행
+        audio_path, duration = await extract_audio(
+            video_id,
+            output_dir=output_dir,
+            max_duration_seconds=max_duration_minutes * 60,
+            on_accepted=_start_warm_up,
+        )
 
         # 2. 영상 길이 확인
         if not check_video_duration(duration, max_duration_minutes):
@@ -316,16 +634,22 @@ async def fetch_youtube_with_stt(
             )
             return None
 
-        # 3. 전사
+        # 3. 전사 (사전 로드가 진행 중이면 끝날 때까지 대기)
+        if warm_ups:
+            await asyncio.wrap_future(warm_ups[0])
+
         result = await transcribe_audio(
             audio_path=audio_path,
             model_size=settings.STT_MODEL_SIZE,
             compute_type=settings.STT_COMPUTE_TYPE,
+            batch_size=settings.STT_BATCH_SIZE,
         )
 
+        if cache_path is not None:
+            _store_cached_transcript(cache_path, result, settings.STT_CACHE_MAX_ENTRIES)
+
         return result
 
     finally:
-        # 4. 임시 파일 정리
-        if audio_path:
-            cleanup_temp_files(audio_path)
+        # 4. 임시 디렉토리 정리 (.part 등 중간 파일 포함)
+        cleanup_temp_files(output_dir)
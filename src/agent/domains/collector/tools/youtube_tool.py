@@ -7,6 +7,7 @@ youtube-transcript-api를 사용하여 YouTube 자막을 수집합니다.
 from __future__ import annotations
 
 import asyncio
+import functools
 import re
 import uuid
 from dataclasses import dataclass
@@ -33,8 +34,20 @@ from src.repositories.content_repo import ContentRepository
 
 logger = structlog.get_logger(__name__)
 
+# 11자리 video ID (YouTube video ID는 [A-Za-z0-9_-] 11자)
+_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}", re.ASCII)
 
-@dataclass
+# 채널 페이지 HTML에서 channel ID 추출 ("channelId":"UC..." / canonical URL)
+_CHANNEL_ID_JSON_RE = re.compile(r'"channelId":"(UC[a-zA-Z0-9_-]{22})"')
+_CHANNEL_ID_CANONICAL_RE = re.compile(
+    r'<link rel="canonical" href="[^"]*?/channel/(UC[a-zA-Z0-9_-]{22})"'
+)
+
+# 같은 영상 자막을 반복 조회하지 않도록 프로세스 내 캐시할 최대 개수
+_TRANSCRIPT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
 class YouTubeTranscript:
     """YouTube 자막 데이터."""
 
@@ -56,11 +69,8 @@ def extract_video_id(url_or_id: str) -> str | None:
     if not url_or_id:
         return None
 
-    # 11자리 video ID 패턴 (YouTube video ID는 11자)
-    video_id_pattern = r"^[a-zA-Z0-9_-]{11}$"
-
-    # 이미 video ID인 경우
-    if re.match(video_id_pattern, url_or_id):
+    # 이미 video ID인 경우 (길이가 다르면 정규식 없이 URL 파싱으로)
+    if len(url_or_id) == 11 and _VIDEO_ID_RE.fullmatch(url_or_id):
         return url_or_id
 
     # URL 파싱
@@ -129,6 +139,9 @@ def get_transcript(
 ) -> YouTubeTranscript | None:
     """YouTube 자막 가져오기.
 
+    성공한 결과는 (video_id, languages) 기준으로 캐시됩니다. 실패는 캐시하지
+    않으므로 다음 호출에서 다시 시도합니다.
+
     Args:
         video_id: YouTube video ID.
         languages: 선호 언어 목록 (기본: ["en"]).
@@ -140,38 +153,53 @@ def get_transcript(
         languages = ["en"]
 
     try:
-        # 인스턴스 생성 후 fetch 호출 (새 API)
-        api = YouTubeTranscriptApi()
-        transcript_list = api.fetch(video_id, languages=languages)
-
-        # 텍스트 연결 (새 API는 FetchedTranscriptSnippet 객체 리스트 반환)
-        text_parts = [segment.text for segment in transcript_list]
-        full_text = " ".join(text_parts)
-
-        # 전체 길이 계산 (마지막 세그먼트의 시작 + 지속시간)
-        duration = 0.0
-        if transcript_list:
-            last_segment = transcript_list[-1]
-            duration = last_segment.start + last_segment.duration
-
-        # 실제 사용된 언어 확인
-        actual_language = languages[0]
-        if hasattr(transcript_list, "language"):
-            actual_language = transcript_list.language
-
-        return YouTubeTranscript(
-            video_id=video_id,
-            text=full_text,
-            language=actual_language,
-            duration_seconds=duration,
-        )
-
+        return _fetch_transcript(video_id, tuple(languages))
     except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable):
         return None
     except Exception:
         return None
 
 
+@functools.lru_cache(maxsize=_TRANSCRIPT_CACHE_SIZE)
+def _fetch_transcript(video_id: str, languages: tuple[str, ...]) -> YouTubeTranscript:
+    """자막 조회 (캐시됨).
+
+    예외는 lru_cache에 저장되지 않으므로 실패한 조회는 캐시되지 않습니다.
+
+    Args:
+        video_id: YouTube video ID.
+        languages: 선호 언어 목록.
+
+    Returns:
+        자막 데이터.
+    """
+    # 인스턴스 생성 후 fetch 호출 (새 API)
+    api = YouTubeTranscriptApi()
+    transcript_list = api.fetch(video_id, languages=list(languages))
+
+    # 텍스트 연결 (새 API는 FetchedTranscriptSnippet 객체 리스트 반환)
+    text_parts = [segment.text for segment in transcript_list]
+    full_text = " ".join(text_parts)
+
+    # 전체 길이 계산 (마지막 세그먼트의 시작 + 지속시간)
+    duration = 0.0
+    if transcript_list:
+        last_segment = transcript_list[-1]
+        duration = last_segment.start + last_segment.duration
+
+    # 실제 사용된 언어 확인
+    actual_language = languages[0]
+    if hasattr(transcript_list, "language"):
+        actual_language = transcript_list.language
+
+    return YouTubeTranscript(
+        video_id=video_id,
+        text=full_text,
+        language=actual_language,
+        duration_seconds=duration,
+    )
+
+
 def fetch_youtube(
     source_id: str,
     video_url: str,
@@ -318,15 +346,12 @@ def get_channel_id(channel_url: str) -> str | None:
 
             # HTML에서 channel ID 추출
             # 패턴: "channelId":"UC..."
-            match = re.search(r'"channelId":"(UC[a-zA-Z0-9_-]{22})"', response.text)
+            match = _CHANNEL_ID_JSON_RE.search(response.text)
             if match:
                 return match.group(1)
 
             # 대체 패턴: /channel/UC... 형태의 canonical URL
-            match = re.search(
-                r'<link rel="canonical" href="[^"]*?/channel/(UC[a-zA-Z0-9_-]{22})"',
-                response.text,
-            )
+            match = _CHANNEL_ID_CANONICAL_RE.search(response.text)
             if match:
                 return match.group(1)
 
@@ -1,9 +1,12 @@
 """Slack digest sender tool.
 
 Slack Block Kit을 사용하여 다이제스트 메시지를 구성하고 발송합니다.
-각 콘텐츠를 개별 메시지로 발송합니다.
+기본적으로 각 콘텐츠를 개별 메시지로 발송하며, 여러 콘텐츠를 묶어 발송할 수도 있습니다.
 """
 
+import functools
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -14,7 +17,24 @@ from src.models.content import Content
 from src.models.digest import Digest
 
 # Markdown → Slack mrkdwn 변환기 (싱글톤)
+# 변환 중 내부 상태(코드 블록 여부 등)를 바꾸므로 스레드 간 공유 시 락으로 보호
 _mrkdwn_converter = SlackMarkdownConverter()
+_mrkdwn_lock = threading.Lock()
+
+# 같은 콘텐츠가 여러 구독 다이제스트에 실리므로 변환 결과 캐시
+_MRKDWN_CACHE_SIZE = 1024
+
+# chat.postMessage 한 번에 보낼 수 있는 최대 블록 수
+_SLACK_MAX_BLOCKS = 50
+
+_DIVIDER_BLOCK: dict[str, Any] = {"type": "divider"}
+
+# 원문 보기 버튼 라벨 (모든 블록이 공유하는 읽기 전용 값)
+_VIEW_ORIGINAL_BUTTON_TEXT: dict[str, Any] = {
+    "type": "plain_text",
+    "text": ":link: 원문 보기",
+    "emoji": True,
+}
 
 
 def to_mrkdwn(text: str) -> str:
@@ -28,10 +48,17 @@ def to_mrkdwn(text: str) -> str:
     """
     if not text:
         return text
-    return _mrkdwn_converter.convert(text)
+    return _convert_mrkdwn(text)
+
 
+@functools.lru_cache(maxsize=_MRKDWN_CACHE_SIZE)
+def _convert_mrkdwn(text: str) -> str:
+    """mrkdwn 변환 (캐시됨)."""
+    with _mrkdwn_lock:
+        return _mrkdwn_converter.convert(text)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DigestBlock:
     """다이제스트에 포함될 콘텐츠 블록 정보."""
 
@@ -44,7 +71,7 @@ class DigestBlock:
     categories: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlackDigestMessage:
     """Slack으로 발송할 다이제스트 메시지."""
 
@@ -53,7 +80,7 @@ class SlackDigestMessage:
     thread_ts: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SendDigestResult:
     """다이제스트 발송 결과."""
 
@@ -71,8 +98,6 @@ def build_content_blocks(digest_block: DigestBlock) -> list[dict[str, Any]]:
     Returns:
         Block Kit 형식의 블록 리스트
     """
-    blocks: list[dict[str, Any]] = []
-
     score_percent = int(digest_block.relevance_score * 100)
     score_emoji = _get_score_emoji(digest_block.relevance_score)
 
@@ -87,8 +112,13 @@ def build_content_blocks(digest_block: DigestBlock) -> list[dict[str, Any]]:
     summary_mrkdwn = to_mrkdwn(digest_block.summary_ko)
     why_important_mrkdwn = to_mrkdwn(digest_block.why_important)
 
-    # 메인 섹션
-    blocks.append(
+    # 메타 정보 (점수, 카테고리)
+    meta_text = f"{score_emoji} 관련성: *{score_percent}%*"
+    if category_tags:
+        meta_text += f"  |  {category_tags}"
+
+    return [
+        # 메인 섹션
         {
             "type": "section",
             "text": {
@@ -99,15 +129,8 @@ def build_content_blocks(digest_block: DigestBlock) -> list[dict[str, Any]]:
                     f":bulb: _{why_important_mrkdwn}_"
                 ),
             },
-        }
-    )
-
-    # 메타 정보 (점수, 카테고리)
-    meta_text = f"{score_emoji} 관련성: *{score_percent}%*"
-    if category_tags:
-        meta_text += f"  |  {category_tags}"
-
-    blocks.append(
+        },
+        # 메타 정보
         {
             "type": "context",
             "elements": [
@@ -116,29 +139,20 @@ def build_content_blocks(digest_block: DigestBlock) -> list[dict[str, Any]]:
                     "text": meta_text,
                 }
             ],
-        }
-    )
-
-    # 원문 링크 버튼
-    blocks.append(
+        },
+        # 원문 링크 버튼
         {
             "type": "actions",
             "elements": [
                 {
                     "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": ":link: 원문 보기",
-                        "emoji": True,
-                    },
+                    "text": _VIEW_ORIGINAL_BUTTON_TEXT,
                     "url": digest_block.original_url,
                     "action_id": f"view_original_{digest_block.content_id}",
                 }
             ],
-        }
-    )
-
-    return blocks
+        },
+    ]
 
 
 def _get_score_emoji(score: float) -> str:
@@ -157,15 +171,19 @@ def send_digest(
     digest: Digest,
     contents: list[Content],
     slack_client: SlackClient,
+    batch: bool = False,
 ) -> SendDigestResult:
     """다이제스트를 Slack으로 발송.
 
-    각 콘텐츠를 개별 메시지로 발송합니다.
+    기본적으로 각 콘텐츠를 개별 메시지로 발송합니다. batch=True이면
+    콘텐츠 블록을 구분선으로 이어 메시지당 최대 50블록씩 묶어 발송하므로
+    HTTP 호출 수가 줄어듭니다. 한 콘텐츠의 블록은 메시지 사이에 나뉘지 않습니다.
 
     Args:
         digest: 다이제스트 정보
         contents: 다이제스트에 포함될 콘텐츠들
         slack_client: Slack 클라이언트
+        batch: 여러 콘텐츠를 한 메시지로 묶어 발송할지 여부
 
     Returns:
         발송 결과 (첫 번째 메시지의 timestamp 반환)
@@ -179,26 +197,12 @@ def send_digest(
     try:
         first_message_ts: str | None = None
 
-        for content in contents:
-            # Content를 DigestBlock으로 변환
-            digest_block = DigestBlock(
-                content_id=content.id,
-                title_ko=content.title_ko or content.original_title,
-                summary_ko=content.summary_ko or "",
-                why_important=content.why_important or "",
-                relevance_score=content.relevance_score or 0.0,
-                original_url=content.original_url,
-                categories=content.categories or [],
-            )
-
-            # Block Kit 블록 생성
-            blocks = build_content_blocks(digest_block)
-
+        for blocks, text in _iter_messages(contents, batch):
             # 메시지 발송
             result = slack_client.post_message(
                 channel=digest.channel_id,
                 blocks=blocks,
-                text=digest_block.title_ko,
+                text=text,
             )
 
             # 첫 번째 메시지의 timestamp 저장
@@ -215,3 +219,55 @@ def send_digest(
             success=False,
             error=str(e),
         )
+
+
+def _iter_messages(
+    contents: list[Content],
+    batch: bool,
+) -> Iterator[tuple[list[dict[str, Any]], str]]:
+    """발송할 메시지 (블록, 대체 텍스트)를 순서대로 생성.
+
+    Args:
+        contents: 다이제스트에 포함될 콘텐츠들
+        batch: 여러 콘텐츠를 한 메시지로 묶을지 여부
+
+    Yields:
+        (Block Kit 블록 리스트, 알림용 대체 텍스트)
+    """
+    blocks: list[dict[str, Any]] = []
+    text = ""
+
+    for content in contents:
+        digest_block = _to_digest_block(content)
+        content_blocks = build_content_blocks(digest_block)
+
+        if not batch:
+            yield content_blocks, digest_block.title_ko
+            continue
+
+        # 블록 한도를 넘으면 지금까지 묶은 메시지를 먼저 발송
+        if blocks and len(blocks) + 1 + len(content_blocks) > _SLACK_MAX_BLOCKS:
+            yield blocks, text
+            blocks = []
+
+        if blocks:
+            blocks.append(_DIVIDER_BLOCK)
+        else:
+            text = digest_block.title_ko
+        blocks.extend(content_blocks)
+
+    if blocks:
+        yield blocks, text
+
+
+def _to_digest_block(content: Content) -> DigestBlock:
+    """Content를 DigestBlock으로 변환."""
+    return DigestBlock(
+        content_id=content.id,
+        title_ko=content.title_ko or content.original_title,
+        summary_ko=content.summary_ko or "",
+        why_important=content.why_important or "",
+        relevance_score=content.relevance_score or 0.0,
+        original_url=content.original_url,
+        categories=content.categories or [],
+    )
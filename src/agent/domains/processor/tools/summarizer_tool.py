@@ -3,6 +3,7 @@
 Gemini API를 사용하여 GeekNews 스타일 요약을 생성합니다.
 """
 
+import re
 from dataclasses import dataclass, field
 
 from src.adapters.gemini_client import GeminiClient
@@ -31,6 +32,12 @@ GeekNews 스타일로 간결하고 핵심적인 요약을 작성합니다.
 
 JSON 형식으로만 응답하세요."""
 
+# 응답에 반드시 있어야 하는 필드
+_REQUIRED_FIELDS = frozenset({"title_ko", "summary_ko", "why_important"})
+
+# 문장 분리: 종결 부호까지 한 문장, 마지막 부호 뒤의 나머지도 한 문장
+_SENTENCE_RE = re.compile(r"[^.!?。]*[.!?。]|[^.!?。]+")
+
 
 def _build_prompt(title_ko: str, body_ko: str | None) -> str:
     """요약 프롬프트 생성."""
@@ -68,23 +75,16 @@ def _truncate_title(title: str, max_length: int = 20) -> str:
 
 def _truncate_summary(summary: str, max_sentences: int = 3) -> str:
     """요약 문장 수 제한."""
-    # 마침표로 문장 분리
     sentences = []
-    current = ""
-
-    for char in summary:
-        current += char
-        if char in ".!?。":
-            sentences.append(current.strip())
-            current = ""
-
-    if current.strip():
-        sentences.append(current.strip())
-
-    # 최대 문장 수로 제한
-    limited = sentences[:max_sentences]
+    for match in _SENTENCE_RE.finditer(summary):
+        # 최대 문장 수에 도달하면 나머지는 분리하지 않음
+        if len(sentences) >= max_sentences:
+            break
+        sentence = match.group().strip()
+        if sentence:
+            sentences.append(sentence)
 
-    return " ".join(limited)
+    return " ".join(sentences)
 
 
 def summarize_content(
@@ -123,9 +123,7 @@ def summarize_content(
             )
 
             # 필수 필드 확인
-            if not all(
-                k in result for k in ["title_ko", "summary_ko", "why_important"]
-            ):
+            if not _REQUIRED_FIELDS <= result.keys():
                 raise ValueError("Missing required fields in response")
 
             # 제목 및 요약 길이 제한 적용
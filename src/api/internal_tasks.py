@@ -84,6 +84,7 @@ def get_digest_service(request: Request | None = None) -> DigestService:
         digest_repo=digest_repo,
         subscription_repo=subscription_repo,
         slack_client=slack_client,
+        batch_messages=settings.SLACK_DIGEST_BATCH,
     )
 
 
@@ -8,6 +8,10 @@ from fastapi import FastAPI
 from src.adapters.firestore_client import FirestoreClient
 from src.adapters.slack_client import SlackClient
 from src.adapters.tasks_client import TasksClient
+from src.agent.domains.collector.tools.web_scraper_tool import (
+    close_shared_browser,
+    close_shared_http_client,
+)
 from src.api.internal_tasks import router as internal_tasks_router
 from src.api.scheduler import router as scheduler_router
 from src.api.sources import router as sources_router
@@ -50,6 +54,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Application shutting down")
+    await close_shared_browser()
+    await close_shared_http_client()
 
 
 app = FastAPI(
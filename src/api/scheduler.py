@@ -14,6 +14,7 @@ from src.adapters.gemini_client import GeminiClient
 from src.adapters.slack_client import SlackClient
 from src.adapters.tasks_client import TasksClient
 from src.config.settings import Settings
+from src.models.digest import Digest
 from src.repositories.content_repo import ContentRepository
 from src.repositories.digest_repo import DigestRepository
 from src.repositories.source_repo import SourceRepository
@@ -84,6 +85,7 @@ def get_digest_service(request: Request | None = None) -> DigestService:
         digest_repo=digest_repo,
         subscription_repo=subscription_repo,
         slack_client=slack_client,
+        batch_messages=settings.SLACK_DIGEST_BATCH,
     )
 
 
@@ -149,9 +151,10 @@ async def distribute_digests(request: Request) -> dict[str, Any]:
             "failed": 0,
         }
 
+        to_send: list[Digest] = []
         for subscription in subscriptions:
             try:
-                # 다이제스트 생성 및 발송
+                # 다이제스트 생성
                 digest = service.create_digest(subscription, today)
 
                 # 이미 발송된 다이제스트인지 확인
@@ -160,13 +163,7 @@ async def distribute_digests(request: Request) -> dict[str, Any]:
                     continue
 
                 result["created"] += 1
-
-                # 발송
-                success = service.send_digest(digest)
-                if success:
-                    result["sent"] += 1
-                else:
-                    result["failed"] += 1
+                to_send.append(digest)
 
             except Exception as e:
                 logger.error(
@@ -176,6 +173,11 @@ async def distribute_digests(request: Request) -> dict[str, Any]:
                 )
                 result["failed"] += 1
 
+        # 발송 (채널 단위 병렬, 같은 채널은 순차)
+        outcomes = service.send_digests(to_send)
+        result["sent"] += sum(outcomes)
+        result["failed"] += len(outcomes) - sum(outcomes)
+
         logger.info(
             "digest_distribution_completed",
             total_subscriptions=result["total_subscriptions"],
@@ -36,6 +36,9 @@ class Settings(BaseSettings):
     SLACK_BOT_TOKEN: str
     SLACK_SIGNING_SECRET: str
 
+    SLACK_DIGEST_BATCH: bool = True
+    """다이제스트 콘텐츠를 메시지당 최대 50블록으로 묶어 발송 (False면 콘텐츠별 메시지)"""
+
     # -------------------------------------------------------------------------
     # Cloud Tasks
     # -------------------------------------------------------------------------
@@ -72,6 +75,21 @@ class Settings(BaseSettings):
     SCRAPING_REQUEST_INTERVAL_MAX: float = 5.0
     """최대 요청 간격 (초)"""
 
+    SCRAPING_MAX_RESPONSE_BYTES: int = 2 * 1024 * 1024
+    """정적 HTML 응답 최대 크기 (바이트, 초과분은 읽지 않음)"""
+
+    SCRAPING_MAX_CONCURRENT_FETCHES: int = 16
+    """동시 페이지 요청 최대 수 (정적 HTTP + Playwright)"""
+
+    SCRAPING_NEAR_DUPLICATE_ENABLED: bool = True
+    """SimHash 기반 근사 중복 콘텐츠 건너뛰기 활성화"""
+
+    SCRAPING_NEAR_DUPLICATE_MAX_DISTANCE: int = 3
+    """근사 중복으로 판정할 SimHash 최대 해밍 거리 (64비트 중)"""
+
+    SCRAPING_NEAR_DUPLICATE_WINDOW: int = 500
+    """근사 중복 비교 대상으로 읽을 소스별 최근 콘텐츠 수"""
+
     # -------------------------------------------------------------------------
     # YouTube STT (Phase 2)
     # -------------------------------------------------------------------------
@@ -81,12 +99,24 @@ class Settings(BaseSettings):
     STT_MODEL_SIZE: str = "small"
     """Whisper 모델 크기 (tiny, base, small, medium)"""
 
-    STT_COMPUTE_TYPE: str = "int8"
-    """연산 타입 (int8, float16, float32)"""
+    STT_COMPUTE_TYPE: str = "auto"
+    """연산 타입 (auto, int8, int8_float16, float16, float32)
+
+    auto: GPU면 int8_float16, CPU면 int8 (장치가 지원하는 가장 빠른 타입)
+    """
+
+    STT_BATCH_SIZE: int = 8
+    """배치 추론 시 한 번에 전사할 음성 구간 수 (메모리 부족 시 낮춤)"""
 
     STT_MAX_VIDEO_DURATION_MINUTES: int = 30
     """STT 대상 최대 영상 길이 (분)"""
 
+    STT_CACHE_DIR: str | None = None
+    """전사 결과 디스크 캐시 디렉토리 (None이면 시스템 임시 디렉토리 아래)"""
+
+    STT_CACHE_MAX_ENTRIES: int = 512
+    """디스크에 보관할 최대 전사 결과 수 (0이면 캐시 비활성화)"""
+
     # -------------------------------------------------------------------------
     # Quality Filtering (Phase 2)
     # -------------------------------------------------------------------------
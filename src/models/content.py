@@ -4,6 +4,8 @@
 """
 
 import hashlib
+import re
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
@@ -58,10 +60,61 @@ def generate_content_key(source_id: str, url: str) -> str:
     Format: {source_id}:{sha256(normalized_url)[:16]}
     """
     normalized = normalize_url(url)
-    url_hash = hashlib.sha256(normalized.encode()).hexdigest()[:16]
+    url_hash = hashlib.sha256(normalized.encode(), usedforsecurity=False).hexdigest()[
+        :16
+    ]
     return f"{source_id}:{url_hash}"
 
 
+def generate_content_hash(body: str) -> str:
+    """본문 내용 해시 생성 (URL이 달라도 같은 본문인지 판정용).
+
+    공백을 정규화한 본문의 sha256 hex digest. 저장된 해시와 호환되도록 sha256을
+    유지하며, hashlib(OpenSSL) 구현은 CPU의 SHA 확장 명령을 자동으로 사용합니다.
+    """
+    normalized = " ".join(body.split())
+    return hashlib.sha256(normalized.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+# SimHash 특징으로 사용할 단어 shingle 크기
+SIMHASH_SHINGLE_SIZE = 3
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def generate_simhash(body: str) -> int:
+    """본문 SimHash 생성 (64비트, 근사 중복 판정용).
+
+    단어 3-gram shingle의 64비트 해시를 비트별로 다수결하여 지문을 만듭니다.
+    방문자 수나 날짜 한 줄만 다른 본문은 해밍 거리가 작은 지문을 갖습니다.
+    """
+    tokens = _WORD_PATTERN.findall(body.lower())
+    if not tokens:
+        return 0
+
+    size = min(SIMHASH_SHINGLE_SIZE, len(tokens))
+    digests = b"".join(
+        hashlib.blake2b(" ".join(tokens[i : i + size]).encode(), digest_size=8).digest()
+        for i in range(len(tokens) - size + 1)
+    )
+    count = len(digests) // 8
+
+    # 바이트 위치별 값 빈도로 비트별 1의 개수를 집계 (shingle 수와 무관하게 8×256회)
+    fingerprint = 0
+    for pos in range(8):
+        frequency = Counter(digests[pos::8])
+        for bit in range(8):
+            ones = sum(n for value, n in frequency.items() if value >> bit & 1)
+            if ones * 2 > count:
+                fingerprint |= 1 << (pos * 8 + bit)
+    return fingerprint
+
+
+def simhash_distance(a: int, b: int) -> int:
+    """두 SimHash 지문의 해밍 거리."""
+    return (a ^ b).bit_count()
+
+
 class ProcessingStatus(str, Enum):
     """콘텐츠 처리 상태."""
 
@@ -84,6 +137,12 @@ class Content(BaseModel):
 
     # 멱등성 키 (중복 방지)
     content_key: str = Field(..., description="{source_id}:{sha256(normalized_url)}")
+    content_hash: str | None = Field(
+        None, description="sha256(정규화된 제목+본문) - 재게시 중복 방지"
+    )
+    simhash: str | None = Field(
+        None, description="본문 SimHash (16자리 hex) - 근사 중복 방지"
+    )
 
     # 원본 정보
     original_url: str = Field(..., description="원문 URL")
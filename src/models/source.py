@@ -39,6 +39,10 @@ class Source(BaseModel):
     last_fetched_at: datetime | None = Field(None, description="마지막 수집 시간")
     fetch_error_count: int = Field(0, ge=0, description="연속 실패 횟수")
 
+    # HTTP 조건부 요청 검증자 (RSS 피드 재다운로드 방지)
+    etag: str | None = Field(None, description="마지막 응답의 ETag")
+    last_modified: str | None = Field(None, description="마지막 응답의 Last-Modified")
+
     # 메타데이터
     created_at: datetime = Field(..., description="생성 시간")
     updated_at: datetime = Field(..., description="수정 시간")
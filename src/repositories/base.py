@@ -61,6 +61,19 @@ class BaseRepository(Generic[T]):
         data = self._model_to_dict(model)
         self._db.set(self.collection_name, model.id, data)  # type: ignore[attr-defined]
 
+    def create_many(self, models: list[T]) -> None:
+        """여러 문서를 batch write로 한 번에 생성.
+
+        Args:
+            models: 저장할 모델 인스턴스 목록.
+        """
+        if not models:
+            return
+        self._db.set_many(
+            self.collection_name,
+            [(model.id, self._model_to_dict(model)) for model in models],  # type: ignore[attr-defined]
+        )
+
     def update(self, model: T) -> None:
         """문서 업데이트 (전체 교체).
 
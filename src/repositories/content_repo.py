@@ -4,6 +4,7 @@ Firestore contents 컬렉션에 대한 데이터 접근 레이어.
 """
 
 from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 from src.adapters.firestore_client import FirestoreClient
@@ -51,6 +52,48 @@ class ContentRepository(BaseRepository[Content]):
         """
         return self.get_by_content_key(content_key) is not None
 
+    def exists_by_content_hash(self, source_id: str, content_hash: str) -> bool:
+        """소스 내 같은 본문(content_hash)의 콘텐츠 존재 여부 확인.
+
+        Args:
+            source_id: 소스 ID.
+            content_hash: 본문 해시 (generate_content_hash).
+
+        Returns:
+            존재하면 True.
+        """
+        results = self._db.query(
+            self.collection_name,
+            [("source_id", "==", source_id), ("content_hash", "==", content_hash)],
+            fields=["content_hash"],
+        )
+        return bool(results)
+
+    def load_simhashes(self, source_id: str, limit: int) -> list[int]:
+        """소스의 최근 콘텐츠 SimHash 지문 목록 조회.
+
+        collected_at 내림차순으로 최근 limit건의 simhash 필드만 projection으로
+        조회하여, 소스에 쌓인 콘텐츠 수와 무관하게 읽기량을 제한합니다.
+        (source_id ASC, collected_at DESC) 복합 인덱스가 필요합니다
+        (firestore.indexes.json).
+
+        Args:
+            source_id: 소스 ID.
+            limit: 조회할 최근 콘텐츠 수.
+
+        Returns:
+            SimHash 지문 목록 (simhash가 없는 콘텐츠는 제외).
+        """
+        results = self._db.query(
+            self.collection_name,
+            [("source_id", "==", source_id)],
+            fields=["simhash"],
+            order_by="collected_at",
+            descending=True,
+            limit=limit,
+        )
+        return [int(data["simhash"], 16) for data in results if data.get("simhash")]
+
     def find_by_status(self, status: ProcessingStatus) -> list[Content]:
         """상태별 콘텐츠 조회.
 
@@ -121,8 +164,8 @@ class ContentRepository(BaseRepository[Content]):
             and c.included_in_digest_id is None
         ]
 
-        # 관련성 점수로 정렬
-        filtered.sort(key=lambda x: x.relevance_score or 0, reverse=True)
+        # 관련성 점수로 정렬 (None은 위에서 걸러졌으므로 그대로 비교)
+        filtered.sort(key=attrgetter("relevance_score"), reverse=True)
 
         return filtered[:limit]
 
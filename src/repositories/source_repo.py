@@ -78,6 +78,29 @@ class SourceRepository(BaseRepository[Source]):
             },
         )
 
+    def update_cache_headers(
+        self,
+        source_id: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """HTTP 조건부 요청 검증자 업데이트.
+
+        Args:
+            source_id: 소스 ID.
+            etag: 마지막 응답의 ETag.
+            last_modified: 마지막 응답의 Last-Modified.
+        """
+        self._db.update(
+            self.collection_name,
+            source_id,
+            {
+                "etag": etag,
+                "last_modified": last_modified,
+                "updated_at": datetime.now(UTC),
+            },
+        )
+
     def increment_error_count(self, source_id: str) -> None:
         """에러 카운트 증가.
 
@@ -3,8 +3,10 @@
 수집 → 번역 → 요약 → 스코어링 전체 파이프라인을 관리합니다.
 """
 
+import asyncio
+from collections.abc import Coroutine
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import nest_asyncio
 import structlog
@@ -20,6 +22,7 @@ from src.repositories.source_repo import SourceRepository
 
 if TYPE_CHECKING:
     from src.adapters.tasks_client import TasksClient
+    from src.agent.domains.collector.tools.rss_tool import FeedCacheHeaders
 
 # 이미 실행 중인 이벤트 루프 내에서 run_until_complete 허용
 nest_asyncio.apply()
@@ -27,6 +30,24 @@ nest_asyncio.apply()
 logger = structlog.get_logger(__name__)
 
 
+def _run_until_complete(coro: Coroutine[Any, Any, Any]) -> Any:
+    """비동기 함수를 동기 컨텍스트에서 실행.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴 반환값
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(coro)
+
+
 class ContentPipeline:
     """콘텐츠 수집 및 처리 파이프라인.
 
@@ -60,8 +81,10 @@ class ContentPipeline:
     def collect_from_sources(self) -> dict[str, int]:
         """활성 소스에서 콘텐츠 수집.
 
-        수집 후 각 콘텐츠에 대해 Cloud Tasks로 처리 작업을 enqueue합니다.
-        TASKS_MODE=direct일 경우 즉시 처리됩니다.
+        RSS/WEB 소스는 유형별로 fetch_rss_many/fetch_web_many로 한 번에 동시
+        수집하고, 나머지 소스는 순서대로 수집합니다. 수집 후 각 콘텐츠에 대해
+        Cloud Tasks로 처리 작업을 enqueue합니다. TASKS_MODE=direct일 경우 즉시
+        처리됩니다.
 
         Returns:
             수집 결과 통계 (total_sources, collected, enqueued, errors)
@@ -75,9 +98,25 @@ class ContentPipeline:
             "errors": 0,
         }
 
+        # RSS/WEB 소스는 네트워크 대기를 겹치도록 유형별로 먼저 동시 수집
+        batched_results = {
+            **self._collect_from_rss_many(
+                [source for source in sources if source.type == SourceType.RSS]
+            ),
+            **self._collect_from_web_many(
+                [source for source in sources if source.type == SourceType.WEB]
+            ),
+        }
+
         for source in sources:
             try:
-                content_ids = self._collect_from_source(source)
+                if source.id in batched_results:
+                    outcome = batched_results[source.id]
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    content_ids = outcome
+                else:
+                    content_ids = self._collect_from_source(source)
                 result["collected"] += len(content_ids)
 
                 # 수집 성공 시 last_fetched_at 업데이트
@@ -143,15 +182,85 @@ class ContentPipeline:
             수집된 콘텐츠 ID 목록
         """
         # 실제 구현은 rss_tool.fetch_rss 호출
-        from src.agent.domains.collector.tools.rss_tool import fetch_rss
+        from src.agent.domains.collector.tools.rss_tool import (
+            FeedCacheHeaders,
+            fetch_rss,
+        )
 
+        cache_headers = FeedCacheHeaders(
+            etag=source.etag, last_modified=source.last_modified
+        )
         contents = fetch_rss(
             source_id=source.id,
             source_url=str(source.url),
             content_repo=self.content_repo,
+            cache_headers=cache_headers,
         )
+        self._save_cache_headers(source, cache_headers)
+
         return [c.id for c in contents]
 
+    def _collect_from_rss_many(
+        self, sources: list[Source]
+    ) -> dict[str, list[str] | BaseException]:
+        """여러 RSS 소스에서 동시 수집.
+
+        소스별 조건부 요청 검증자를 전달하고, 수집에 성공한 소스는 응답의 새
+        검증자를 저장합니다.
+
+        Args:
+            sources: RSS 소스 목록
+
+        Returns:
+            소스 ID별 수집된 콘텐츠 ID 목록 또는 발생한 예외
+        """
+        if not sources:
+            return {}
+
+        from src.agent.domains.collector.tools.rss_tool import (
+            FeedCacheHeaders,
+            fetch_rss_many,
+        )
+
+        cache_headers = {
+            source.id: FeedCacheHeaders(
+                etag=source.etag, last_modified=source.last_modified
+            )
+            for source in sources
+        }
+        outcomes = _run_until_complete(
+            fetch_rss_many(sources, self.content_repo, cache_headers=cache_headers)
+        )
+
+        results: dict[str, list[str] | BaseException] = {}
+        for source, outcome in zip(sources, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                results[source.id] = outcome
+                continue
+            self._save_cache_headers(source, cache_headers[source.id])
+            results[source.id] = [c.id for c in outcome]
+        return results
+
+    def _save_cache_headers(
+        self, source: Source, cache_headers: "FeedCacheHeaders"
+    ) -> None:
+        """바뀐 피드 캐시 검증자를 소스에 저장.
+
+        다음 수집에서 조건부 요청(304)을 받을 수 있도록 응답의 ETag/Last-Modified를
+        저장하며, 값이 그대로면 쓰지 않습니다.
+
+        Args:
+            source: RSS 소스
+            cache_headers: 응답으로 갱신된 검증자
+        """
+        if (cache_headers.etag, cache_headers.last_modified) != (
+            source.etag,
+            source.last_modified,
+        ):
+            self.source_repo.update_cache_headers(
+                source.id, cache_headers.etag, cache_headers.last_modified
+            )
+
     def _collect_from_youtube(self, source: Source) -> list[str]:
         """YouTube 소스에서 수집.
 
@@ -202,8 +311,6 @@ class ContentPipeline:
         Returns:
             수집된 콘텐츠 ID 목록
         """
-        import asyncio
-
         from src.agent.domains.collector.tools.web_scraper_tool import (
             WebScraperConfig,
             fetch_web,
@@ -213,13 +320,7 @@ class ContentPipeline:
         config = WebScraperConfig.from_source_config(source.config)
 
         # 비동기 함수를 동기 컨텍스트에서 실행
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        contents = loop.run_until_complete(
+        contents = _run_until_complete(
             fetch_web(
                 source_id=source.id,
                 source_url=str(source.url),
@@ -230,6 +331,36 @@ class ContentPipeline:
 
         return [c.id for c in contents]
 
+    def _collect_from_web_many(
+        self, sources: list[Source]
+    ) -> dict[str, list[str] | BaseException]:
+        """여러 WEB 소스에서 동시 수집.
+
+        실제 페이지 요청 수는 스크래퍼의 공유 세마포어
+        (SCRAPING_MAX_CONCURRENT_FETCHES)로 제한됩니다.
+
+        Args:
+            sources: WEB 소스 목록
+
+        Returns:
+            소스 ID별 수집된 콘텐츠 ID 목록 또는 발생한 예외
+        """
+        if not sources:
+            return {}
+
+        from src.agent.domains.collector.tools.web_scraper_tool import fetch_web_many
+
+        outcomes = _run_until_complete(fetch_web_many(sources, self.content_repo))
+
+        return {
+            source.id: (
+                outcome
+                if isinstance(outcome, BaseException)
+                else [c.id for c in outcome]
+            )
+            for source, outcome in zip(sources, outcomes, strict=True)
+        }
+
     def _handle_process_task(self, payload: dict[str, str]) -> None:
         """Cloud Tasks process 핸들러 (direct 모드용).
 
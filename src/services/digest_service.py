@@ -1,6 +1,7 @@
 """Digest service for creating and sending digests."""
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime
 
 from src.adapters.slack_client import SlackClient
@@ -12,6 +13,9 @@ from src.repositories.content_repo import ContentRepository
 from src.repositories.digest_repo import DigestRepository
 from src.repositories.subscription_repo import SubscriptionRepository
 
+# 동시에 발송할 최대 채널 수 (같은 채널의 다이제스트는 순차 발송)
+MAX_CONCURRENT_DIGESTS = 4
+
 
 class DigestService:
     """다이제스트 생성 및 발송 서비스."""
@@ -22,6 +26,7 @@ class DigestService:
         digest_repo: DigestRepository,
         subscription_repo: SubscriptionRepository,
         slack_client: SlackClient,
+        batch_messages: bool = False,
     ) -> None:
         """DigestService 초기화.
 
@@ -30,11 +35,13 @@ class DigestService:
             digest_repo: 다이제스트 리포지토리
             subscription_repo: 구독 리포지토리
             slack_client: Slack 클라이언트
+            batch_messages: 여러 콘텐츠를 한 메시지로 묶어 발송할지 여부
         """
         self.content_repo = content_repo
         self.digest_repo = digest_repo
         self.subscription_repo = subscription_repo
         self.slack_client = slack_client
+        self.batch_messages = batch_messages
 
     def create_digest(
         self,
@@ -107,6 +114,7 @@ class DigestService:
                 digest=digest,
                 contents=contents,
                 slack_client=self.slack_client,
+                batch=self.batch_messages,
             )
 
             if result.success and result.message_ts:
@@ -127,29 +135,58 @@ class DigestService:
             self.digest_repo.mark_as_failed(digest.id, str(e))
             return False
 
+    def send_digests(self, digests: list[Digest]) -> list[bool]:
+        """여러 다이제스트를 채널 단위로 병렬 발송.
+
+        구독마다 채널이 다르다는 보장이 없으므로 channel_id별로 묶어, 같은
+        채널의 다이제스트는 입력 순서대로 한 작업에서 순차 발송하고 서로 다른
+        채널은 최대 MAX_CONCURRENT_DIGESTS개를 동시에 발송합니다. 한 다이제스트
+        안의 메시지는 send_digest에서 관련성 순서대로 순차 발송됩니다.
+
+        Args:
+            digests: 발송할 다이제스트 목록
+
+        Returns:
+            입력 순서와 같은 발송 성공 여부 목록
+        """
+        if not digests:
+            return []
+
+        by_channel: dict[str, list[int]] = {}
+        for index, digest in enumerate(digests):
+            by_channel.setdefault(digest.channel_id, []).append(index)
+
+        outcomes = [False] * len(digests)
+
+        def _send_channel(indices: list[int]) -> None:
+            for index in indices:
+                outcomes[index] = self.send_digest(digests[index])
+
+        workers = min(MAX_CONCURRENT_DIGESTS, len(by_channel))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list()로 소비해 작업 중 발생한 예외를 전파
+            list(executor.map(_send_channel, by_channel.values()))
+
+        return outcomes
+
     def process_pending_digests(self) -> dict[str, int]:
         """대기 중인 다이제스트 일괄 처리.
 
+        send_digests로 채널 단위 병렬 발송합니다.
+
         Returns:
             처리 결과 통계 (total, sent, failed)
         """
         pending = self.digest_repo.find_pending_for_sending()
+        outcomes = self.send_digests(pending)
+        sent = sum(outcomes)
 
-        results = {
+        return {
             "total": len(pending),
-            "sent": 0,
-            "failed": 0,
+            "sent": sent,
+            "failed": len(outcomes) - sent,
         }
 
-        for digest in pending:
-            success = self.send_digest(digest)
-            if success:
-                results["sent"] += 1
-            else:
-                results["failed"] += 1
-
-        return results
-
     def get_due_subscriptions(self, delivery_time: str) -> list[Subscription]:
         """배송 시간에 맞는 구독 조회.
 
@@ -5,6 +5,7 @@
 
 import re
 from datetime import UTC, datetime, timedelta
+from operator import attrgetter
 
 import structlog
 
@@ -253,7 +254,7 @@ class QualityFilter:
         # 수집일 기준 내림차순 정렬 (최신이 먼저)
         sorted_contents = sorted(
             contents,
-            key=lambda c: c.collected_at,
+            key=attrgetter("collected_at"),
             reverse=True,
         )
 
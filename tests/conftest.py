@@ -6,6 +6,27 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from tests.utils import is_emulator_available
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Firestore 에뮬레이터가 없으면 integration 테스트를 일괄 스킵.
+
+    에뮬레이터 프로브는 integration 테스트가 수집된 경우에만
+    세션당 한 번 수행됩니다.
+    """
+    integration_items = [item for item in items if "integration" in item.keywords]
+    if not integration_items or is_emulator_available():
+        return
+
+    skip_no_emulator = pytest.mark.skip(
+        reason="Firestore emulator not available at FIRESTORE_EMULATOR_HOST"
+    )
+    for item in integration_items:
+        item.add_marker(skip_no_emulator)
+
 
 @pytest.fixture(autouse=True)
 def set_test_env() -> None:
@@ -16,16 +16,10 @@ from src.models.content import Content, ProcessingStatus
 from src.repositories.content_repo import ContentRepository
 from src.repositories.source_repo import SourceRepository
 from src.services.content_pipeline import ContentPipeline
-from tests.utils import is_emulator_available
+from tests.utils import get_cached_firestore_client
 
-# Firestore 에뮬레이터가 없으면 테스트 스킵
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(
-        not is_emulator_available(),
-        reason="Firestore emulator not available at FIRESTORE_EMULATOR_HOST",
-    ),
-]
+# Firestore 에뮬레이터 미가용 시 스킵은 tests/conftest.py에서 일괄 처리
+pytestmark = pytest.mark.integration
 
 
 class TestProcessingFlowIntegration:
@@ -34,7 +28,7 @@ class TestProcessingFlowIntegration:
     @pytest.fixture
     def firestore_client(self) -> FirestoreClient:
         """실제 Firestore 에뮬레이터 클라이언트."""
-        return FirestoreClient(project_id="ax-content-hub-test")
+        return get_cached_firestore_client("ax-content-hub-test")
 
     @pytest.fixture
     def source_repo(self, firestore_client: FirestoreClient) -> SourceRepository:
@@ -5,7 +5,7 @@ Firestore 에뮬레이터와 함께 YouTube STT 폴백 파이프라인을 테스
 
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -16,19 +16,12 @@ from src.agent.domains.collector.tools.youtube_tool import (
     fetch_youtube,
 )
 from src.models.content import ProcessingStatus
-from src.models.source import Source, SourceType
 from src.repositories.content_repo import ContentRepository
 from src.repositories.source_repo import SourceRepository
-from tests.utils import is_emulator_available
+from tests.utils import get_cached_firestore_client
 
-# Firestore 에뮬레이터가 없으면 테스트 스킵
-pytestmark = [
-    pytest.mark.integration,
-    pytest.mark.skipif(
-        not is_emulator_available(),
-        reason="Firestore emulator not available at FIRESTORE_EMULATOR_HOST",
-    ),
-]
+# Firestore 에뮬레이터 미가용 시 스킵은 tests/conftest.py에서 일괄 처리
+pytestmark = pytest.mark.integration
 
 
 class TestYouTubeSTTFlowIntegration:
@@ -42,7 +35,7 @@ class TestYouTubeSTTFlowIntegration:
     @pytest.fixture
     def firestore_client(self, unique_project: str) -> FirestoreClient:
         """실제 Firestore 에뮬레이터 클라이언트 (테스트별 격리)."""
-        return FirestoreClient(project_id=unique_project)
+        return get_cached_firestore_client(unique_project)
 
     @pytest.fixture
     def source_repo(self, firestore_client: FirestoreClient) -> SourceRepository:
@@ -60,10 +53,10 @@ class TestYouTubeSTTFlowIntegration:
         return f"src_test_{uuid.uuid4().hex[:8]}"
 
     @pytest.fixture
-    def test_youtube_source(
+    def test_youtube_source_id(
         self, source_repo: SourceRepository, test_source_id: str
-    ) -> Source:
-        """테스트용 YouTube 소스 생성."""
+    ) -> str:
+        """테스트용 YouTube 소스를 Firestore에 저장하고 ID 반환."""
         now = datetime.now(UTC)
         source_url = "https://www.youtube.com/@anthropic-ai"
 
@@ -85,28 +78,55 @@ class TestYouTubeSTTFlowIntegration:
             },
         )
 
-        return Source(
-            id=test_source_id,
-            name="Anthropic AI Channel",
-            type=SourceType.YOUTUBE,
-            url=source_url,
-            is_active=True,
-            created_at=now,
-            updated_at=now,
-        )
-
-    def test_youtube_with_transcript_saves_to_firestore(
+        return test_source_id
+
+    @pytest.mark.parametrize(
+        ("video_id", "video_url", "video_title", "text", "language"),
+        [
+            pytest.param(
+                "dQw4w9WgXcQ",
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "Test Video with Captions",
+                "This is a test transcript from YouTube captions. "
+                "Claude is an AI assistant made by Anthropic.",
+                "en",
+                id="saves_to_firestore",
+            ),
+            pytest.param(
+                "testVideo123",
+                "https://youtu.be/testVideo123",
+                "URL Test Video",
+                "Test content for URL normalization.",
+                "en",
+                id="url_normalization",
+            ),
+            pytest.param(
+                "koreanVid123",
+                "https://www.youtube.com/watch?v=koreanVid123",
+                "한국어 테스트 영상",
+                "안녕하세요. 이것은 한국어 자막 테스트입니다. "
+                "Claude는 Anthropic에서 만든 AI 어시스턴트입니다.",
+                "ko",
+                id="korean_transcript",
+            ),
+        ],
+    )
+    def test_youtube_with_transcript(
         self,
-        test_youtube_source: Source,
+        test_youtube_source_id: str,
         content_repo: ContentRepository,
+        video_id: str,
+        video_url: str,
+        video_title: str,
+        text: str,
+        language: str,
     ) -> None:
-        """자막이 있는 YouTube 영상이 Firestore에 저장되는지 확인."""
+        """자막이 있는 YouTube 영상이 정규화된 URL로 Firestore에 저장되는지 확인."""
         mock_transcript = YouTubeTranscript(
-            video_id="dQw4w9WgXcQ",
-            text="This is a test transcript from YouTube captions. "
-            "Claude is an AI assistant made by Anthropic.",
-            language="en",
-            duration_seconds=180.5,
+            video_id=video_id,
+            text=text,
+            language=language,
+            duration_seconds=120.0,
         )
 
         with patch(
@@ -114,28 +134,31 @@ class TestYouTubeSTTFlowIntegration:
             return_value=mock_transcript,
         ):
             result = fetch_youtube(
-                source_id=test_youtube_source.id,
-                video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                video_title="Test Video with Captions",
+                source_id=test_youtube_source_id,
+                video_url=video_url,
+                video_title=video_title,
                 content_repo=content_repo,
+                languages=[language, "en"],
             )
 
             # 콘텐츠가 생성되었는지 확인
             assert result is not None
-            assert result.source_id == test_youtube_source.id
-            assert result.original_title == "Test Video with Captions"
-            assert result.original_body == mock_transcript.text
-            assert result.original_language == "en"
+            assert result.source_id == test_youtube_source_id
+            assert result.original_title == video_title
+            assert result.original_body == text
+            assert result.original_language == language
             assert result.processing_status == ProcessingStatus.PENDING
+            # 정규화된 URL 확인
+            assert result.original_url == f"https://www.youtube.com/watch?v={video_id}"
 
             # Firestore에서 조회
             saved = content_repo.get_by_id(result.id)
             assert saved is not None
-            assert "youtube.com" in saved.original_url
+            assert saved.original_url == result.original_url
 
     def test_youtube_stt_fallback_when_no_transcript(
         self,
-        test_youtube_source: Source,
+        test_youtube_source_id: str,
         content_repo: ContentRepository,
     ) -> None:
         """자막이 없을 때 STT 폴백이 동작하는지 확인."""
@@ -147,6 +170,10 @@ class TestYouTubeSTTFlowIntegration:
             duration_seconds=120.0,
         )
 
+        async def fake_fetch_youtube_with_stt(video_id: str) -> TranscriptionResult:
+            # AsyncMock 대신 단순 코루틴 함수로 대체 (호출 기록 불필요)
+            return mock_stt_result
+
         with (
             patch(
                 "src.agent.domains.collector.tools.youtube_tool.get_transcript",
@@ -157,15 +184,14 @@ class TestYouTubeSTTFlowIntegration:
             ) as mock_settings,
             patch(
                 "src.agent.domains.collector.tools.youtube_tool.fetch_youtube_with_stt",
-                new_callable=AsyncMock,
-                return_value=mock_stt_result,
+                new=fake_fetch_youtube_with_stt,
             ),
         ):
             # STT 활성화
             mock_settings.return_value = MagicMock(STT_ENABLED=True)
 
             result = fetch_youtube(
-                source_id=test_youtube_source.id,
+                source_id=test_youtube_source_id,
                 video_url="https://www.youtube.com/watch?v=abc123xyz99",
                 video_title="Test Video without Captions",
                 content_repo=content_repo,
@@ -178,7 +204,7 @@ class TestYouTubeSTTFlowIntegration:
 
     def test_youtube_deduplication(
         self,
-        test_youtube_source: Source,
+        test_youtube_source_id: str,
         content_repo: ContentRepository,
     ) -> None:
         """중복 YouTube 영상은 다시 수집되지 않는지 확인."""
@@ -195,7 +221,7 @@ class TestYouTubeSTTFlowIntegration:
         ):
             # 첫 번째 수집
             first_result = fetch_youtube(
-                source_id=test_youtube_source.id,
+                source_id=test_youtube_source_id,
                 video_url="https://www.youtube.com/watch?v=unique123abc",
                 video_title="Unique Video",
                 content_repo=content_repo,
@@ -204,7 +230,7 @@ class TestYouTubeSTTFlowIntegration:
 
             # 두 번째 수집 (동일 video ID)
             second_result = fetch_youtube(
-                source_id=test_youtube_source.id,
+                source_id=test_youtube_source_id,
                 video_url="https://www.youtube.com/watch?v=unique123abc",
                 video_title="Unique Video",
                 content_repo=content_repo,
@@ -214,12 +240,12 @@ class TestYouTubeSTTFlowIntegration:
             assert second_result is None
 
             # Firestore에는 하나만 존재
-            all_contents = content_repo.find_by_source(test_youtube_source.id)
+            all_contents = content_repo.find_by_source(test_youtube_source_id)
             assert len(all_contents) == 1
 
     def test_youtube_returns_none_when_no_transcript_and_stt_disabled(
         self,
-        test_youtube_source: Source,
+        test_youtube_source_id: str,
         content_repo: ContentRepository,
     ) -> None:
         """자막 없고 STT 비활성화 시 None 반환 확인."""
@@ -236,7 +262,7 @@ class TestYouTubeSTTFlowIntegration:
             mock_settings.return_value = MagicMock(STT_ENABLED=False)
 
             result = fetch_youtube(
-                source_id=test_youtube_source.id,
+                source_id=test_youtube_source_id,
                 video_url="https://www.youtube.com/watch?v=nosttstt123",
                 video_title="Video without STT",
                 content_repo=content_repo,
@@ -244,62 +270,3 @@ class TestYouTubeSTTFlowIntegration:
 
             # 자막도 없고 STT도 비활성화되어 None 반환
             assert result is None
-
-    def test_youtube_url_normalization(
-        self,
-        test_youtube_source: Source,
-        content_repo: ContentRepository,
-    ) -> None:
-        """다양한 YouTube URL 형식이 정규화되는지 확인."""
-        mock_transcript = YouTubeTranscript(
-            video_id="testVideo123",
-            text="Test content for URL normalization.",
-            language="en",
-            duration_seconds=90.0,
-        )
-
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.get_transcript",
-            return_value=mock_transcript,
-        ):
-            # youtu.be 형식으로 수집
-            result = fetch_youtube(
-                source_id=test_youtube_source.id,
-                video_url="https://youtu.be/testVideo123",
-                video_title="URL Test Video",
-                content_repo=content_repo,
-            )
-
-            assert result is not None
-            # 정규화된 URL 확인
-            assert result.original_url == "https://www.youtube.com/watch?v=testVideo123"
-
-    def test_youtube_korean_transcript(
-        self,
-        test_youtube_source: Source,
-        content_repo: ContentRepository,
-    ) -> None:
-        """한국어 자막 수집 확인."""
-        mock_transcript = YouTubeTranscript(
-            video_id="koreanVid123",
-            text="안녕하세요. 이것은 한국어 자막 테스트입니다. "
-            "Claude는 Anthropic에서 만든 AI 어시스턴트입니다.",
-            language="ko",
-            duration_seconds=150.0,
-        )
-
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.get_transcript",
-            return_value=mock_transcript,
-        ):
-            result = fetch_youtube(
-                source_id=test_youtube_source.id,
-                video_url="https://www.youtube.com/watch?v=koreanVid123",
-                video_title="한국어 테스트 영상",
-                content_repo=content_repo,
-                languages=["ko", "en"],
-            )
-
-            assert result is not None
-            assert result.original_language == "ko"
-            assert "한국어" in result.original_body
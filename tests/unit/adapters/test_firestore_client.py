@@ -9,9 +9,8 @@ class TestFirestoreClient:
     """Test FirestoreClient class."""
 
     @pytest.fixture
-    def mock_firestore_db(self) -> MagicMock:
-        """Create a mock Firestore database client."""
-        mock_db = MagicMock()
+    def mock_doc(self) -> MagicMock:
+        """Create a mock Firestore document reference."""
         mock_doc = MagicMock()
         mock_doc.get.return_value = MagicMock(
             exists=True,
@@ -20,6 +19,12 @@ class TestFirestoreClient:
         mock_doc.set = MagicMock()
         mock_doc.update = MagicMock()
         mock_doc.delete = MagicMock()
+        return mock_doc
+
+    @pytest.fixture
+    def mock_firestore_db(self, mock_doc: MagicMock) -> MagicMock:
+        """Create a mock Firestore database client."""
+        mock_db = MagicMock()
         mock_db.collection.return_value.document.return_value = mock_doc
         return mock_db
 
@@ -34,11 +39,11 @@ class TestFirestoreClient:
             assert result == {"field": "value"}
             mock_firestore_db.collection.assert_called_with("test_collection")
 
-    def test_get_document_not_exists(self, mock_firestore_db: MagicMock) -> None:
+    def test_get_document_not_exists(
+        self, mock_firestore_db: MagicMock, mock_doc: MagicMock
+    ) -> None:
         """get should return None when document doesn't exist."""
-        mock_firestore_db.collection.return_value.document.return_value.get.return_value = MagicMock(
-            exists=False
-        )
+        mock_doc.get.return_value = MagicMock(exists=False)
 
         with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
             from src.adapters.firestore_client import FirestoreClient
@@ -48,7 +53,9 @@ class TestFirestoreClient:
 
             assert result is None
 
-    def test_set_document(self, mock_firestore_db: MagicMock) -> None:
+    def test_set_document(
+        self, mock_firestore_db: MagicMock, mock_doc: MagicMock
+    ) -> None:
         """set should create or replace a document."""
         with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
             from src.adapters.firestore_client import FirestoreClient
@@ -57,11 +64,31 @@ class TestFirestoreClient:
             data = {"name": "test", "value": 123}
             client.set("test_collection", "doc_id", data)
 
-            mock_firestore_db.collection.return_value.document.return_value.set.assert_called_once_with(
-                data
-            )
+            mock_doc.set.assert_called_once_with(data)
+
+    def test_set_many_documents(
+        self, mock_firestore_db: MagicMock, mock_doc: MagicMock
+    ) -> None:
+        """set_many should write documents in batches of MAX_BATCH_WRITES."""
+        with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
+            from src.adapters.firestore_client import MAX_BATCH_WRITES, FirestoreClient
 
-    def test_update_document(self, mock_firestore_db: MagicMock) -> None:
+            client = FirestoreClient(project_id="test-project")
+            documents = [
+                (f"doc_{i}", {"value": i}) for i in range(MAX_BATCH_WRITES + 1)
+            ]
+            client.set_many("test_collection", documents)
+
+            batch = mock_firestore_db.batch.return_value
+            assert mock_firestore_db.batch.call_count == 2
+            assert batch.commit.call_count == 2
+            assert batch.set.call_count == MAX_BATCH_WRITES + 1
+            batch.set.assert_called_with(mock_doc, {"value": MAX_BATCH_WRITES})
+            mock_doc.set.assert_not_called()
+
+    def test_update_document(
+        self, mock_firestore_db: MagicMock, mock_doc: MagicMock
+    ) -> None:
         """update should update specific fields in a document."""
         with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
             from src.adapters.firestore_client import FirestoreClient
@@ -70,11 +97,11 @@ class TestFirestoreClient:
             data = {"value": 456}
             client.update("test_collection", "doc_id", data)
 
-            mock_firestore_db.collection.return_value.document.return_value.update.assert_called_once_with(
-                data
-            )
+            mock_doc.update.assert_called_once_with(data)
 
-    def test_delete_document(self, mock_firestore_db: MagicMock) -> None:
+    def test_delete_document(
+        self, mock_firestore_db: MagicMock, mock_doc: MagicMock
+    ) -> None:
         """delete should remove a document."""
         with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
             from src.adapters.firestore_client import FirestoreClient
@@ -82,7 +109,7 @@ class TestFirestoreClient:
             client = FirestoreClient(project_id="test-project")
             client.delete("test_collection", "doc_id")
 
-            mock_firestore_db.collection.return_value.document.return_value.delete.assert_called_once()
+            mock_doc.delete.assert_called_once()
 
     def test_query_documents(self, mock_firestore_db: MagicMock) -> None:
         """query should return matching documents."""
@@ -102,3 +129,53 @@ class TestFirestoreClient:
 
             assert len(results) == 2
             assert results[0]["id"] == "1"
+
+    def test_query_documents_with_fields(self, mock_firestore_db: MagicMock) -> None:
+        """query should apply field projection when fields are given."""
+        mock_query = MagicMock()
+        mock_query.select.return_value.stream.return_value = iter(
+            [MagicMock(to_dict=lambda: {"content_key": "src_001:abcd"})]
+        )
+        mock_firestore_db.collection.return_value.where.return_value = mock_query
+
+        with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
+            from src.adapters.firestore_client import FirestoreClient
+
+            client = FirestoreClient(project_id="test-project")
+            results = client.query(
+                "contents", [("source_id", "==", "src_001")], fields=["content_key"]
+            )
+
+            mock_query.select.assert_called_once_with(["content_key"])
+            assert results == [{"content_key": "src_001:abcd"}]
+
+    def test_query_documents_with_order_and_limit(
+        self, mock_firestore_db: MagicMock
+    ) -> None:
+        """query should apply ordering and limit when given."""
+        mock_query = MagicMock()
+        ordered = mock_query.order_by.return_value
+        ordered.limit.return_value.stream.return_value = iter(
+            [MagicMock(to_dict=lambda: {"id": "1"})]
+        )
+        mock_firestore_db.collection.return_value.where.return_value = mock_query
+
+        with patch("google.cloud.firestore.Client", return_value=mock_firestore_db):
+            from google.cloud import firestore
+
+            from src.adapters.firestore_client import FirestoreClient
+
+            client = FirestoreClient(project_id="test-project")
+            results = client.query(
+                "contents",
+                [("source_id", "==", "src_001")],
+                order_by="collected_at",
+                descending=True,
+                limit=10,
+            )
+
+            mock_query.order_by.assert_called_once_with(
+                "collected_at", direction=firestore.Query.DESCENDING
+            )
+            ordered.limit.assert_called_once_with(10)
+            assert results == [{"id": "1"}]
@@ -1,5 +1,6 @@
 """Tests for GeminiClient."""
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,20 +8,30 @@ import pytest
 from src.adapters.gemini_client import GeminiClient
 
 
+@pytest.fixture(scope="class")
+def mock_genai_client() -> MagicMock:
+    """Mock google.genai.Client (클래스 내 공유)."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="class")
+def client(mock_genai_client: MagicMock) -> GeminiClient:
+    """GeminiClient with mock genai.Client (클래스 내 공유)."""
+    with patch("src.adapters.gemini_client.genai") as mock_genai:
+        mock_genai.Client.return_value = mock_genai_client
+        return GeminiClient(api_key="test-api-key")
+
+
 class TestGeminiClient:
     """Tests for GeminiClient."""
 
-    @pytest.fixture
-    def mock_genai_client(self) -> MagicMock:
-        """Mock google.genai.Client."""
-        return MagicMock()
-
-    @pytest.fixture
-    def client(self, mock_genai_client: MagicMock) -> GeminiClient:
-        """GeminiClient with mock genai.Client."""
-        with patch("src.adapters.gemini_client.genai") as mock_genai:
-            mock_genai.Client.return_value = mock_genai_client
-            return GeminiClient(api_key="test-api-key")
+    @pytest.fixture(autouse=True)
+    def _reset_genai(self, mock_genai_client: MagicMock) -> Iterator[None]:
+        """테스트마다 generate_content 호출 기록/반환값 초기화."""
+        yield
+        mock_genai_client.models.generate_content.reset_mock(
+            return_value=True, side_effect=True
+        )
 
     def test_init_with_api_key(self) -> None:
         """API 키로 초기화."""
@@ -1,21 +1,70 @@
 """Tests for RSS collection tool."""
 
+import threading
+import time
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import feedparser
+import httpx
 import pytest
 
 from src.agent.domains.collector.tools.rss_tool import (
+    FeedCacheHeaders,
     RSSEntry,
+    _detect_feed_type,
+    _fetch_feed,
     fetch_rss,
+    fetch_rss_many,
     parse_rss_feed,
 )
+from src.models.content import generate_content_hash, generate_content_key
+from src.models.source import Source, SourceType
+from src.repositories.content_repo import ContentRepository
+
+
+def _make_rss_xml(item_count: int) -> bytes:
+    """item_count개 엔트리를 가진 RSS 2.0 피드 XML 생성."""
+    items = "".join(
+        f"<item><title>Article {i}</title>"
+        f"<link>https://example.com/article/{i}</link>"
+        f"<description>Summary {i}</description></item>"
+        for i in range(item_count)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'
+    ).encode()
+
+
+def _make_response(
+    content: bytes = b"",
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """피드 다운로드 응답 생성."""
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers={"content-type": "application/rss+xml", **(headers or {})},
+        request=httpx.Request("GET", "https://example.com/feed.xml"),
+    )
 
 
 class TestParseRssFeed:
     """Tests for parse_rss_feed function."""
 
+    @pytest.fixture(autouse=True)
+    def mock_fetch_feed(self) -> Iterator[MagicMock]:
+        """피드 다운로드 mock (네트워크 차단)."""
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool._fetch_feed",
+            return_value=_make_response(),
+        ) as mock_fetch:
+            yield mock_fetch
+
     @pytest.fixture
     def mock_feed_entry(self) -> dict[str, Any]:
         """Mock feedparser entry."""
@@ -92,6 +141,35 @@ class TestParseRssFeed:
             assert entries[0].published_at is not None
             assert entries[0].published_at.year == 2025
 
+    @pytest.mark.parametrize(
+        "published",
+        [
+            pytest.param("Fri, 26 Dec 2025 18:00:00 +0900", id="rfc822"),
+            pytest.param("2025-12-26T09:00:00Z", id="iso8601"),
+        ],
+    )
+    def test_parse_feed_published_date_string_fallback(
+        self, mock_feed_entry: dict, published: str
+    ) -> None:
+        """published_parsed 없으면 published 문자열로 발행일 파싱 (UTC 변환)."""
+        del mock_feed_entry["published_parsed"]
+        mock_feed_entry["published"] = published
+
+        mock_feed = MagicMock()
+        mock_feed.entries = [mock_feed_entry]
+        mock_feed.bozo = False
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.feedparser.parse"
+        ) as mock_parse:
+            mock_parse.return_value = mock_feed
+
+            entries = parse_rss_feed("https://example.com/feed.xml")
+
+            assert entries[0].published_at == datetime(
+                2025, 12, 26, 9, 0, 0, tzinfo=UTC
+            )
+
     def test_parse_feed_no_published_date(self, mock_feed_entry: dict) -> None:
         """발행일 없는 경우."""
         del mock_feed_entry["published_parsed"]
@@ -159,6 +237,213 @@ class TestParseRssFeed:
 
             assert len(entries) == 5
 
+    def test_parse_limit_truncates_before_feedparser(
+        self, mock_fetch_feed: MagicMock
+    ) -> None:
+        """feedparser 폴백 시 limit 이후 엔트리는 전달하지 않음."""
+        mock_fetch_feed.return_value = _make_response(_make_rss_xml(50))
+
+        with (
+            patch(
+                "src.agent.domains.collector.tools.rss_tool._detect_feed_type",
+                return_value=None,
+            ),
+            patch(
+                "src.agent.domains.collector.tools.rss_tool.feedparser.parse",
+                wraps=feedparser.parse,
+            ) as mock_parse,
+        ):
+            entries = parse_rss_feed("https://example.com/feed.xml", limit=3)
+
+            assert [e.title for e in entries] == [
+                "Article 0",
+                "Article 1",
+                "Article 2",
+            ]
+            parsed_xml = mock_parse.call_args[0][0]
+            assert parsed_xml.count(b"<item>") == 3
+
+    def test_parse_native_rss_skips_feedparser(
+        self, mock_fetch_feed: MagicMock
+    ) -> None:
+        """RSS 2.0 피드는 feedparser 없이 limit개까지 파싱."""
+        mock_fetch_feed.return_value = _make_response(_make_rss_xml(50))
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.feedparser.parse"
+        ) as mock_parse:
+            entries = parse_rss_feed("https://example.com/feed.xml", limit=3)
+
+        mock_parse.assert_not_called()
+        assert [(e.title, e.url, e.body) for e in entries] == [
+            (f"Article {i}", f"https://example.com/article/{i}", f"Summary {i}")
+            for i in range(3)
+        ]
+
+    def test_parse_native_rss_fields(self, mock_fetch_feed: MagicMock) -> None:
+        """content:encoded 우선, isPermaLink guid 링크, 상대 링크 해석."""
+        mock_fetch_feed.return_value = _make_response(
+            b'<?xml version="1.0"?>'
+            b'<rss version="2.0" '
+            b'xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+            b"<channel><title>Feed</title>"
+            b"<item><title>Full</title><link>/posts/1</link>"
+            b"<description>Summary</description>"
+            b"<content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>"
+            b"<pubDate>Fri, 26 Dec 2025 18:00:00 +0900</pubDate></item>"
+            b"<item><title>Guid</title><guid>https://example.com/guid</guid></item>"
+            b'<item><title>No link</title><guid isPermaLink="false">x</guid></item>'
+            b"</channel></rss>"
+        )
+
+        entries = parse_rss_feed("https://example.com/feed.xml")
+
+        assert [(e.title, e.url, e.body) for e in entries] == [
+            ("Full", "https://example.com/posts/1", "<p>Full body</p>"),
+            ("Guid", "https://example.com/guid", None),
+        ]
+        assert entries[0].published_at == datetime(2025, 12, 26, 9, 0, tzinfo=UTC)
+
+    def test_parse_native_atom(self, mock_fetch_feed: MagicMock) -> None:
+        """Atom 피드: alternate 링크, content > summary, published."""
+        mock_fetch_feed.return_value = _make_response(
+            b'<?xml version="1.0" encoding="utf-8"?>'
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>'
+            b"<entry><title>Atom 1</title>"
+            b'<link rel="self" href="https://example.com/self"/>'
+            b'<link href="https://example.com/atom/1"/>'
+            b"<published>2025-12-26T09:00:00Z</published>"
+            b"<summary>Summary</summary>"
+            b'<content type="html">&lt;p&gt;Body&lt;/p&gt;</content></entry>'
+            b"</feed>"
+        )
+
+        entries = parse_rss_feed("https://example.com/feed.xml")
+
+        assert len(entries) == 1
+        assert entries[0].url == "https://example.com/atom/1"
+        assert entries[0].body == "<p>Body</p>"
+        assert entries[0].published_at == datetime(2025, 12, 26, 9, 0, tzinfo=UTC)
+
+    def test_parse_native_falls_back_on_xhtml(self, mock_fetch_feed: MagicMock) -> None:
+        """xhtml 콘텐츠처럼 처리하지 않는 구조는 feedparser로 폴백."""
+        mock_fetch_feed.return_value = _make_response(
+            b'<feed xmlns="http://www.w3.org/2005/Atom">'
+            b'<entry><title>X</title><link href="https://example.com/x"/>'
+            b'<content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">'
+            b"<p>Body</p></div></content></entry></feed>"
+        )
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.feedparser.parse",
+            wraps=feedparser.parse,
+        ) as mock_parse:
+            entries = parse_rss_feed("https://example.com/feed.xml")
+
+        mock_parse.assert_called_once()
+        assert entries[0].title == "X"
+
+    def test_parse_feed_not_modified(self, mock_fetch_feed: MagicMock) -> None:
+        """304 응답이면 feedparser 호출 없이 빈 목록 반환."""
+        mock_fetch_feed.return_value = _make_response(status_code=304)
+        cache_headers = FeedCacheHeaders(
+            etag='"abc123"', last_modified="Fri, 26 Dec 2025 09:00:00 GMT"
+        )
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.feedparser.parse"
+        ) as mock_parse:
+            entries = parse_rss_feed(
+                "https://example.com/feed.xml", cache_headers=cache_headers
+            )
+
+        assert entries == []
+        mock_parse.assert_not_called()
+        mock_fetch_feed.assert_called_once_with(
+            "https://example.com/feed.xml", cache_headers
+        )
+        assert cache_headers.etag == '"abc123"'
+
+    def test_parse_feed_updates_cache_headers(self, mock_fetch_feed: MagicMock) -> None:
+        """200 응답의 ETag/Last-Modified로 검증자 갱신."""
+        mock_fetch_feed.return_value = _make_response(
+            _make_rss_xml(1),
+            headers={
+                "etag": '"new-etag"',
+                "last-modified": "Sat, 27 Dec 2025 09:00:00 GMT",
+            },
+        )
+        cache_headers = FeedCacheHeaders(etag='"old-etag"')
+
+        entries = parse_rss_feed(
+            "https://example.com/feed.xml", cache_headers=cache_headers
+        )
+
+        assert len(entries) == 1
+        assert cache_headers.etag == '"new-etag"'
+        assert cache_headers.last_modified == "Sat, 27 Dec 2025 09:00:00 GMT"
+
+    def test_parse_http_error(self, mock_fetch_feed: MagicMock) -> None:
+        """피드 다운로드 실패 시 ValueError."""
+        mock_fetch_feed.side_effect = httpx.ConnectError("connection refused")
+
+        with pytest.raises(ValueError) as exc_info:
+            parse_rss_feed("https://example.com/feed.xml")
+
+        assert "Failed to parse RSS" in str(exc_info.value)
+
+
+class TestDetectFeedType:
+    """Tests for _detect_feed_type function."""
+
+    @pytest.mark.parametrize(
+        ("head", "expected"),
+        [
+            (b'<?xml version="1.0"?>\n<rss version="2.0">', "rss"),
+            (b'<feed xmlns="http://www.w3.org/2005/Atom">', "atom"),
+            (b'<atom:feed xmlns:atom="http://www.w3.org/2005/Atom">', "atom"),
+            (b"<rdf:RDF xmlns:rdf=", "rdf"),
+            (b"<html><body>Not a feed</body></html>", None),
+            (b"", None),
+        ],
+        ids=["rss", "atom", "atom_prefixed", "rdf", "html", "empty"],
+    )
+    def test_detect_feed_type(self, head: bytes, expected: str | None) -> None:
+        """루트 요소로 피드 형식 판별."""
+        assert _detect_feed_type(head) == expected
+
+
+class TestFetchFeed:
+    """Tests for _fetch_feed function."""
+
+    def test_fetch_feed_sends_conditional_headers(self) -> None:
+        """검증자가 있으면 If-None-Match / If-Modified-Since 전송."""
+        requests: list[httpx.Request] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(304)
+
+        real_client = httpx.Client
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.httpx.Client",
+            side_effect=lambda **kwargs: real_client(
+                transport=httpx.MockTransport(_handler), **kwargs
+            ),
+        ):
+            response = _fetch_feed(
+                "https://example.com/feed.xml",
+                FeedCacheHeaders(
+                    etag='"abc123"', last_modified="Fri, 26 Dec 2025 09:00:00 GMT"
+                ),
+            )
+
+        assert response.status_code == 304
+        assert requests[0].headers["If-None-Match"] == '"abc123"'
+        assert (
+            requests[0].headers["If-Modified-Since"] == "Fri, 26 Dec 2025 09:00:00 GMT"
+        )
+
 
 class TestFetchRss:
     """Tests for fetch_rss tool function."""
@@ -166,7 +451,10 @@ class TestFetchRss:
     @pytest.fixture
     def mock_content_repo(self) -> MagicMock:
         """Mock ContentRepository."""
-        return MagicMock()
+        repo = MagicMock(spec=ContentRepository)
+        repo.exists_by_content_key.return_value = False
+        repo.exists_by_content_hash.return_value = False
+        return repo
 
     @pytest.fixture
     def sample_entries(self) -> list[RSSEntry]:
@@ -206,7 +494,44 @@ class TestFetchRss:
             )
 
             assert len(results) == 2
-            assert mock_content_repo.create.call_count == 2
+            # 신규 엔트리는 batch write 한 번으로 저장
+            mock_content_repo.create_many.assert_called_once_with(results)
+            mock_content_repo.create.assert_not_called()
+            assert mock_content_repo.exists_by_content_key.call_count == 2
+
+    def test_fetch_rss_lookups_bounded_by_entries(
+        self,
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """중복 확인은 엔트리별 조회만 하고 소스 전체 콘텐츠를 읽지 않음."""
+        entries = [
+            RSSEntry(
+                title=f"Article {i}",
+                url=f"https://example.com/article/{i}",
+                body=f"Content {i}",
+                published_at=None,
+            )
+            for i in range(5)
+        ]
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=entries,
+        ):
+            fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+                limit=5,
+            )
+
+        assert mock_content_repo.exists_by_content_key.call_count == len(entries)
+        called = {name for name, _, _ in mock_content_repo.method_calls}
+        assert called <= {
+            "exists_by_content_key",
+            "exists_by_content_hash",
+            "create_many",
+        }
 
     def test_fetch_rss_skip_duplicates(
         self,
@@ -215,7 +540,10 @@ class TestFetchRss:
     ) -> None:
         """중복 콘텐츠 건너뛰기."""
         # 첫 번째 엔트리만 이미 존재
-        mock_content_repo.exists_by_content_key.side_effect = [True, False]
+        existing_key = generate_content_key("src_001", sample_entries[0].url)
+        mock_content_repo.exists_by_content_key.side_effect = lambda key: (
+            key == existing_key
+        )
 
         with patch(
             "src.agent.domains.collector.tools.rss_tool.parse_rss_feed"
@@ -229,7 +557,8 @@ class TestFetchRss:
             )
 
             assert len(results) == 1
-            assert mock_content_repo.create.call_count == 1
+            assert results[0].original_title == "Article 2"
+            mock_content_repo.create_many.assert_called_once_with(results)
 
     def test_fetch_rss_all_duplicates(
         self,
@@ -251,7 +580,151 @@ class TestFetchRss:
             )
 
             assert len(results) == 0
-            assert mock_content_repo.create.call_count == 0
+            mock_content_repo.create_many.assert_not_called()
+
+    def test_fetch_rss_skip_duplicate_url_in_feed(
+        self,
+        mock_content_repo: MagicMock,
+        sample_entries: list[RSSEntry],
+    ) -> None:
+        """같은 피드에 같은 URL이 두 번 있으면 한 번만 조회/저장."""
+        duplicate = RSSEntry(
+            title="Article 1 (again)",
+            url=sample_entries[0].url,
+            body="Different body",
+            published_at=None,
+        )
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=[sample_entries[0], duplicate],
+        ):
+            results = fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+            )
+
+        assert [c.original_title for c in results] == ["Article 1"]
+        mock_content_repo.exists_by_content_key.assert_called_once()
+
+    def test_fetch_rss_skip_by_content_hash(
+        self,
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """URL이 달라도 제목과 본문이 같으면 한 번만 저장."""
+        body = "Same body " * 30
+        entries = [
+            RSSEntry(
+                title="Article",
+                url=f"https://example.com/article/{i}",
+                body=f"  {body}\n",
+                published_at=None,
+            )
+            for i in range(2)
+        ]
+        expected_hash = generate_content_hash(f"Article\n{body}")
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=entries,
+        ):
+            result = fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+            )
+
+        assert len(result) == 1
+        assert result[0].content_hash == expected_hash
+        mock_content_repo.create_many.assert_called_once_with(result)
+        mock_content_repo.exists_by_content_hash.assert_called_once_with(
+            "src_001", expected_hash
+        )
+
+    def test_fetch_rss_keeps_distinct_titles_with_boilerplate_body(
+        self,
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """상용구 요약을 공유해도 제목/URL이 다른 글은 모두 저장."""
+        boilerplate = "Read the full story on our website. " * 10
+        entries = [
+            RSSEntry(
+                title=title,
+                url=f"https://example.com/article/{i}",
+                body=boilerplate,
+                published_at=None,
+            )
+            for i, title in enumerate(["Launch recap", "Quarterly results"])
+        ]
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=entries,
+        ):
+            result = fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+            )
+
+        assert [c.original_title for c in result] == [
+            "Launch recap",
+            "Quarterly results",
+        ]
+        assert result[0].content_hash != result[1].content_hash
+
+    def test_fetch_rss_short_body_skips_content_hash(
+        self,
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """짧은 본문은 해시하지 않고 본문 해시 조회도 생략."""
+        entries = [
+            RSSEntry(
+                title="Article",
+                url=f"https://example.com/article/{i}",
+                body="Click to read more.",
+                published_at=None,
+            )
+            for i in range(2)
+        ]
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=entries,
+        ):
+            result = fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+            )
+
+        assert len(result) == 2
+        assert all(c.content_hash is None for c in result)
+        mock_content_repo.exists_by_content_hash.assert_not_called()
+
+    def test_fetch_rss_skip_existing_content_hash(
+        self,
+        mock_content_repo: MagicMock,
+        sample_entries: list[RSSEntry],
+    ) -> None:
+        """DB에 같은 글이 있으면 건너뜀 (본문 없는 엔트리는 해시 검사 안 함)."""
+        mock_content_repo.exists_by_content_hash.return_value = True
+        sample_entries[0].body = "Long enough body " * 20
+        sample_entries[1].body = None
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=sample_entries,
+        ):
+            result = fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+            )
+
+        assert [c.original_title for c in result] == ["Article 2"]
+        assert result[0].content_hash is None
 
     def test_fetch_rss_content_key_generation(
         self,
@@ -277,11 +750,42 @@ class TestFetchRss:
                 content_repo=mock_content_repo,
             )
 
-            # create가 호출될 때 content_key가 설정되어 있어야 함
-            call_args = mock_content_repo.create.call_args
-            created_content = call_args[0][0]
+            # create_many가 호출될 때 content_key가 설정되어 있어야 함
+            call_args = mock_content_repo.create_many.call_args
+            created_content = call_args[0][0][0]
             assert created_content.content_key.startswith("src_001:")
 
+    def test_fetch_rss_batches_many_entries(
+        self,
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """엔트리가 많아도 저장 호출은 한 번."""
+        entries = [
+            RSSEntry(
+                title=f"Article {i}",
+                url=f"https://example.com/article/{i}",
+                body=f"Body {i}",
+                published_at=None,
+            )
+            for i in range(100)
+        ]
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            return_value=entries,
+        ):
+            results = fetch_rss(
+                source_id="src_001",
+                source_url="https://example.com/feed.xml",
+                content_repo=mock_content_repo,
+                limit=100,
+            )
+
+        assert len(results) == 100
+        mock_content_repo.create_many.assert_called_once()
+        assert len(mock_content_repo.create_many.call_args[0][0]) == 100
+        mock_content_repo.create.assert_not_called()
+
     def test_fetch_rss_error_handling(
         self,
         mock_content_repo: MagicMock,
@@ -300,3 +804,155 @@ class TestFetchRss:
                 )
 
             assert "Failed to parse RSS" in str(exc_info.value)
+
+
+class TestFetchRssMany:
+    """Tests for fetch_rss_many function."""
+
+    PER_CALL_SECONDS = 0.05
+
+    @pytest.fixture
+    def sources(self) -> list[Source]:
+        """10개의 RSS 소스."""
+        now = datetime.now(UTC)
+        return [
+            Source(
+                id=f"src_{i:03d}",
+                name=f"Blog {i}",
+                type=SourceType.RSS,
+                url=f"https://blog{i}.example.com/feed.xml",
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(10)
+        ]
+
+    @pytest.fixture
+    def mock_content_repo(self) -> MagicMock:
+        """Mock ContentRepository (모든 엔트리 신규)."""
+        mock = MagicMock()
+        mock.exists_by_content_key.return_value = False
+        mock.exists_by_content_hash.return_value = False
+        return mock
+
+    @pytest.fixture
+    def slow_parse(self) -> Iterator[dict[str, int]]:
+        """네트워크 대기를 흉내내는 parse_rss_feed 목 (최대 동시 호출 수 기록)."""
+        lock = threading.Lock()
+        stats = {"active": 0, "max_active": 0}
+
+        def _parse(
+            feed_url: str,
+            limit: int = 20,
+            cache_headers: FeedCacheHeaders | None = None,
+        ) -> list[RSSEntry]:
+            with lock:
+                stats["active"] += 1
+                stats["max_active"] = max(stats["max_active"], stats["active"])
+            time.sleep(self.PER_CALL_SECONDS)
+            with lock:
+                stats["active"] -= 1
+            return [
+                RSSEntry(
+                    title=f"Article {i}",
+                    url=f"{feed_url}/article/{i}",
+                    body=f"Body {i}",
+                    published_at=None,
+                )
+                for i in range(2)
+            ]
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            side_effect=_parse,
+        ):
+            yield stats
+
+    async def test_fetch_rss_many_collects_all_sources(
+        self,
+        sources: list[Source],
+        mock_content_repo: MagicMock,
+        slow_parse: dict[str, int],
+    ) -> None:
+        """모든 소스를 동시에 수집하고 직렬 실행보다 빠르게 끝남."""
+        started = time.perf_counter()
+        results = await fetch_rss_many(sources, mock_content_repo, concurrency=4)
+        elapsed = time.perf_counter() - started
+
+        assert len(results) == 10
+        assert all(isinstance(r, list) and len(r) == 2 for r in results)
+        # 소스당 batch write 한 번
+        assert mock_content_repo.create_many.call_count == 10
+        assert elapsed < len(sources) * self.PER_CALL_SECONDS
+
+    async def test_fetch_rss_many_respects_concurrency(
+        self,
+        sources: list[Source],
+        mock_content_repo: MagicMock,
+        slow_parse: dict[str, int],
+    ) -> None:
+        """동시 수집 수가 concurrency를 넘지 않음."""
+        await fetch_rss_many(sources, mock_content_repo, concurrency=2)
+
+        assert slow_parse["max_active"] <= 2
+
+    async def test_fetch_rss_many_sends_cache_headers(
+        self,
+        sources: list[Source],
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """소스별 검증자로 조건부 요청하고 응답 값으로 갱신 (없으면 저장값 사용)."""
+        sources[1].etag = '"stored"'
+        cache_headers = {"src_000": FeedCacheHeaders(etag='"given"')}
+        sent: dict[str, str | None] = {}
+
+        def _parse(
+            feed_url: str,
+            limit: int = 20,
+            cache_headers: FeedCacheHeaders | None = None,
+        ) -> list[RSSEntry]:
+            assert cache_headers is not None
+            sent[feed_url] = cache_headers.etag
+            cache_headers.etag = f"{cache_headers.etag}-new"
+            return []
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            side_effect=_parse,
+        ):
+            await fetch_rss_many(
+                sources[:3], mock_content_repo, cache_headers=cache_headers
+            )
+
+        assert sent == {
+            "https://blog0.example.com/feed.xml": '"given"',
+            "https://blog1.example.com/feed.xml": '"stored"',
+            "https://blog2.example.com/feed.xml": None,
+        }
+        assert cache_headers["src_000"].etag == '"given"-new'
+
+    async def test_fetch_rss_many_isolates_errors(
+        self,
+        sources: list[Source],
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """한 소스의 실패가 다른 소스 수집을 막지 않음."""
+
+        def _parse(
+            feed_url: str,
+            limit: int = 20,
+            cache_headers: FeedCacheHeaders | None = None,
+        ) -> list[RSSEntry]:
+            if "blog3." in feed_url:
+                raise ValueError("Failed to parse RSS feed")
+            return []
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.parse_rss_feed",
+            side_effect=_parse,
+        ):
+            results = await fetch_rss_many(sources, mock_content_repo)
+
+        assert isinstance(results[3], ValueError)
+        assert all(r == [] for i, r in enumerate(results) if i != 3)
@@ -4,11 +4,18 @@
 TDD: Red → Green → Refactor
 """
 
-from datetime import datetime
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import urljoin
 
+import httpx
 import pytest
 
+from src.config.settings import get_settings
+from src.models.source import Source, SourceType
 from src.repositories.content_repo import ContentRepository
 
 # ============================================================================
@@ -16,16 +23,68 @@ from src.repositories.content_repo import ContentRepository
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _reset_stage_hints() -> Iterator[None]:
+    """테스트 간 도메인별 스테이지 힌트와 요청 세마포어 초기화.
+
+    이벤트 루프를 세션 전체에서 공유하므로, 루프별로 캐시되는 세마포어도
+    테스트마다 비워 각 테스트의 SCRAPING_MAX_CONCURRENT_FETCHES가 적용되게 합니다.
+    """
+    from src.agent.domains.collector.tools.web_scraper_tool import (
+        _FETCH_SEMAPHORES,
+        _STAGE_HINTS,
+    )
+
+    yield
+    _STAGE_HINTS.clear()
+    _FETCH_SEMAPHORES.clear()
+
+
+@pytest.fixture
+def mock_http() -> Iterator[Callable[..., MagicMock]]:
+    """공유 HTTP 클라이언트의 stream() 응답 설정 함수.
+
+    반환된 함수에 HTML(또는 side_effect 예외)을 넘기면, 스크래퍼의 HTTP 요청이
+    해당 HTML을 한 청크로 돌려줍니다.
+    """
+    client = MagicMock()
+    with patch(
+        "src.agent.domains.collector.tools.web_scraper_tool._HttpClientPool.get",
+        AsyncMock(return_value=client),
+    ):
+
+        def _serve(html: str = "", side_effect: Exception | None = None) -> MagicMock:
+            response = MagicMock()
+            response.raise_for_status = MagicMock()
+            response.encoding = "utf-8"
+
+            async def _aiter_bytes(
+                chunk_size: int | None = None,
+            ) -> AsyncIterator[bytes]:
+                yield html.encode("utf-8")
+
+            response.aiter_bytes = _aiter_bytes
+
+            stream_ctx = MagicMock()
+            stream_ctx.__aenter__ = AsyncMock(return_value=response)
+            stream_ctx.__aexit__ = AsyncMock(return_value=False)
+            client.stream = MagicMock(return_value=stream_ctx, side_effect=side_effect)
+            return client
+
+        yield _serve
+
+
 @pytest.fixture
 def mock_content_repo() -> MagicMock:
     """Mock ContentRepository fixture."""
     repo = MagicMock(spec=ContentRepository)
     repo.exists_by_content_key.return_value = False
+    repo.load_simhashes.return_value = []
     repo.create.return_value = MagicMock(id="content_001")
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_static() -> str:
     """정적 HTML 샘플 (Stage 1 테스트용)."""
     return """
@@ -48,7 +107,7 @@ def sample_html_static() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_dynamic() -> str:
     """동적 HTML 샘플 (Stage 2 테스트용)."""
     return """
@@ -69,7 +128,7 @@ def sample_html_dynamic() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_structural() -> str:
     """구조적 HTML 샘플 (Stage 3 테스트용)."""
     return """
@@ -91,7 +150,7 @@ def sample_html_structural() -> str:
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_html_with_links() -> str:
     """링크가 있는 HTML 샘플 (Stage 4 테스트용)."""
     return """
@@ -175,6 +234,28 @@ class TestWebScraperConfig:
         assert config.selector is None
         assert config.timeout_seconds == 30
 
+    def test_from_source_config_cached(self) -> None:
+        """같은 설정이면 같은 인스턴스 재사용."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            WebScraperConfig,
+        )
+
+        source_config = {"selector": ".article", "max_posts": 5}
+        first = WebScraperConfig.from_source_config(source_config)
+        second = WebScraperConfig.from_source_config(dict(source_config))
+
+        assert first is second
+        assert WebScraperConfig.from_source_config({"selector": ".other"}) is not first
+
+    def test_from_source_config_unhashable_value(self) -> None:
+        """해시 불가능한 값이 있어도 생성."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            WebScraperConfig,
+        )
+
+        config = WebScraperConfig.from_source_config({"selector": [".a", ".b"]})
+        assert config.selector == [".a", ".b"]
+
     def test_immutable(self) -> None:
         """frozen=True 확인."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -249,6 +330,15 @@ class TestScrapedContent:
         )
         assert content.is_valid() is False
 
+    def test_uses_slots(self) -> None:
+        """인스턴스별 __dict__ 없이 슬롯에 저장."""
+        from src.agent.domains.collector.tools.web_scraper_tool import ScrapedContent
+
+        content = ScrapedContent(url="https://example.com/post", title="T", body="B")
+        assert not hasattr(content, "__dict__")
+        with pytest.raises(AttributeError):
+            content.body = "Modified"  # type: ignore[misc]
+
 
 # ============================================================================
 # T012: Stage 1 (Static HTML) 추출 테스트
@@ -260,7 +350,10 @@ class TestStage1StaticExtraction:
 
     @pytest.mark.asyncio
     async def test_extract_with_selector(
-        self, sample_html_static: str, mock_content_repo: MagicMock
+        self,
+        mock_http: Callable[..., MagicMock],
+        sample_html_static: str,
+        mock_content_repo: MagicMock,
     ) -> None:
         """CSS selector로 정적 콘텐츠 추출."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -270,26 +363,21 @@ class TestStage1StaticExtraction:
 
         config = WebScraperConfig(selector=".blog-post")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_static
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(sample_html_static)
 
-            result = await _extract_stage1_static(
-                url="https://example.com/blog/post-1",
-                config=config,
-            )
+        result = await _extract_stage1_static(
+            url="https://example.com/blog/post-1",
+            config=config,
+        )
 
         assert result is not None
         assert result.extraction_stage == 1
         assert "AI Revolution" in result.title or "AI" in result.body
 
     @pytest.mark.asyncio
-    async def test_extract_without_selector(self, sample_html_static: str) -> None:
+    async def test_extract_without_selector(
+        self, mock_http: Callable[..., MagicMock], sample_html_static: str
+    ) -> None:
         """selector 없이 기본 추출."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
             WebScraperConfig,
@@ -298,26 +386,21 @@ class TestStage1StaticExtraction:
 
         config = WebScraperConfig()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_static
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(sample_html_static)
 
-            result = await _extract_stage1_static(
-                url="https://example.com/blog/post-1",
-                config=config,
-            )
+        result = await _extract_stage1_static(
+            url="https://example.com/blog/post-1",
+            config=config,
+        )
 
         assert result is not None
         # title 태그가 추출됨 (og:title → title → h1 순서)
         assert result.title == "Test Blog Post"
 
     @pytest.mark.asyncio
-    async def test_extract_returns_none_on_short_content(self) -> None:
+    async def test_extract_returns_none_on_short_content(
+        self, mock_http: Callable[..., MagicMock]
+    ) -> None:
         """콘텐츠 길이 미달 시 None 반환."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
             WebScraperConfig,
@@ -327,21 +410,41 @@ class TestStage1StaticExtraction:
         short_html = "<html><body><p>Short</p></body></html>"
         config = WebScraperConfig()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = short_html
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(short_html)
+
+        result = await _extract_stage1_static(
+            url="https://example.com/short",
+            config=config,
+        )
 
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_large_document_parsed_in_worker_thread(
+        self, mock_http: Callable[..., MagicMock], sample_html_static: str
+    ) -> None:
+        """큰 문서는 이벤트 루프 밖(워커 스레드)에서 파싱."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _THREAD_PARSE_MIN_CHARS,
+            WebScraperConfig,
+            _extract_stage1_static,
+        )
+
+        padding = "<!-- " + "x" * _THREAD_PARSE_MIN_CHARS + " -->"
+        mock_http(sample_html_static.replace("</body>", padding + "</body>"))
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as mock_to_thread:
             result = await _extract_stage1_static(
-                url="https://example.com/short",
-                config=config,
+                url="https://example.com/blog/post-1",
+                config=WebScraperConfig(selector=".blog-post"),
             )
 
-        assert result is None
+        assert result is not None
+        assert result.extraction_stage == 1
+        mock_to_thread.assert_called_once()
 
 
 # ============================================================================
@@ -365,24 +468,21 @@ class TestStage2DynamicExtraction:
             wait_for=".post-container",
         )
 
-        with patch(
-            "src.agent.domains.collector.tools.web_scraper_tool.async_playwright"
-        ) as mock_pw:
-            # Mock Playwright
-            mock_page = AsyncMock()
-            mock_page.content.return_value = sample_html_dynamic
-            mock_page.wait_for_selector = AsyncMock()
+        # Mock Playwright
+        mock_page = AsyncMock()
+        mock_page.content.return_value = sample_html_dynamic
+        mock_page.wait_for_selector = AsyncMock()
 
-            mock_context = AsyncMock()
-            mock_context.new_page.return_value = mock_page
+        mock_context = AsyncMock()
+        mock_context.new_page.return_value = mock_page
 
-            mock_browser = AsyncMock()
-            mock_browser.new_context.return_value = mock_context
-
-            mock_pw_instance = AsyncMock()
-            mock_pw_instance.chromium.launch.return_value = mock_browser
-            mock_pw.return_value.__aenter__.return_value = mock_pw_instance
+        mock_browser = AsyncMock()
+        mock_browser.new_context.return_value = mock_context
 
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool._BrowserPool.get",
+            AsyncMock(return_value=mock_browser),
+        ):
             result = await _extract_stage2_dynamic(
                 url="https://example.com/dynamic",
                 config=config,
@@ -390,6 +490,9 @@ class TestStage2DynamicExtraction:
 
         assert result is not None
         assert result.extraction_stage == 2
+        # 브라우저는 공유하고 context만 닫음
+        mock_context.close.assert_awaited_once()
+        mock_browser.close.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_extract_handles_timeout(self) -> None:
@@ -402,12 +505,9 @@ class TestStage2DynamicExtraction:
         config = WebScraperConfig(timeout_seconds=1)
 
         with patch(
-            "src.agent.domains.collector.tools.web_scraper_tool.async_playwright"
-        ) as mock_pw:
-            mock_pw_instance = AsyncMock()
-            mock_pw_instance.chromium.launch.side_effect = TimeoutError("Timeout")
-            mock_pw.return_value.__aenter__.return_value = mock_pw_instance
-
+            "src.agent.domains.collector.tools.web_scraper_tool._BrowserPool.get",
+            AsyncMock(side_effect=TimeoutError("Timeout")),
+        ):
             result = await _extract_stage2_dynamic(
                 url="https://example.com/slow",
                 config=config,
@@ -416,6 +516,139 @@ class TestStage2DynamicExtraction:
         assert result is None
 
 
+class TestBrowserPool:
+    """공유 브라우저 풀 테스트."""
+
+    @pytest.fixture
+    def mock_playwright(self) -> Iterator[AsyncMock]:
+        """async_playwright().start() mock (풀 상태는 테스트 후 초기화)."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _BrowserPool
+
+        mock_browser = AsyncMock()
+        mock_browser.is_connected = MagicMock(return_value=True)
+        mock_pw_instance = AsyncMock()
+        mock_pw_instance.chromium.launch.return_value = mock_browser
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool.async_playwright"
+        ) as mock_pw:
+            mock_pw.return_value.start = AsyncMock(return_value=mock_pw_instance)
+            yield mock_pw_instance
+
+        _BrowserPool._playwright = None
+        _BrowserPool._browser = None
+        _BrowserPool._loop = None
+        _BrowserPool._lock = None
+
+    @pytest.mark.asyncio
+    async def test_get_launches_browser_once(self, mock_playwright: AsyncMock) -> None:
+        """여러 번 호출해도 브라우저는 한 번만 실행."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _BrowserPool
+
+        first = await _BrowserPool.get()
+        second = await _BrowserPool.get()
+
+        assert first is second
+        mock_playwright.chromium.launch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_relaunches_disconnected_browser(
+        self, mock_playwright: AsyncMock
+    ) -> None:
+        """연결이 끊긴 브라우저는 다시 실행."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _BrowserPool
+
+        browser = await _BrowserPool.get()
+        browser.is_connected.return_value = False
+
+        await _BrowserPool.get()
+
+        assert mock_playwright.chromium.launch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_shared_browser(self, mock_playwright: AsyncMock) -> None:
+        """종료 시 브라우저와 Playwright를 정리."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _BrowserPool,
+            close_shared_browser,
+        )
+
+        browser = await _BrowserPool.get()
+        await close_shared_browser()
+
+        browser.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
+        assert _BrowserPool._browser is None
+
+    @pytest.mark.asyncio
+    async def test_loop_change_closes_browser_on_idle_loop(
+        self, mock_playwright: AsyncMock
+    ) -> None:
+        """루프가 바뀌면 기존 브라우저를 멈춰 있는 원래 루프에서 종료."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _BrowserPool
+
+        old_loop = asyncio.new_event_loop()
+        old_browser, old_playwright = AsyncMock(), AsyncMock()
+        _BrowserPool._loop = old_loop
+        _BrowserPool._browser = old_browser
+        _BrowserPool._playwright = old_playwright
+
+        try:
+            browser = await _BrowserPool.get()
+        finally:
+            old_loop.close()
+
+        old_browser.close.assert_awaited_once()
+        old_playwright.stop.assert_awaited_once()
+        assert browser is mock_playwright.chromium.launch.return_value
+
+    @pytest.mark.asyncio
+    async def test_loop_change_closes_browser_on_running_loop(
+        self, mock_playwright: AsyncMock
+    ) -> None:
+        """원래 루프가 다른 스레드에서 실행 중이면 그 루프에 종료를 예약."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _BrowserPool
+
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever)
+        thread.start()
+        closed_on: list[asyncio.AbstractEventLoop] = []
+
+        async def _close() -> None:
+            closed_on.append(asyncio.get_running_loop())
+
+        old_browser = MagicMock(close=_close)
+        _BrowserPool._loop = old_loop
+        _BrowserPool._browser = old_browser
+
+        try:
+            await _BrowserPool.get()
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join()
+            old_loop.close()
+
+        assert closed_on == [old_loop]
+
+    @pytest.mark.asyncio
+    async def test_loop_change_with_closed_loop_fails_loudly(
+        self, mock_playwright: AsyncMock
+    ) -> None:
+        """원래 루프가 닫혀 종료할 수 없으면 조용히 버리지 않고 예외 (다음 호출은 복구)."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _BrowserPool
+
+        old_loop = asyncio.new_event_loop()
+        old_loop.close()
+        _BrowserPool._loop = old_loop
+        _BrowserPool._browser = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="closed event loop"):
+            await _BrowserPool.get()
+
+        browser = await _BrowserPool.get()
+        assert browser is mock_playwright.chromium.launch.return_value
+
+
 # ============================================================================
 # T014: Stage 3 (Structural) 추출 테스트
 # ============================================================================
@@ -425,24 +658,19 @@ class TestStage3StructuralExtraction:
     """Stage 3: Structural 추출 테스트."""
 
     @pytest.mark.asyncio
-    async def test_extract_main_content(self, sample_html_structural: str) -> None:
+    async def test_extract_main_content(
+        self, mock_http: Callable[..., MagicMock], sample_html_structural: str
+    ) -> None:
         """main 태그에서 콘텐츠 추출."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
             _extract_stage3_structural,
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_structural
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(sample_html_structural)
 
-            result = await _extract_stage3_structural(
-                url="https://example.com/news",
-            )
+        result = await _extract_stage3_structural(
+            url="https://example.com/news",
+        )
 
         assert result is not None
         assert result.extraction_stage == 3
@@ -451,7 +679,9 @@ class TestStage3StructuralExtraction:
         )
 
     @pytest.mark.asyncio
-    async def test_fallback_to_article_tag(self) -> None:
+    async def test_fallback_to_article_tag(
+        self, mock_http: Callable[..., MagicMock]
+    ) -> None:
         """article 태그로 폴백."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
             _extract_stage3_structural,
@@ -470,18 +700,11 @@ class TestStage3StructuralExtraction:
         </body></html>
         """
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = html
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(html)
 
-            result = await _extract_stage3_structural(
-                url="https://example.com/article",
-            )
+        result = await _extract_stage3_structural(
+            url="https://example.com/article",
+        )
 
         assert result is not None
         assert "Article Title" in result.title or "article" in result.body.lower()
@@ -497,7 +720,7 @@ class TestStage4URLPatternExtraction:
 
     @pytest.mark.asyncio
     async def test_extract_links_with_pattern(
-        self, sample_html_with_links: str
+        self, mock_http: Callable[..., MagicMock], sample_html_with_links: str
     ) -> None:
         """URL 패턴으로 링크 추출."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -507,27 +730,45 @@ class TestStage4URLPatternExtraction:
 
         config = WebScraperConfig(url_pattern=r"/blog/2025/")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_with_links
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(sample_html_with_links)
 
-            result = await _extract_stage4_url_pattern(
-                url="https://example.com/blog",
-                config=config,
-            )
+        result = await _extract_stage4_url_pattern(
+            url="https://example.com/blog",
+            config=config,
+        )
 
         assert result is not None
         assert len(result) == 2  # 2025년 포스트 2개만
         assert all("/blog/2025/" in url for url in result)
 
+    @pytest.mark.asyncio
+    async def test_repeated_links_resolved_once(
+        self, mock_http: Callable[..., MagicMock]
+    ) -> None:
+        """같은 href가 반복되어도 URL 변환/매칭은 한 번만."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            WebScraperConfig,
+            _extract_stage4_url_pattern,
+        )
+
+        links = '<a href="/blog/2025/a">A</a><a href="/about">About</a>' * 20
+        mock_http(f"<html><body>{links}</body></html>")
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool.urljoin",
+            wraps=urljoin,
+        ) as mock_urljoin:
+            result = await _extract_stage4_url_pattern(
+                url="https://example.com/blog",
+                config=WebScraperConfig(url_pattern=r"/blog/2025/"),
+            )
+
+        assert result == ["https://example.com/blog/2025/a"]
+        assert mock_urljoin.call_count == 2
+
     @pytest.mark.asyncio
     async def test_returns_empty_without_pattern(
-        self, sample_html_with_links: str
+        self, mock_http: Callable[..., MagicMock], sample_html_with_links: str
     ) -> None:
         """패턴 없으면 빈 리스트 반환."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -537,19 +778,12 @@ class TestStage4URLPatternExtraction:
 
         config = WebScraperConfig()  # url_pattern 없음
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_with_links
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
+        mock_http(sample_html_with_links)
 
-            result = await _extract_stage4_url_pattern(
-                url="https://example.com/blog",
-                config=config,
-            )
+        result = await _extract_stage4_url_pattern(
+            url="https://example.com/blog",
+            config=config,
+        )
 
         assert result == []
 
@@ -564,7 +798,10 @@ class TestFetchWebOrchestration:
 
     @pytest.mark.asyncio
     async def test_success_at_stage1(
-        self, mock_content_repo: MagicMock, sample_html_static: str
+        self,
+        mock_http: Callable[..., MagicMock],
+        mock_content_repo: MagicMock,
+        sample_html_static: str,
     ) -> None:
         """Stage 1에서 성공."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -574,24 +811,90 @@ class TestFetchWebOrchestration:
 
         config = WebScraperConfig(selector=".blog-post")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_static
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
+        mock_http(sample_html_static)
+
+        result = await fetch_web(
+            source_id="src_web_001",
+            source_url="https://example.com/blog",
+            content_repo=mock_content_repo,
+            config=config,
+        )
+
+        assert len(result) >= 1
+        mock_content_repo.create.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_listing_mode_checks_duplicates_per_post(
+        self, mock_content_repo: MagicMock
+    ) -> None:
+        """목록 모드 중복 확인은 포스트별 조회만 하고 소스 키 전체를 읽지 않음."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            ScrapedContent,
+            WebScraperConfig,
+            fetch_web,
+        )
+
+        post_urls = [f"https://example.com/blog/post-{i}" for i in range(3)]
+
+        async def _stage1(url: str, config: object) -> ScrapedContent:
+            return ScrapedContent(
+                url=url, title=url, body=f"{url} " * 50, extraction_stage=1
             )
 
+        with (
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_post_links",
+                AsyncMock(return_value=post_urls),
+            ),
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage1_static",
+                side_effect=_stage1,
+            ),
+        ):
             result = await fetch_web(
                 source_id="src_web_001",
                 source_url="https://example.com/blog",
                 content_repo=mock_content_repo,
-                config=config,
+                config=WebScraperConfig(post_link_pattern=r"/blog/post-"),
             )
 
-        assert len(result) >= 1
-        mock_content_repo.create.assert_called()
+        assert len(result) == 3
+        assert mock_content_repo.exists_by_content_key.call_count == 3
+        called = {name for name, _, _ in mock_content_repo.method_calls}
+        assert called <= {"exists_by_content_key", "create", "load_simhashes"}
+        # 근사 중복 비교용 SimHash는 실행당 한 번, 최근 윈도우만 조회
+        mock_content_repo.load_simhashes.assert_called_once_with(
+            "src_web_001",
+            limit=get_settings().SCRAPING_NEAR_DUPLICATE_WINDOW,
+        )
+
+    @pytest.mark.asyncio
+    async def test_simhash_load_failure_does_not_abort(
+        self,
+        mock_http: Callable[..., MagicMock],
+        mock_content_repo: MagicMock,
+        sample_html_static: str,
+    ) -> None:
+        """SimHash 조회 실패(인덱스 누락 등)는 근사 중복 검사만 생략하고 저장."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            WebScraperConfig,
+            fetch_web,
+        )
+
+        mock_content_repo.load_simhashes.side_effect = RuntimeError(
+            "FailedPrecondition: The query requires an index"
+        )
+        mock_http(sample_html_static)
+
+        result = await fetch_web(
+            source_id="src_web_001",
+            source_url="https://example.com/blog",
+            content_repo=mock_content_repo,
+            config=WebScraperConfig(),
+        )
+
+        assert len(result) == 1
+        mock_content_repo.create.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_fallback_to_stage2(
@@ -640,38 +943,671 @@ class TestFetchWebOrchestration:
         mock_s2.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_skips_duplicate_content(
-        self, mock_content_repo: MagicMock, sample_html_static: str
+    async def test_starts_at_last_successful_stage(
+        self, mock_content_repo: MagicMock
     ) -> None:
-        """중복 콘텐츠 건너뜀."""
+        """같은 도메인은 마지막으로 성공한 스테이지부터 시도."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
+            ScrapedContent,
             WebScraperConfig,
             fetch_web,
         )
 
-        mock_content_repo.exists_by_content_key.return_value = True
-        config = WebScraperConfig()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.text = sample_html_static
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
+        def _scraped(url: str, *args: object) -> ScrapedContent:
+            return ScrapedContent(
+                url=url, title="Dynamic Title", body="A" * 250, extraction_stage=2
             )
 
+        with (
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage1_static",
+                return_value=None,
+            ) as mock_s1,
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage2_dynamic",
+                side_effect=_scraped,
+            ) as mock_s2,
+        ):
+            for path in ("post-1", "post-2"):
+                await fetch_web(
+                    source_id="src_web_001",
+                    source_url=f"https://spa.example.com/{path}",
+                    content_repo=mock_content_repo,
+                    config=WebScraperConfig(),
+                )
+
+        # 두 번째 요청은 Stage 1을 건너뛰고 Stage 2부터 시작
+        mock_s1.assert_called_once()
+        assert mock_s2.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_from_hinted_stage(
+        self, mock_content_repo: MagicMock
+    ) -> None:
+        """힌트 스테이지가 실패하면 나머지 스테이지를 순서대로 시도."""
+        from src.agent.domains.collector.tools import web_scraper_tool
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            ScrapedContent,
+            WebScraperConfig,
+            fetch_web,
+        )
+
+        web_scraper_tool._STAGE_HINTS["example.com"] = 2
+        calls: list[int] = []
+
+        def _stage(stage: int, result: ScrapedContent | None) -> object:
+            calls.append(stage)
+            return result
+
+        scraped = ScrapedContent(
+            url="https://example.com/post",
+            title="Title",
+            body="A" * 250,
+            extraction_stage=1,
+        )
+
+        with (
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage1_static",
+                side_effect=lambda *a: _stage(1, scraped),
+            ),
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage2_dynamic",
+                side_effect=lambda *a: _stage(2, None),
+            ),
+        ):
             result = await fetch_web(
                 source_id="src_web_001",
-                source_url="https://example.com/blog",
+                source_url="https://example.com/post",
                 content_repo=mock_content_repo,
-                config=config,
+                config=WebScraperConfig(),
+            )
+
+        assert len(result) == 1
+        assert calls == [2, 1]
+        assert web_scraper_tool._STAGE_HINTS["example.com"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stage3_success_does_not_bypass_selector(
+        self, mock_content_repo: MagicMock
+    ) -> None:
+        """Stage 3 성공은 힌트로 남지 않아 다음 수집에서 selector 스테이지부터 시도."""
+        from src.agent.domains.collector.tools import web_scraper_tool
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            ScrapedContent,
+            WebScraperConfig,
+            fetch_web,
+        )
+
+        calls: list[tuple[int, str | None]] = []
+        stage1_results: list[ScrapedContent | None] = [None]
+
+        def _scraped(stage: int) -> ScrapedContent:
+            return ScrapedContent(
+                url="https://example.com/post",
+                title="Title",
+                body="A" * 250,
+                extraction_stage=stage,
+            )
+
+        def _stage1(url: str, config: WebScraperConfig) -> ScrapedContent | None:
+            calls.append((1, config.selector))
+            return stage1_results.pop(0) if stage1_results else _scraped(1)
+
+        def _stage2(url: str, config: WebScraperConfig) -> None:
+            calls.append((2, config.selector))
+            return None
+
+        def _stage3(url: str) -> ScrapedContent:
+            calls.append((3, None))
+            return _scraped(3)
+
+        # 오래된 Stage 3 힌트가 남아 있어도 무시
+        web_scraper_tool._STAGE_HINTS["example.com"] = 3
+
+        with (
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage1_static",
+                side_effect=_stage1,
+            ),
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage2_dynamic",
+                side_effect=_stage2,
+            ),
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._extract_stage3_structural",
+                side_effect=_stage3,
+            ),
+        ):
+            await fetch_web(
+                source_id="src_web_001",
+                source_url="https://example.com/post",
+                content_repo=mock_content_repo,
+                config=WebScraperConfig(),
             )
+            assert "example.com" not in web_scraper_tool._STAGE_HINTS
+
+            await fetch_web(
+                source_id="src_web_001",
+                source_url="https://example.com/post",
+                content_repo=mock_content_repo,
+                config=WebScraperConfig(selector="article.main"),
+            )
+
+        assert calls == [(1, None), (2, None), (3, None), (1, "article.main")]
+        assert web_scraper_tool._STAGE_HINTS["example.com"] == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_duplicate_content(
+        self,
+        mock_http: Callable[..., MagicMock],
+        mock_content_repo: MagicMock,
+        sample_html_static: str,
+    ) -> None:
+        """중복 콘텐츠 건너뜀."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            WebScraperConfig,
+            fetch_web,
+        )
+
+        mock_content_repo.exists_by_content_key.return_value = True
+        config = WebScraperConfig()
+
+        mock_http(sample_html_static)
+
+        result = await fetch_web(
+            source_id="src_web_001",
+            source_url="https://example.com/blog",
+            content_repo=mock_content_repo,
+            config=config,
+        )
 
         assert len(result) == 0
         mock_content_repo.create.assert_not_called()
 
 
+class TestSaveScrapedContent:
+    """_save_scraped_content() 중복 체크 테스트."""
+
+    @pytest.fixture
+    def scraped(self) -> object:
+        """저장할 스크래핑 결과."""
+        from src.agent.domains.collector.tools.web_scraper_tool import ScrapedContent
+
+        return ScrapedContent(
+            url="https://example.com/post-1",
+            title="Post 1",
+            body="A" * 250,
+            extraction_stage=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_skips_near_duplicate_body(
+        self, mock_content_repo: MagicMock, scraped: object
+    ) -> None:
+        """본문 SimHash가 기존 지문과 가까우면 건너뛰고, 저장 시 지문을 추가."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            ScrapedContent,
+            _RecentSimHashes,
+            _save_scraped_content,
+        )
+
+        body = " ".join(f"Model release notes paragraph {i}." for i in range(50))
+        simhashes = _RecentSimHashes(mock_content_repo, "src_web_001")
+
+        first = await _save_scraped_content(
+            source_id="src_web_001",
+            scraped=ScrapedContent(
+                url="https://example.com/post-1",
+                title="Post",
+                body=body + " Views: 10",
+                extraction_stage=1,
+            ),
+            content_repo=mock_content_repo,
+            simhashes=simhashes,
+        )
+        second = await _save_scraped_content(
+            source_id="src_web_001",
+            scraped=ScrapedContent(
+                url="https://example.com/post-1?page=2",
+                title="Post",
+                body=body + " Views: 11",
+                extraction_stage=1,
+            ),
+            content_repo=mock_content_repo,
+            simhashes=simhashes,
+        )
+
+        assert first is not None
+        assert first.simhash is not None
+        assert simhashes.is_near_duplicate(int(first.simhash, 16), 0)
+        assert second is None
+        mock_content_repo.create.assert_called_once()
+        mock_content_repo.load_simhashes.assert_called_once_with(
+            "src_web_001", limit=get_settings().SCRAPING_NEAR_DUPLICATE_WINDOW
+        )
+
+    @pytest.mark.asyncio
+    async def test_content_key_hit_skips_simhash_load(
+        self, mock_content_repo: MagicMock, scraped: object
+    ) -> None:
+        """URL 기준 중복이면 최근 지문을 조회하지 않음."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _RecentSimHashes,
+            _save_scraped_content,
+        )
+
+        mock_content_repo.exists_by_content_key.return_value = True
+
+        result = await _save_scraped_content(
+            source_id="src_web_001",
+            scraped=scraped,
+            content_repo=mock_content_repo,
+            simhashes=_RecentSimHashes(mock_content_repo, "src_web_001"),
+        )
+
+        assert result is None
+        mock_content_repo.load_simhashes.assert_not_called()
+
+
+class TestFetchWebMany:
+    """fetch_web_many() 동시 수집 테스트."""
+
+    @pytest.fixture
+    def web_sources(self) -> list[Source]:
+        """3개의 WEB 소스."""
+        now = datetime.now(UTC)
+        return [
+            Source(
+                id=f"src_web_{i:03d}",
+                name=f"Blog {i}",
+                type=SourceType.WEB,
+                url=f"https://blog{i}.example.com/",
+                config={"selector": ".post"},
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_source_order(
+        self, web_sources: list[Source], mock_content_repo: MagicMock
+    ) -> None:
+        """소스 순서대로 결과를 반환하고, 실패한 소스는 예외로 반환."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            ScrapingError,
+            fetch_web_many,
+        )
+
+        async def _fetch_web(source_id: str, **kwargs: object) -> list[MagicMock]:
+            if source_id == "src_web_001":
+                raise ScrapingError("All extraction stages failed")
+            return [MagicMock(id=f"cnt_{source_id}")]
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool.fetch_web",
+            side_effect=_fetch_web,
+        ) as mock_fetch:
+            results = await fetch_web_many(web_sources, mock_content_repo)
+
+        assert results[0][0].id == "cnt_src_web_000"  # type: ignore[index]
+        assert isinstance(results[1], ScrapingError)
+        assert results[2][0].id == "cnt_src_web_002"  # type: ignore[index]
+        assert mock_fetch.call_args.kwargs["config"].selector == ".post"
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_fetches(self) -> None:
+        """동시 페이지 요청 수가 SCRAPING_MAX_CONCURRENT_FETCHES를 넘지 않음."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _fetch_html
+
+        stats = {"active": 0, "max_active": 0}
+
+        async def _enter(*args: object) -> MagicMock:
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            await asyncio.sleep(0.01)
+            response = MagicMock()
+            response.encoding = "utf-8"
+
+            async def _aiter_bytes(
+                chunk_size: int | None = None,
+            ) -> AsyncIterator[bytes]:
+                yield b"<p>ok</p>"
+
+            response.aiter_bytes = _aiter_bytes
+            return response
+
+        async def _exit(*args: object) -> bool:
+            stats["active"] -= 1
+            return False
+
+        stream_ctx = MagicMock()
+        stream_ctx.__aenter__ = _enter
+        stream_ctx.__aexit__ = _exit
+        client = MagicMock()
+        client.stream.return_value = stream_ctx
+
+        with (
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._HttpClientPool.get",
+                AsyncMock(return_value=client),
+            ),
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool.get_settings",
+                return_value=MagicMock(
+                    SCRAPING_MAX_CONCURRENT_FETCHES=2,
+                    SCRAPING_MAX_RESPONSE_BYTES=1024,
+                ),
+            ),
+        ):
+            pages = await asyncio.gather(
+                *(_fetch_html(f"https://example.com/{i}", timeout=5) for i in range(6))
+            )
+
+        assert pages == ["<p>ok</p>"] * 6
+        assert stats["max_active"] == 2
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_playwright_listing_loads(self) -> None:
+        """Playwright 목록 페이지 로드도 같은 동시 요청 제한을 따름."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            WebScraperConfig,
+            _extract_post_links,
+        )
+
+        stats = {"active": 0, "max_active": 0}
+
+        async def _goto(*args: object, **kwargs: object) -> None:
+            await asyncio.sleep(0.01)
+
+        async def _new_context(*args: object, **kwargs: object) -> MagicMock:
+            stats["active"] += 1
+            stats["max_active"] = max(stats["max_active"], stats["active"])
+            page = MagicMock()
+            page.goto = _goto
+            page.wait_for_timeout = AsyncMock()
+            page.evaluate = AsyncMock(return_value=["/blog/post-1"])
+            context = MagicMock()
+            context.new_page = AsyncMock(return_value=page)
+
+            async def _close() -> None:
+                stats["active"] -= 1
+
+            context.close = _close
+            return context
+
+        browser = MagicMock()
+        browser.new_context = _new_context
+        config = WebScraperConfig(
+            post_link_pattern=r"/blog/post-", use_playwright_for_listing=True
+        )
+
+        with (
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool._BrowserPool.get",
+                AsyncMock(return_value=browser),
+            ),
+            patch(
+                "src.agent.domains.collector.tools.web_scraper_tool.get_settings",
+                return_value=MagicMock(SCRAPING_MAX_CONCURRENT_FETCHES=2),
+            ),
+        ):
+            links = await asyncio.gather(
+                *(
+                    _extract_post_links(f"https://example.com/blog/{i}", config)
+                    for i in range(6)
+                )
+            )
+
+        assert links[0] == ["https://example.com/blog/post-1"]
+        assert stats["max_active"] == 2
+
+
+class TestHttpClientPool:
+    """공유 HTTP 클라이언트 풀 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_pool(self) -> Iterator[None]:
+        """테스트 후 풀 상태 초기화."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _HttpClientPool,
+        )
+
+        yield
+        _HttpClientPool._client = None
+        _HttpClientPool._loop = None
+
+    @pytest.mark.asyncio
+    async def test_get_reuses_client(self) -> None:
+        """같은 이벤트 루프에서는 클라이언트(연결 풀)를 재사용."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _HttpClientPool,
+        )
+
+        first = await _HttpClientPool.get()
+        second = await _HttpClientPool.get()
+
+        assert first is second
+        await first.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_recreates_closed_client(self) -> None:
+        """닫힌 클라이언트는 새로 생성."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _HttpClientPool,
+        )
+
+        first = await _HttpClientPool.get()
+        await first.aclose()
+        second = await _HttpClientPool.get()
+
+        assert second is not first
+        assert not second.is_closed
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_shared_http_client(self) -> None:
+        """종료 시 클라이언트 연결을 닫음."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _HttpClientPool,
+            close_shared_http_client,
+        )
+
+        client = await _HttpClientPool.get()
+        await close_shared_http_client()
+
+        assert client.is_closed
+        assert _HttpClientPool._client is None
+
+    @pytest.mark.asyncio
+    async def test_loop_change_closes_old_client(self) -> None:
+        """루프가 바뀌면 기존 클라이언트를 원래 루프에서 닫고 새로 생성."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _HttpClientPool,
+        )
+
+        old_loop = asyncio.new_event_loop()
+        old_client = httpx.AsyncClient()
+        _HttpClientPool._loop = old_loop
+        _HttpClientPool._client = old_client
+
+        try:
+            client = await _HttpClientPool.get()
+        finally:
+            old_loop.close()
+
+        assert old_client.is_closed
+        assert client is not old_client
+        assert not client.is_closed
+        await client.aclose()
+
+
+# ============================================================================
+# HTML 파싱 헬퍼 테스트
+# ============================================================================
+
+
+class TestFetchHtml:
+    """정적 HTML 스트리밍 다운로드 테스트."""
+
+    @pytest.fixture
+    def serve(self) -> Iterator[Callable[[httpx.Response], None]]:
+        """공유 HTTP 클라이언트가 지정한 응답을 반환하도록 MockTransport 주입."""
+        responses: list[httpx.Response] = []
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: responses[0])
+        )
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool._HttpClientPool.get",
+            AsyncMock(return_value=client),
+        ):
+            yield responses.append
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_truncates_large_body(
+        self, serve: Callable[[httpx.Response], None]
+    ) -> None:
+        """최대 크기를 넘는 응답은 앞부분만 읽음."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _fetch_html
+
+        serve(httpx.Response(200, content=b"<p>" + b"x" * 1000 + b"</p>"))
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool.get_settings",
+            return_value=MagicMock(
+                SCRAPING_MAX_RESPONSE_BYTES=100, SCRAPING_MAX_CONCURRENT_FETCHES=16
+            ),
+        ):
+            html = await _fetch_html("https://example.com/huge", timeout=5)
+
+        assert len(html) == 100
+        assert html.startswith("<p>xxx")
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_decodes_charset(
+        self, serve: Callable[[httpx.Response], None]
+    ) -> None:
+        """Content-Type charset으로 디코딩."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _fetch_html
+
+        serve(
+            httpx.Response(
+                200,
+                content="<p>한글 본문</p>".encode("euc-kr"),
+                headers={"content-type": "text/html; charset=euc-kr"},
+            )
+        )
+
+        html = await _fetch_html("https://example.com/kr", timeout=5)
+
+        assert html == "<p>한글 본문</p>"
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_raises_on_http_error(
+        self, serve: Callable[[httpx.Response], None]
+    ) -> None:
+        """4xx/5xx 응답은 HTTPStatusError."""
+        from src.agent.domains.collector.tools.web_scraper_tool import _fetch_html
+
+        serve(httpx.Response(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await _fetch_html("https://example.com/missing", timeout=5)
+
+
+class TestHtmlHelpers:
+    """lxml 기반 HTML 파싱 헬퍼 테스트."""
+
+    def test_get_text_skips_script_and_comments(self) -> None:
+        """텍스트 추출 시 script/style/주석 제외, tail 텍스트 유지."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _get_text,
+            _parse_html,
+            _select_one,
+        )
+
+        doc = _parse_html(
+            "<html><body><div class='post'>Hello <!-- note --><b>bold</b> tail"
+            "<script>var a = 1;</script><style>p {}</style> end</div></body></html>"
+        )
+        element = _select_one(doc, ".post")
+
+        assert element is not None
+        assert _get_text(element) == "Hello bold tail end"
+
+    def test_get_text_without_non_text_elements(self) -> None:
+        """비텍스트 요소가 없는 하위 트리도 같은 규칙으로 텍스트 추출."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _get_text,
+            _parse_html,
+        )
+
+        doc = _parse_html(
+            "<html><body><div id='a'><h1>Title <!-- c -->here</h1>"
+            "<p> p1 </p>\n\n<p>p2</p><?pi x?>tail</div> outside</body></html>"
+        )
+        element = doc.get_element_by_id("a")
+
+        assert _get_text(element) == "Title here p1 p2 tail"
+        assert _get_text(element, separator="") == "Titleherep1p2tail"
+
+    def test_extract_body_text_removes_noise_after_nested_noise(self) -> None:
+        """중첩된 노이즈(header>nav) 뒤의 footer도 제거."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _extract_body_text,
+            _parse_html,
+        )
+
+        doc = _parse_html(
+            "<html><body><header><nav>x</nav></header>"
+            "<p>Main body text here</p><footer>FOOTERTEXT</footer>"
+            "<aside>ASIDETEXT</aside></body></html>"
+        )
+
+        assert _extract_body_text(doc) == "Main body text here"
+
+    def test_compile_pattern_cached(self) -> None:
+        """같은 패턴 문자열은 한 번만 컴파일."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _compile_pattern,
+        )
+
+        assert _compile_pattern(r"/blog/\d{4}/") is _compile_pattern(r"/blog/\d{4}/")
+
+    def test_compile_selector_cached(self) -> None:
+        """같은 CSS selector는 한 번만 XPath로 변환/컴파일."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _compile_selector,
+            _parse_html,
+        )
+
+        selector = _compile_selector("article .post-title")
+        doc = _parse_html(
+            "<html><body><article><h2 class='post-title'>A</h2></article>"
+            "<h2 class='post-title'>B</h2></body></html>"
+        )
+
+        assert selector is _compile_selector("article .post-title")
+        assert [el.text for el in selector(doc)] == ["A"]
+
+    def test_parse_html_with_encoding_declaration(self) -> None:
+        """XML 인코딩 선언이 있는 문서도 파싱."""
+        from src.agent.domains.collector.tools.web_scraper_tool import (
+            _extract_title,
+            _parse_html,
+        )
+
+        doc = _parse_html(
+            '<?xml version="1.0" encoding="utf-8"?>'
+            "<html><head><title>제목 | 사이트</title></head><body></body></html>"
+        )
+
+        assert _extract_title(doc) == "제목"
+
+
 # ============================================================================
 # T017: 예외 처리 테스트
 # ============================================================================
@@ -737,7 +1673,7 @@ class TestExceptionHandling:
 
     @pytest.mark.asyncio
     async def test_network_error_on_connection_failure(
-        self, mock_content_repo: MagicMock
+        self, mock_http: Callable[..., MagicMock], mock_content_repo: MagicMock
     ) -> None:
         """네트워크 연결 실패 시 ScrapingError (모든 스테이지 실패)."""
         from src.agent.domains.collector.tools.web_scraper_tool import (
@@ -745,18 +1681,13 @@ class TestExceptionHandling:
             fetch_web,
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            import httpx
+        mock_http(side_effect=httpx.ConnectError("Connection refused"))
 
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                side_effect=httpx.ConnectError("Connection refused")
+        # 모든 스테이지가 실패하면 ScrapingError 발생
+        with pytest.raises(ScrapingError) as exc_info:
+            await fetch_web(
+                source_id="src_web_001",
+                source_url="https://example.com/unreachable",
+                content_repo=mock_content_repo,
             )
-
-            # 모든 스테이지가 실패하면 ScrapingError 발생
-            with pytest.raises(ScrapingError) as exc_info:
-                await fetch_web(
-                    source_id="src_web_001",
-                    source_url="https://example.com/unreachable",
-                    content_repo=mock_content_repo,
-                )
-            assert "All extraction stages failed" in str(exc_info.value)
+        assert "All extraction stages failed" in str(exc_info.value)
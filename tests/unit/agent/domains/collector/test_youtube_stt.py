@@ -4,6 +4,10 @@ YouTube 영상에서 음성 인식(STT)으로 자막을 추출하는 도구 테
 TDD: Red → Green → Refactor
 """
 
+import asyncio
+import os
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,13 +19,16 @@ import pytest
 
 
 @pytest.fixture
-def mock_settings() -> MagicMock:
+def mock_settings(tmp_path: Path) -> MagicMock:
     """Mock Settings fixture."""
     settings = MagicMock()
     settings.STT_ENABLED = True
     settings.STT_MODEL_SIZE = "small"
     settings.STT_COMPUTE_TYPE = "int8"
     settings.STT_MAX_VIDEO_DURATION_MINUTES = 30
+    settings.STT_BATCH_SIZE = 8
+    settings.STT_CACHE_DIR = str(tmp_path / "stt_cache")
+    settings.STT_CACHE_MAX_ENTRIES = 512
     return settings
 
 
@@ -68,6 +75,7 @@ class TestTranscriptionResult:
         )
         with pytest.raises(AttributeError):
             result.text = "Modified"  # type: ignore[misc]
+        assert not hasattr(result, "__dict__")
 
 
 # ============================================================================
@@ -146,6 +154,87 @@ class TestExtractAudio:
 
             assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_extract_audio_keeps_original_stream(self, tmp_path: Path) -> None:
+        """재인코딩 없이 다운로드한 원본 오디오 파일 경로 반환."""
+        from src.agent.domains.collector.tools.youtube_stt import extract_audio
+
+        audio_file = tmp_path / "abc123.webm"
+        audio_file.write_bytes(b"fake audio")
+
+        with patch(
+            "src.agent.domains.collector.tools.youtube_stt.yt_dlp.YoutubeDL"
+        ) as mock_ydl:
+            mock_instance = MagicMock()
+            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
+            mock_instance.__exit__ = MagicMock(return_value=False)
+            mock_instance.extract_info.return_value = {
+                "duration": 600,
+                "ext": "webm",
+                "requested_downloads": [{"filepath": str(audio_file)}],
+            }
+            mock_ydl.return_value = mock_instance
+
+            audio_path, duration = await extract_audio(
+                video_id="abc123",
+                output_dir=str(tmp_path),
+            )
+
+        assert audio_path == str(audio_file)
+        assert duration == 600.0
+        ydl_opts = mock_ydl.call_args[0][0]
+        assert "postprocessors" not in ydl_opts
+        # 조각 병렬 다운로드 + Range 청크 다운로드
+        assert ydl_opts["concurrent_fragment_downloads"] > 1
+        assert ydl_opts["http_chunk_size"] == 10 * 1024 * 1024
+        assert "match_filter" not in ydl_opts
+        # YouTube 추출기만 사용 (전체 추출기 순회 생략)
+        assert mock_instance.extract_info.call_args.kwargs["ie_key"] == "Youtube"
+
+    @pytest.mark.asyncio
+    async def test_extract_audio_skips_long_video_download(
+        self, tmp_path: Path
+    ) -> None:
+        """길이 제한을 넘는 영상은 다운로드 전에 건너뜀."""
+        from src.agent.domains.collector.tools.youtube_stt import extract_audio
+
+        with patch(
+            "src.agent.domains.collector.tools.youtube_stt.yt_dlp.YoutubeDL"
+        ) as mock_ydl:
+            mock_instance = MagicMock()
+            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
+            mock_instance.__exit__ = MagicMock(return_value=False)
+            mock_instance.extract_info.return_value = {"duration": 3600, "ext": "m4a"}
+            mock_ydl.return_value = mock_instance
+
+            _, duration = await extract_audio(
+                video_id="long123",
+                output_dir=str(tmp_path),
+                max_duration_seconds=1800,
+            )
+
+        assert duration == 3600.0
+        match_filter = mock_ydl.call_args[0][0]["match_filter"]
+        assert match_filter({"duration": 3600}) is not None
+        assert match_filter({"duration": 1800}) is None
+        # 길이 정보가 없으면 (라이브 등) 다운로드 허용
+        assert match_filter({}, incomplete=True) is None
+
+    def test_match_filter_reports_accepted_video(self) -> None:
+        """길이 확인을 통과한 영상만 on_accepted로 알림."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            _duration_match_filter,
+        )
+
+        accepted: list[int] = []
+        match_filter = _duration_match_filter(1800, lambda: accepted.append(1))
+
+        assert match_filter({"duration": 3600}) is not None
+        assert match_filter({"duration": 600}, incomplete=True) is None
+        assert accepted == []
+        assert match_filter({"duration": 600}) is None
+        assert accepted == [1]
+
     @pytest.mark.asyncio
     async def test_extract_audio_age_restricted(self) -> None:
         """연령 제한 영상 처리."""
@@ -203,6 +292,24 @@ class TestExtractAudio:
 class TestTranscribeAudio:
     """transcribe_audio() 테스트."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_model_cache(self) -> Iterator[None]:
+        """테스트 간 Whisper 모델 캐시 초기화."""
+        from src.agent.domains.collector.tools.youtube_stt import _WHISPER_MODELS
+
+        _WHISPER_MODELS.clear()
+        yield
+        _WHISPER_MODELS.clear()
+
+    @pytest.fixture(autouse=True)
+    def mock_pipeline(self) -> Iterator[MagicMock]:
+        """BatchedInferencePipeline을 모델 그대로 반환하도록 대체."""
+        with patch(
+            "src.agent.domains.collector.tools.youtube_stt.BatchedInferencePipeline",
+            side_effect=lambda model: model,
+        ) as mock:
+            yield mock
+
     @pytest.mark.asyncio
     async def test_transcribe_success(self, sample_audio_path: Path) -> None:
         """전사 성공."""
@@ -215,6 +322,7 @@ class TestTranscribeAudio:
             mock_model = MagicMock()
             mock_segments = [
                 MagicMock(text=" Hello world"),
+                MagicMock(text="  "),
                 MagicMock(text=" This is a test"),
             ]
             mock_info = MagicMock()
@@ -233,6 +341,10 @@ class TestTranscribeAudio:
         assert result.text == "Hello world This is a test"
         assert result.language == "en"
         assert result.language_probability == 0.95
+        # VAD 구간을 배치로 묶어 전사
+        call_kwargs = mock_model.transcribe.call_args.kwargs
+        assert call_kwargs["batch_size"] == 8
+        assert call_kwargs["vad_filter"] is True
 
     @pytest.mark.asyncio
     async def test_transcribe_korean(self, sample_audio_path: Path) -> None:
@@ -281,6 +393,149 @@ class TestTranscribeAudio:
                     model_size="small",
                 )
 
+    @pytest.mark.asyncio
+    async def test_model_loaded_once(self, sample_audio_path: Path) -> None:
+        """같은 설정으로 여러 번 전사해도 모델은 한 번만 로드."""
+        from src.agent.domains.collector.tools.youtube_stt import transcribe_audio
+
+        with patch(
+            "src.agent.domains.collector.tools.youtube_stt.WhisperModel"
+        ) as mock_whisper:
+            mock_model = MagicMock()
+            mock_model.transcribe.side_effect = lambda *args, **kwargs: (
+                iter([MagicMock(text=" Hello")]),
+                MagicMock(language="en", language_probability=0.9, duration=1.0),
+            )
+            mock_whisper.return_value = mock_model
+
+            for _ in range(3):
+                await transcribe_audio(audio_path=str(sample_audio_path))
+            await transcribe_audio(
+                audio_path=str(sample_audio_path), compute_type="float32"
+            )
+
+        # (small, auto) 1회 + (small, float32) 1회
+        assert mock_whisper.call_count == 2
+        assert mock_model.transcribe.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_transcribe_runs_off_event_loop(
+        self, sample_audio_path: Path
+    ) -> None:
+        """전사와 세그먼트 디코딩은 이벤트 루프 스레드 밖에서 실행."""
+        from src.agent.domains.collector.tools.youtube_stt import transcribe_audio
+
+        loop_thread = threading.get_ident()
+        decode_threads: list[int] = []
+
+        def _segments() -> Iterator[MagicMock]:
+            decode_threads.append(threading.get_ident())
+            yield MagicMock(text=" Hello")
+
+        with patch(
+            "src.agent.domains.collector.tools.youtube_stt.WhisperModel"
+        ) as mock_whisper:
+            mock_model = MagicMock()
+            mock_model.transcribe.return_value = (
+                _segments(),
+                MagicMock(language="en", language_probability=0.9, duration=1.0),
+            )
+            mock_whisper.return_value = mock_model
+
+            result = await transcribe_audio(
+                audio_path=str(sample_audio_path), compute_type="int8_float32"
+            )
+
+        assert result.text == "Hello"
+        assert decode_threads and decode_threads[0] != loop_thread
+
+
+class TestResolveComputeType:
+    """compute_type 자동 선택 테스트."""
+
+    def test_explicit_type_kept(self) -> None:
+        """명시한 타입은 그대로 사용."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            _resolve_compute_type,
+        )
+
+        assert _resolve_compute_type("cpu", "float32") == "float32"
+
+    @pytest.mark.parametrize(
+        ("device", "supported", "expected"),
+        [
+            ("cuda", {"float32", "float16", "int8", "int8_float16"}, "int8_float16"),
+            ("cuda", {"float32", "int8"}, "int8"),
+            ("cpu", {"float32", "int8", "int8_float32"}, "int8"),
+            ("cpu", {"float32"}, "float32"),
+        ],
+    )
+    def test_auto_picks_fastest_supported(
+        self, device: str, supported: set[str], expected: str
+    ) -> None:
+        """auto는 장치가 지원하는 가장 빠른 타입 선택."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            _resolve_compute_type,
+        )
+
+        with patch(
+            "src.agent.domains.collector.tools.youtube_stt.ctranslate2.get_supported_compute_types",
+            return_value=supported,
+        ):
+            assert _resolve_compute_type(device, "auto") == expected
+
+
+class TestCpuThreads:
+    """CTranslate2 CPU 스레드 수 계산 테스트."""
+
+    @pytest.fixture
+    def cpu_max(self, tmp_path: Path) -> Iterator[Callable[[str], None]]:
+        """cgroup cpu.max 내용 설정 함수."""
+        path = tmp_path / "cpu.max"
+        with (
+            patch(
+                "src.agent.domains.collector.tools.youtube_stt._CGROUP_CPU_MAX_PATH",
+                str(path),
+            ),
+            patch.object(
+                os, "sched_getaffinity", lambda pid: set(range(8)), create=True
+            ),
+        ):
+            yield path.write_text
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("200000 100000\n", 2),
+            ("150000 100000\n", 2),
+            ("50000 100000\n", 1),
+            ("1600000 100000\n", 8),
+            ("max 100000\n", 8),
+        ],
+    )
+    def test_uses_cgroup_quota(
+        self, cpu_max: Callable[[str], None], content: str, expected: int
+    ) -> None:
+        """cgroup 쿼터(올림)와 affinity 중 작은 값을 사용."""
+        from src.agent.domains.collector.tools.youtube_stt import _cpu_threads
+
+        cpu_max(content)
+
+        assert _cpu_threads() == expected
+
+    def test_falls_back_to_affinity_without_cgroup(self, tmp_path: Path) -> None:
+        """cpu.max를 읽을 수 없으면 affinity 기준."""
+        from src.agent.domains.collector.tools.youtube_stt import _cpu_threads
+
+        with (
+            patch(
+                "src.agent.domains.collector.tools.youtube_stt._CGROUP_CPU_MAX_PATH",
+                str(tmp_path / "missing"),
+            ),
+            patch.object(os, "sched_getaffinity", lambda pid: {0, 1, 2}, create=True),
+        ):
+            assert _cpu_threads() == 3
+
 
 # ============================================================================
 # T034: 영상 길이 제한 테스트
@@ -332,6 +587,177 @@ class TestVideoDurationLimit:
         assert result is True
 
 
+async def _accepted_download(
+    video_id: str,
+    output_dir: str | None = None,
+    max_duration_seconds: float | None = None,
+    on_accepted: Callable[[], None] | None = None,
+) -> tuple[str, float]:
+    """길이 확인을 통과해 다운로드한 것처럼 on_accepted를 호출하는 extract_audio 대역."""
+    if on_accepted is not None:
+        await asyncio.to_thread(on_accepted)
+    return "/tmp/a.m4a", 60.0
+
+
+class TestFetchYoutubeWithStt:
+    """fetch_youtube_with_stt() 통합 흐름 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_model_warm_up_overlaps_download(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """길이 확인을 통과하면 오디오 다운로드와 Whisper 모델 로드를 함께 진행."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            TranscriptionResult,
+            fetch_youtube_with_stt,
+        )
+
+        expected = TranscriptionResult(
+            text="Hello", language="en", language_probability=0.9, duration_seconds=60
+        )
+        module = "src.agent.domains.collector.tools.youtube_stt"
+
+        with (
+            patch(f"{module}.get_settings", return_value=mock_settings),
+            patch(f"{module}.extract_audio", side_effect=_accepted_download),
+            patch(f"{module}._get_whisper_model") as mock_get_model,
+            patch(f"{module}.transcribe_audio", return_value=expected) as mock_stt,
+        ):
+            result = await fetch_youtube_with_stt("abc123")
+
+        assert result is expected
+        mock_get_model.assert_called_once_with("small", "int8")
+        mock_stt.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_video_skips_model_warm_up(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """길이 제한으로 건너뛴 영상은 Whisper 모델을 로드하지 않음."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            fetch_youtube_with_stt,
+        )
+
+        module = "src.agent.domains.collector.tools.youtube_stt"
+
+        with (
+            patch(f"{module}.get_settings", return_value=mock_settings),
+            patch(f"{module}.extract_audio", return_value=("/tmp/a.m4a", 7200.0)),
+            patch(f"{module}._get_whisper_model") as mock_get_model,
+            patch(f"{module}.transcribe_audio") as mock_stt,
+        ):
+            result = await fetch_youtube_with_stt("long123")
+
+        assert result is None
+        mock_get_model.assert_not_called()
+        mock_stt.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_download_skips_model_warm_up(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """메타데이터 단계에서 실패한 영상은 Whisper 모델을 로드하지 않음."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            VideoUnavailableError,
+            fetch_youtube_with_stt,
+        )
+
+        module = "src.agent.domains.collector.tools.youtube_stt"
+
+        with (
+            patch(f"{module}.get_settings", return_value=mock_settings),
+            patch(
+                f"{module}.extract_audio",
+                side_effect=VideoUnavailableError("private", "gone123"),
+            ),
+            patch(f"{module}._get_whisper_model") as mock_get_model,
+            pytest.raises(VideoUnavailableError),
+        ):
+            await fetch_youtube_with_stt("gone123")
+
+        mock_get_model.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_does_not_abort(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """모델 사전 로드 실패는 무시하고 전사 단계에서 처리."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            TranscriptionResult,
+            fetch_youtube_with_stt,
+        )
+
+        expected = TranscriptionResult(
+            text="Hello", language="en", language_probability=0.9, duration_seconds=60
+        )
+        module = "src.agent.domains.collector.tools.youtube_stt"
+
+        with (
+            patch(f"{module}.get_settings", return_value=mock_settings),
+            patch(f"{module}.extract_audio", side_effect=_accepted_download),
+            patch(f"{module}._get_whisper_model", side_effect=RuntimeError("no model")),
+            patch(f"{module}.transcribe_audio", return_value=expected),
+        ):
+            result = await fetch_youtube_with_stt("abc123")
+
+        assert result is expected
+
+    @pytest.mark.asyncio
+    async def test_cached_transcript_skips_download(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """같은 영상/모델 설정의 전사 결과는 디스크 캐시에서 재사용."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            TranscriptionResult,
+            fetch_youtube_with_stt,
+        )
+
+        expected = TranscriptionResult(
+            text="안녕하세요",
+            language="ko",
+            language_probability=0.9,
+            duration_seconds=60,
+        )
+        module = "src.agent.domains.collector.tools.youtube_stt"
+
+        with (
+            patch(f"{module}.get_settings", return_value=mock_settings),
+            patch(
+                f"{module}.extract_audio", return_value=("/tmp/a.m4a", 60.0)
+            ) as mock_extract,
+            patch(f"{module}._get_whisper_model"),
+            patch(f"{module}.transcribe_audio", return_value=expected) as mock_stt,
+        ):
+            first = await fetch_youtube_with_stt("abc123")
+            second = await fetch_youtube_with_stt("abc123")
+
+        assert first == second == expected
+        mock_extract.assert_awaited_once()
+        mock_stt.assert_awaited_once()
+
+    def test_cache_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """최대 항목 수를 넘으면 가장 오래 쓰지 않은 결과부터 삭제."""
+        from src.agent.domains.collector.tools.youtube_stt import (
+            TranscriptionResult,
+            _load_cached_transcript,
+            _store_cached_transcript,
+        )
+
+        result = TranscriptionResult(
+            text="t", language="en", language_probability=1.0, duration_seconds=1
+        )
+        paths = [str(tmp_path / f"v{i}.small.auto.json") for i in range(3)]
+        for i, path in enumerate(paths[:2]):
+            _store_cached_transcript(path, result, max_entries=2)
+            os.utime(path, (i, i))
+
+        _store_cached_transcript(paths[2], result, max_entries=2)
+
+        assert _load_cached_transcript(paths[0]) is None
+        assert _load_cached_transcript(paths[1]) == result
+        assert _load_cached_transcript(paths[2]) == result
+
+
 # ============================================================================
 # T035: 임시 파일 자동 삭제 테스트
 # ============================================================================
@@ -374,3 +800,20 @@ class TestTempFileCleanup:
 
         # 존재하지 않는 파일 - 오류 없이 처리
         cleanup_temp_files("/nonexistent/file.m4a")
+
+    @pytest.mark.asyncio
+    async def test_cleanup_directory_and_multiple_paths(self, tmp_path: Path) -> None:
+        """디렉토리(중간 파일 포함)와 여러 경로를 한 번에 삭제."""
+        from src.agent.domains.collector.tools.youtube_stt import cleanup_temp_files
+
+        work_dir = tmp_path / "ax_stt_work"
+        work_dir.mkdir()
+        (work_dir / "abc123.webm").write_bytes(b"fake audio")
+        (work_dir / "abc123.webm.part").write_bytes(b"partial")
+        extra_file = tmp_path / "extra.m4a"
+        extra_file.write_bytes(b"fake audio")
+
+        cleanup_temp_files(str(work_dir), str(extra_file), "/nonexistent/file.m4a")
+
+        assert not work_dir.exists()
+        assert not extra_file.exists()
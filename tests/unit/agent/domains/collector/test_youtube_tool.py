@@ -8,11 +8,13 @@ import pytest
 
 from src.agent.domains.collector.tools.youtube_tool import (
     YouTubeTranscript,
+    _fetch_transcript,
     extract_video_id,
     fetch_youtube,
     get_transcript,
     is_channel_url,
 )
+from src.repositories.content_repo import ContentRepository
 
 
 @dataclass
@@ -24,52 +26,54 @@ class MockTranscriptSnippet:
     duration: float
 
 
+@pytest.fixture(autouse=True)
+def _clear_transcript_cache() -> None:
+    """테스트 간 자막 캐시 격리."""
+    _fetch_transcript.cache_clear()
+
+
 class TestExtractVideoId:
     """Tests for extract_video_id function."""
 
-    def test_extract_from_standard_url(self) -> None:
-        """표준 YouTube URL에서 ID 추출."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_extract_from_short_url(self) -> None:
-        """youtu.be 단축 URL에서 ID 추출."""
-        url = "https://youtu.be/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_extract_from_embed_url(self) -> None:
-        """embed URL에서 ID 추출."""
-        url = "https://www.youtube.com/embed/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_extract_from_url_with_params(self) -> None:
-        """추가 파라미터가 있는 URL에서 ID 추출."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLtest"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_extract_from_url_with_timestamp(self) -> None:
-        """타임스탬프가 있는 URL에서 ID 추출."""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_extract_from_shorts_url(self) -> None:
-        """Shorts URL에서 ID 추출."""
-        url = "https://www.youtube.com/shorts/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-
-    def test_extract_raw_video_id(self) -> None:
-        """순수 video ID 입력."""
-        video_id = "dQw4w9WgXcQ"
-        assert extract_video_id(video_id) == "dQw4w9WgXcQ"
-
-    def test_extract_invalid_url(self) -> None:
-        """잘못된 URL."""
-        url = "https://example.com/video"
-        assert extract_video_id(url) is None
-
-    def test_extract_empty_string(self) -> None:
-        """빈 문자열."""
-        assert extract_video_id("") is None
+    @pytest.mark.parametrize(
+        ("url_or_id", "expected"),
+        [
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "dQw4w9WgXcQ",
+                id="standard",
+            ),
+            pytest.param("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ", id="short"),
+            pytest.param(
+                "https://www.youtube.com/embed/dQw4w9WgXcQ",
+                "dQw4w9WgXcQ",
+                id="embed",
+            ),
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLtest",
+                "dQw4w9WgXcQ",
+                id="params",
+            ),
+            pytest.param(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120",
+                "dQw4w9WgXcQ",
+                id="timestamp",
+            ),
+            pytest.param(
+                "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+                "dQw4w9WgXcQ",
+                id="shorts",
+            ),
+            pytest.param("dQw4w9WgXcQ", "dQw4w9WgXcQ", id="raw"),
+            # 개행이 붙은 입력은 video ID로 취급하지 않음
+            pytest.param("dQw4w9WgXcQ\n", None, id="raw-trailing-newline"),
+            pytest.param("https://example.com/video", None, id="invalid"),
+            pytest.param("", None, id="empty"),
+        ],
+    )
+    def test_extract_video_id(self, url_or_id: str, expected: str | None) -> None:
+        """URL 형식별 video ID 추출."""
+        assert extract_video_id(url_or_id) == expected
 
 
 class TestIsChannelUrl:
@@ -121,97 +125,90 @@ class TestIsChannelUrl:
 class TestGetTranscript:
     """Tests for get_transcript function."""
 
-    def test_get_english_transcript(self) -> None:
+    @pytest.fixture
+    def mock_transcript_api(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """YouTubeTranscriptApi()가 반환하는 Mock 인스턴스."""
+        api_class = MagicMock()
+        monkeypatch.setattr(
+            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi",
+            api_class,
+        )
+        return api_class.return_value
+
+    def test_get_english_transcript(self, mock_transcript_api: MagicMock) -> None:
         """영어 자막 가져오기."""
         mock_transcript_data = [
             MockTranscriptSnippet(text="Hello world.", start=0.0, duration=2.0),
             MockTranscriptSnippet(text="This is a test.", start=2.0, duration=2.0),
         ]
 
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.return_value = mock_transcript_data
+        mock_transcript_api.fetch.return_value = mock_transcript_data
 
-            result = get_transcript("dQw4w9WgXcQ")
+        result = get_transcript("dQw4w9WgXcQ")
 
-            assert result is not None
-            assert result.video_id == "dQw4w9WgXcQ"
-            assert "Hello world" in result.text
-            assert "This is a test" in result.text
-            assert result.language == "en"
+        assert result is not None
+        assert result.video_id == "dQw4w9WgXcQ"
+        assert "Hello world" in result.text
+        assert "This is a test" in result.text
+        assert result.language == "en"
 
-    def test_get_korean_transcript(self) -> None:
+    def test_get_korean_transcript(self, mock_transcript_api: MagicMock) -> None:
         """한국어 자막 가져오기."""
         mock_transcript_data = [
             MockTranscriptSnippet(text="안녕하세요.", start=0.0, duration=2.0),
             MockTranscriptSnippet(text="테스트입니다.", start=2.0, duration=2.0),
         ]
 
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.return_value = mock_transcript_data
+        mock_transcript_api.fetch.return_value = mock_transcript_data
 
-            result = get_transcript("dQw4w9WgXcQ", languages=["ko"])
+        result = get_transcript("dQw4w9WgXcQ", languages=["ko"])
 
-            assert result is not None
-            assert "안녕하세요" in result.text
-            mock_instance.fetch.assert_called_once_with("dQw4w9WgXcQ", languages=["ko"])
+        assert result is not None
+        assert "안녕하세요" in result.text
+        mock_transcript_api.fetch.assert_called_once_with(
+            "dQw4w9WgXcQ", languages=["ko"]
+        )
 
-    def test_get_transcript_fallback_languages(self) -> None:
+    def test_get_transcript_fallback_languages(
+        self, mock_transcript_api: MagicMock
+    ) -> None:
         """언어 폴백 테스트."""
         mock_transcript_data = [
             MockTranscriptSnippet(text="Fallback content.", start=0.0, duration=2.0),
         ]
 
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.return_value = mock_transcript_data
+        mock_transcript_api.fetch.return_value = mock_transcript_data
 
-            result = get_transcript("dQw4w9WgXcQ", languages=["ko", "en"])
+        result = get_transcript("dQw4w9WgXcQ", languages=["ko", "en"])
 
-            assert result is not None
-            mock_instance.fetch.assert_called_once_with(
-                "dQw4w9WgXcQ", languages=["ko", "en"]
-            )
+        assert result is not None
+        mock_transcript_api.fetch.assert_called_once_with(
+            "dQw4w9WgXcQ", languages=["ko", "en"]
+        )
 
-    def test_get_transcript_no_transcript_available(self) -> None:
+    def test_get_transcript_no_transcript_available(
+        self, mock_transcript_api: MagicMock
+    ) -> None:
         """자막 없는 경우."""
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            from youtube_transcript_api import TranscriptsDisabled
+        from youtube_transcript_api import TranscriptsDisabled
 
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.side_effect = TranscriptsDisabled("video_id")
+        mock_transcript_api.fetch.side_effect = TranscriptsDisabled("video_id")
 
-            result = get_transcript("dQw4w9WgXcQ")
+        result = get_transcript("dQw4w9WgXcQ")
 
-            assert result is None
+        assert result is None
 
-    def test_get_transcript_api_error(self) -> None:
+    def test_get_transcript_api_error(self, mock_transcript_api: MagicMock) -> None:
         """API 에러."""
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.side_effect = Exception("API Error")
+        mock_transcript_api.fetch.side_effect = Exception("API Error")
 
-            result = get_transcript("dQw4w9WgXcQ")
+        result = get_transcript("dQw4w9WgXcQ")
 
-            assert result is None
+        assert result is None
 
-    def test_get_transcript_concatenates_text(self) -> None:
+    def test_get_transcript_concatenates_text(
+        self, mock_transcript_api: MagicMock
+    ) -> None:
         """여러 세그먼트 텍스트 연결."""
         mock_transcript_data = [
             MockTranscriptSnippet(text="First segment.", start=0.0, duration=1.0),
@@ -219,38 +216,64 @@ class TestGetTranscript:
             MockTranscriptSnippet(text="Third segment.", start=2.0, duration=1.0),
         ]
 
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.return_value = mock_transcript_data
+        mock_transcript_api.fetch.return_value = mock_transcript_data
 
-            result = get_transcript("dQw4w9WgXcQ")
+        result = get_transcript("dQw4w9WgXcQ")
 
-            assert result is not None
-            assert "First segment" in result.text
-            assert "Second segment" in result.text
-            assert "Third segment" in result.text
+        assert result is not None
+        assert "First segment" in result.text
+        assert "Second segment" in result.text
+        assert "Third segment" in result.text
 
-    def test_get_transcript_duration(self) -> None:
+    def test_get_transcript_duration(self, mock_transcript_api: MagicMock) -> None:
         """자막 전체 길이 계산."""
         mock_transcript_data = [
             MockTranscriptSnippet(text="First.", start=0.0, duration=2.0),
             MockTranscriptSnippet(text="Last.", start=58.0, duration=2.0),
         ]
 
-        with patch(
-            "src.agent.domains.collector.tools.youtube_tool.YouTubeTranscriptApi"
-        ) as mock_api_class:
-            mock_instance = MagicMock()
-            mock_api_class.return_value = mock_instance
-            mock_instance.fetch.return_value = mock_transcript_data
+        mock_transcript_api.fetch.return_value = mock_transcript_data
 
-            result = get_transcript("dQw4w9WgXcQ")
+        result = get_transcript("dQw4w9WgXcQ")
 
-            assert result is not None
-            assert result.duration_seconds == 60.0  # 58.0 + 2.0
+        assert result is not None
+        assert result.duration_seconds == 60.0  # 58.0 + 2.0
+
+    def test_get_transcript_cached_per_video_and_languages(
+        self, mock_transcript_api: MagicMock
+    ) -> None:
+        """같은 영상/언어 조합은 한 번만 조회."""
+        mock_transcript_data = [
+            MockTranscriptSnippet(text="Cached.", start=0.0, duration=1.0),
+        ]
+
+        mock_transcript_api.fetch.return_value = mock_transcript_data
+
+        first = get_transcript("dQw4w9WgXcQ", languages=["ko", "en"])
+        second = get_transcript("dQw4w9WgXcQ", languages=["ko", "en"])
+        get_transcript("dQw4w9WgXcQ", languages=["en"])
+
+        assert first is second
+        assert mock_transcript_api.fetch.call_count == 2
+
+    def test_get_transcript_failure_not_cached(
+        self, mock_transcript_api: MagicMock
+    ) -> None:
+        """실패한 조회는 캐시하지 않고 다음 호출에서 재시도."""
+        mock_transcript_data = [
+            MockTranscriptSnippet(text="Retry.", start=0.0, duration=1.0),
+        ]
+
+        mock_transcript_api.fetch.side_effect = [
+            Exception("API Error"),
+            mock_transcript_data,
+        ]
+
+        assert get_transcript("dQw4w9WgXcQ") is None
+        result = get_transcript("dQw4w9WgXcQ")
+
+        assert result is not None
+        assert result.text == "Retry."
 
 
 class TestFetchYoutube:
@@ -259,7 +282,7 @@ class TestFetchYoutube:
     @pytest.fixture
     def mock_content_repo(self) -> MagicMock:
         """Mock ContentRepository."""
-        return MagicMock()
+        return MagicMock(spec=ContentRepository)
 
     @pytest.fixture
     def sample_transcript(self) -> YouTubeTranscript:
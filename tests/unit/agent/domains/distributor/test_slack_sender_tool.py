@@ -1,20 +1,52 @@
 """Tests for slack_sender_tool."""
 
 from datetime import UTC, date, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.adapters.slack_client import SlackClient
 from src.agent.domains.distributor.tools.slack_sender_tool import (
     DigestBlock,
     SlackDigestMessage,
+    _convert_mrkdwn,
     build_content_blocks,
     send_digest,
+    to_mrkdwn,
 )
 from src.models.content import Content, ProcessingStatus
 from src.models.digest import Digest, DigestStatus
 
 
+class TestToMrkdwn:
+    """Tests for to_mrkdwn function."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_mrkdwn_cache(self) -> None:
+        """테스트 간 변환 캐시 격리."""
+        _convert_mrkdwn.cache_clear()
+
+    def test_converts_markdown(self) -> None:
+        """표준 Markdown 굵게 표시를 mrkdwn으로 변환."""
+        assert to_mrkdwn("**중요**") == "*중요*"
+
+    def test_empty_text_returned_as_is(self) -> None:
+        """빈 문자열은 그대로 반환."""
+        assert to_mrkdwn("") == ""
+
+    def test_repeated_text_converted_once(self) -> None:
+        """같은 텍스트는 한 번만 변환."""
+        with patch(
+            "src.agent.domains.distributor.tools.slack_sender_tool._mrkdwn_converter"
+        ) as mock_converter:
+            mock_converter.convert.return_value = "*중요*"
+
+            assert to_mrkdwn("**중요**") == "*중요*"
+            assert to_mrkdwn("**중요**") == "*중요*"
+
+        mock_converter.convert.assert_called_once_with("**중요**")
+
+
 class TestDigestBlock:
     """Tests for DigestBlock dataclass."""
 
@@ -163,7 +195,7 @@ class TestSendDigest:
     @pytest.fixture
     def mock_slack_client(self) -> MagicMock:
         """Mock SlackClient."""
-        client = MagicMock()
+        client = MagicMock(spec=SlackClient)
         client.post_message.return_value = {"ok": True, "ts": "1234567890.123456"}
         return client
 
@@ -368,3 +400,63 @@ class TestSendDigest:
 
         assert result.success is True
         assert result.message_ts == "first_ts"
+
+    def test_send_digest_batch_single_message(
+        self,
+        mock_slack_client: MagicMock,
+        sample_digest: Digest,
+        sample_contents: list[Content],
+    ) -> None:
+        """batch 모드는 콘텐츠를 구분선으로 이어 한 메시지로 발송."""
+        result = send_digest(
+            digest=sample_digest,
+            contents=sample_contents,
+            slack_client=mock_slack_client,
+            batch=True,
+        )
+
+        assert result.success is True
+        assert result.message_ts == "1234567890.123456"
+        mock_slack_client.post_message.assert_called_once()
+
+        kwargs = mock_slack_client.post_message.call_args[1]
+        blocks = kwargs["blocks"]
+        assert len(blocks) == 7  # 3블록 x 2 + 구분선 1
+        assert blocks[3] == {"type": "divider"}
+        assert kwargs["text"] == "GPT-5 출시"
+
+    def test_send_digest_batch_splits_at_block_limit(
+        self,
+        mock_slack_client: MagicMock,
+        sample_digest: Digest,
+    ) -> None:
+        """batch 모드는 메시지당 50블록을 넘지 않도록 나눠 발송."""
+        now = datetime.now(UTC)
+        many_contents = [
+            Content(
+                id=f"cnt_{i:03d}",
+                source_id="src_001",
+                content_key=f"src_001:hash{i}",
+                original_url=f"https://example.com/article{i}",
+                original_title=f"Article {i}",
+                original_language="en",
+                processing_status=ProcessingStatus.COMPLETED,
+                collected_at=now,
+                title_ko=f"기사 {i}",
+            )
+            for i in range(15)
+        ]
+
+        send_digest(
+            digest=sample_digest,
+            contents=many_contents,
+            slack_client=mock_slack_client,
+            batch=True,
+        )
+
+        calls = mock_slack_client.post_message.call_args_list
+        assert len(calls) == 2
+        # 12개 콘텐츠 (36블록 + 구분선 11) / 나머지 3개 (9블록 + 구분선 2)
+        assert len(calls[0][1]["blocks"]) == 47
+        assert len(calls[1][1]["blocks"]) == 11
+        assert calls[1][1]["text"] == "기사 12"
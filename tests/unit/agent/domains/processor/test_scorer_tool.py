@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.adapters.gemini_client import GeminiClient
 from src.agent.domains.processor.tools.scorer_tool import (
     ScoringResult,
     score_relevance,
@@ -33,7 +34,7 @@ class TestScoreRelevance:
     @pytest.fixture
     def mock_gemini_client(self) -> MagicMock:
         """Mock GeminiClient."""
-        return MagicMock()
+        return MagicMock(spec=GeminiClient)
 
     def test_score_returns_0_to_1(
         self,
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.adapters.gemini_client import GeminiClient
 from src.agent.domains.processor.tools.summarizer_tool import (
     SummaryResult,
     summarize_content,
@@ -33,7 +34,7 @@ class TestSummarizeContent:
     @pytest.fixture
     def mock_gemini_client(self) -> MagicMock:
         """Mock GeminiClient."""
-        return MagicMock()
+        return MagicMock(spec=GeminiClient)
 
     def test_summarize_returns_geeknews_style(
         self,
@@ -1,44 +1,72 @@
 """Tests for translator tool."""
 
+from collections.abc import Callable
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.agent.domains.processor.tools.translator_tool import (
-    TranslationResult,
-    translate_content,
-)
-from src.models.content import Content, ProcessingStatus
+if TYPE_CHECKING:
+    from src.agent.domains.processor.tools.translator_tool import TranslationResult
+    from src.models.content import Content
+
+# 재현 가능한 고정 수집 시각
+_FIXED_TS = datetime(2025, 1, 1, tzinfo=UTC)
+
+# 최대 길이(30k)를 넘는 본문 (50k 문자)
+_LONG_BODY = "A" * 50_000
+
+
+@pytest.fixture(scope="module")
+def sample_content() -> "Content":
+    """샘플 콘텐츠 (모듈 내 공유, 테스트에서 수정하지 않음)."""
+    from src.models.content import Content, ProcessingStatus
+
+    return Content(
+        id="cnt_test123",
+        source_id="src_001",
+        content_key="src_001:abc123",
+        original_url="https://example.com/article",
+        original_title="GPT-5 Released with Major Reasoning Improvements",
+        original_body="OpenAI has announced GPT-5, featuring significant improvements in reasoning capabilities.",
+        original_language="en",
+        processing_status=ProcessingStatus.PENDING,
+        collected_at=_FIXED_TS,
+    )
+
+
+@pytest.fixture(scope="module")
+def translate_fn() -> Callable[..., "TranslationResult"]:
+    """translate_content (Gemini SDK 의존성은 이 파일의 테스트가 선택될 때만 import)."""
+    from src.agent.domains.processor.tools.translator_tool import translate_content
+
+    return translate_content
+
+
+@pytest.fixture(scope="module")
+def translation_result_cls() -> type["TranslationResult"]:
+    """TranslationResult 클래스 (지연 import)."""
+    from src.agent.domains.processor.tools.translator_tool import TranslationResult
+
+    return TranslationResult
 
 
 class TestTranslateContent:
     """Tests for translate_content function."""
 
-    @pytest.fixture
-    def sample_content(self) -> Content:
-        """샘플 콘텐츠."""
-        return Content(
-            id="cnt_test123",
-            source_id="src_001",
-            content_key="src_001:abc123",
-            original_url="https://example.com/article",
-            original_title="GPT-5 Released with Major Reasoning Improvements",
-            original_body="OpenAI has announced GPT-5, featuring significant improvements in reasoning capabilities.",
-            original_language="en",
-            processing_status=ProcessingStatus.PENDING,
-            collected_at=datetime.now(UTC),
-        )
-
     @pytest.fixture
     def mock_gemini_client(self) -> MagicMock:
         """Mock GeminiClient."""
-        return MagicMock()
+        from src.adapters.gemini_client import GeminiClient
+
+        return MagicMock(spec=GeminiClient)
 
     def test_translate_title_and_body(
         self,
-        sample_content: Content,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """제목과 본문 번역."""
         mock_gemini_client.translate.side_effect = [
@@ -46,7 +74,7 @@ class TestTranslateContent:
             "OpenAI가 GPT-5를 발표했습니다. 추론 능력이 크게 향상되었습니다.",
         ]
 
-        result = translate_content(
+        result = translate_fn(
             content=sample_content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
@@ -58,13 +86,14 @@ class TestTranslateContent:
 
     def test_translate_with_source_language(
         self,
-        sample_content: Content,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """원본 언어 지정."""
         mock_gemini_client.translate.return_value = "번역된 텍스트"
 
-        translate_content(
+        translate_fn(
             content=sample_content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
@@ -76,22 +105,20 @@ class TestTranslateContent:
 
     def test_translate_korean_content_skips(
         self,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """한국어 콘텐츠는 번역 건너뜀."""
-        korean_content = Content(
-            id="cnt_test123",
-            source_id="src_001",
-            content_key="src_001:abc123",
-            original_url="https://example.com/article",
-            original_title="GPT-5 출시: 추론 능력 대폭 향상",
-            original_body="OpenAI가 GPT-5를 발표했습니다.",
-            original_language="ko",
-            processing_status=ProcessingStatus.PENDING,
-            collected_at=datetime.now(UTC),
+        korean_content = sample_content.model_copy(
+            update={
+                "original_title": "GPT-5 출시: 추론 능력 대폭 향상",
+                "original_body": "OpenAI가 GPT-5를 발표했습니다.",
+                "original_language": "ko",
+            }
         )
 
-        result = translate_content(
+        result = translate_fn(
             content=korean_content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
@@ -104,24 +131,18 @@ class TestTranslateContent:
 
     def test_translate_empty_body(
         self,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """본문 없는 경우."""
-        content = Content(
-            id="cnt_test123",
-            source_id="src_001",
-            content_key="src_001:abc123",
-            original_url="https://example.com/article",
-            original_title="Title Only Article",
-            original_body=None,
-            original_language="en",
-            processing_status=ProcessingStatus.PENDING,
-            collected_at=datetime.now(UTC),
+        content = sample_content.model_copy(
+            update={"original_title": "Title Only Article", "original_body": None}
         )
 
         mock_gemini_client.translate.return_value = "제목만 있는 글"
 
-        result = translate_content(
+        result = translate_fn(
             content=content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
@@ -134,22 +155,21 @@ class TestTranslateContent:
 
     def test_translate_result_structure(
         self,
-        sample_content: Content,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
+        translation_result_cls: type["TranslationResult"],
     ) -> None:
         """TranslationResult 구조 확인."""
-        mock_gemini_client.translate.side_effect = [
-            "번역된 제목",
-            "번역된 본문",
-        ]
+        mock_gemini_client.translate.return_value = "번역된 텍스트"
 
-        result = translate_content(
+        result = translate_fn(
             content=sample_content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
         )
 
-        assert isinstance(result, TranslationResult)
+        assert isinstance(result, translation_result_cls)
         assert hasattr(result, "title_ko")
         assert hasattr(result, "body_ko")
         assert hasattr(result, "source_language")
@@ -157,13 +177,14 @@ class TestTranslateContent:
 
     def test_translate_preserves_languages(
         self,
-        sample_content: Content,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """언어 정보 보존."""
-        mock_gemini_client.translate.side_effect = ["제목", "본문"]
+        mock_gemini_client.translate.return_value = "번역된 텍스트"
 
-        result = translate_content(
+        result = translate_fn(
             content=sample_content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
@@ -174,25 +195,18 @@ class TestTranslateContent:
 
     def test_translate_long_body_truncates(
         self,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """긴 본문 자동 잘라내기."""
-        long_body = "A" * 50000  # 50k 문자
-        content = Content(
-            id="cnt_test123",
-            source_id="src_001",
-            content_key="src_001:abc123",
-            original_url="https://example.com/article",
-            original_title="Long Article",
-            original_body=long_body,
-            original_language="en",
-            processing_status=ProcessingStatus.PENDING,
-            collected_at=datetime.now(UTC),
+        content = sample_content.model_copy(
+            update={"original_title": "Long Article", "original_body": _LONG_BODY}
         )
 
-        mock_gemini_client.translate.side_effect = ["긴 글", "번역된 본문"]
+        mock_gemini_client.translate.return_value = "번역된 텍스트"
 
-        translate_content(
+        translate_fn(
             content=content,
             gemini_client=mock_gemini_client,
             target_lang="ko",
@@ -206,14 +220,15 @@ class TestTranslateContent:
 
     def test_translate_error_handling(
         self,
-        sample_content: Content,
+        sample_content: "Content",
         mock_gemini_client: MagicMock,
+        translate_fn: Callable[..., "TranslationResult"],
     ) -> None:
         """번역 에러 처리."""
         mock_gemini_client.translate.side_effect = Exception("API Error")
 
         with pytest.raises(Exception) as exc_info:
-            translate_content(
+            translate_fn(
                 content=sample_content,
                 gemini_client=mock_gemini_client,
                 target_lang="ko",
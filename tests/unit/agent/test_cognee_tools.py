@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+from src.agent.core.cognee_tools import get_cognee_tools
+
 
 class TestCogneeTools:
     """Test Cognee tools wrapper."""
@@ -20,8 +22,6 @@ class TestCogneeTools:
             "src.agent.core.cognee_tools._get_cognee_imports",
             return_value=mock_tools,
         ):
-            from src.agent.core.cognee_tools import get_cognee_tools
-
             add_memory, search_memory = get_cognee_tools()
 
             assert add_memory is mock_add
@@ -44,8 +44,6 @@ class TestCogneeTools:
             "src.agent.core.cognee_tools._get_cognee_imports",
             return_value=mock_tools,
         ):
-            from src.agent.core.cognee_tools import get_cognee_tools
-
             add_memory, search_memory = get_cognee_tools(workspace_id="ws-123")
 
             mock_get_sessionized.assert_called_once_with("ws-123")
@@ -66,8 +64,6 @@ class TestCogneeTools:
             "src.agent.core.cognee_tools._get_cognee_imports",
             return_value=mock_tools,
         ):
-            from src.agent.core.cognee_tools import get_cognee_tools
-
             add_memory, search_memory = get_cognee_tools()
 
             # Should be callable
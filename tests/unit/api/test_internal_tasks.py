@@ -1,199 +1,231 @@
 """Tests for internal tasks endpoints (Cloud Tasks callbacks)."""
 
-from unittest.mock import MagicMock, patch
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
+from src.api import internal_tasks
+from src.api.internal_tasks import (
+    CollectSourceRequest,
+    ProcessContentRequest,
+    SendDigestRequest,
+    collect_source_task,
+    process_content_task,
+    send_digest_task,
+)
+from src.repositories.content_repo import ContentRepository
+from src.repositories.digest_repo import DigestRepository
+from src.repositories.source_repo import SourceRepository
+from src.services.content_pipeline import ContentPipeline
+from src.services.digest_service import DigestService
+
+
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """테스트용 FastAPI 앱."""
+    app = FastAPI()
+    app.include_router(internal_tasks.router)
+    return app
+
+
+@pytest.fixture(scope="module")
+def client(app: FastAPI) -> TestClient:
+    """테스트 클라이언트."""
+    return TestClient(app)
+
+
+def _override(
+    monkeypatch: pytest.MonkeyPatch, factory_name: str, spec: type
+) -> MagicMock:
+    """internal_tasks의 팩토리 함수가 spec을 따르는 Mock을 반환하도록 교체."""
+    mock = MagicMock(spec=spec)
+    monkeypatch.setattr(internal_tasks, factory_name, lambda request=None: mock)
+    return mock
+
+
+@pytest.fixture
+def mock_pipeline(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_content_pipeline이 반환하는 Mock."""
+    return _override(monkeypatch, "get_content_pipeline", ContentPipeline)
+
+
+@pytest.fixture
+def mock_service(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_digest_service가 반환하는 Mock."""
+    return _override(monkeypatch, "get_digest_service", DigestService)
+
+
+@pytest.fixture
+def mock_content_repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_content_repo가 반환하는 Mock."""
+    return _override(monkeypatch, "get_content_repo", ContentRepository)
+
+
+@pytest.fixture
+def mock_digest_repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_digest_repo가 반환하는 Mock."""
+    return _override(monkeypatch, "get_digest_repo", DigestRepository)
+
+
+@pytest.fixture
+def mock_source_repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_source_repo가 반환하는 Mock."""
+    return _override(monkeypatch, "get_source_repo", SourceRepository)
+
+
+async def _run_task(
+    endpoint: Callable[[Request, Any], Awaitable[dict[str, Any]]],
+    body: BaseModel,
+) -> tuple[int, Any]:
+    """엔드포인트 함수를 직접 호출해 (상태 코드, 응답 본문) 반환.
+
+    팩토리 함수가 Mock으로 교체되어 있으므로 request는 사용되지 않습니다.
+    """
+    try:
+        return 200, await endpoint(MagicMock(spec=Request), body)
+    except HTTPException as e:
+        return e.status_code, e.detail
+
+
+def _assert_task_response(
+    status: int, payload: Any, id_field: str, id_value: str, expected_status: int
+) -> None:
+    """상태 코드별 태스크 응답 본문 확인."""
+    assert status == expected_status
+    if expected_status == 200:
+        assert payload["status"] == "success"
+        assert payload[id_field] == id_value
+    elif expected_status == 404:
+        assert "not found" in payload.lower()
+    else:
+        assert "failed" in payload["error"].lower()
+
+
+class TestInternalTasksRouting:
+    """TestClient로 라우터 연결만 확인하는 스모크 테스트."""
+
+    def test_process_route_is_wired(
+        self,
+        client: TestClient,
+        mock_pipeline: MagicMock,
+        mock_content_repo: MagicMock,
+    ) -> None:
+        """POST /internal/tasks/process가 엔드포인트로 연결됨."""
+        mock_pipeline._process_single_content.return_value = True
+        mock_content_repo.get_by_id.return_value = MagicMock()
 
-class TestInternalTasksEndpoints:
-    """Tests for internal tasks API endpoints."""
-
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """테스트용 FastAPI 앱."""
-        from src.api.internal_tasks import router
-
-        app = FastAPI()
-        app.include_router(router)
-        return app
-
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """테스트 클라이언트."""
-        return TestClient(app)
-
-    def test_process_content_task(self, client: TestClient) -> None:
-        """POST /internal/tasks/process 단일 콘텐츠 처리."""
-        with patch("src.api.internal_tasks.get_content_pipeline") as mock_get:
-            mock_pipeline = MagicMock()
-            mock_pipeline._process_single_content.return_value = True
-            mock_get.return_value = mock_pipeline
-
-            with patch("src.api.internal_tasks.get_content_repo") as mock_repo_get:
-                mock_repo = MagicMock()
-                mock_content = MagicMock()
-                mock_content.id = "cnt_001"
-                mock_repo.get_by_id.return_value = mock_content
-                mock_repo_get.return_value = mock_repo
-
-                response = client.post(
-                    "/internal/tasks/process",
-                    json={"content_id": "cnt_001"},
-                )
+        response = client.post(
+            "/internal/tasks/process",
+            json={"content_id": "cnt_001"},
+        )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert data["content_id"] == "cnt_001"
-
-    def test_process_content_task_not_found(self, client: TestClient) -> None:
-        """존재하지 않는 콘텐츠 처리 요청."""
-        with patch("src.api.internal_tasks.get_content_repo") as mock_repo_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_repo_get.return_value = mock_repo
-
-            response = client.post(
-                "/internal/tasks/process",
-                json={"content_id": "cnt_999"},
-            )
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    def test_process_content_task_failure(self, client: TestClient) -> None:
-        """콘텐츠 처리 실패 시 에러 응답."""
-        with patch("src.api.internal_tasks.get_content_pipeline") as mock_get:
-            mock_pipeline = MagicMock()
-            mock_pipeline._process_single_content.return_value = False
-            mock_get.return_value = mock_pipeline
-
-            with patch("src.api.internal_tasks.get_content_repo") as mock_repo_get:
-                mock_repo = MagicMock()
-                mock_content = MagicMock()
-                mock_content.id = "cnt_001"
-                mock_repo.get_by_id.return_value = mock_content
-                mock_repo_get.return_value = mock_repo
-
-                response = client.post(
-                    "/internal/tasks/process",
-                    json={"content_id": "cnt_001"},
-                )
-
-        assert response.status_code == 500
-        data = response.json()
-        assert "failed" in data["detail"]["error"].lower()
-
-    def test_send_digest_task(self, client: TestClient) -> None:
-        """POST /internal/tasks/send-digest 단일 다이제스트 발송."""
-        with patch("src.api.internal_tasks.get_digest_service") as mock_get:
-            mock_service = MagicMock()
-            mock_service.send_digest.return_value = True
-            mock_get.return_value = mock_service
-
-            with patch("src.api.internal_tasks.get_digest_repo") as mock_repo_get:
-                mock_repo = MagicMock()
-                mock_digest = MagicMock()
-                mock_digest.id = "dgst_001"
-                mock_repo.get_by_id.return_value = mock_digest
-                mock_repo_get.return_value = mock_repo
-
-                response = client.post(
-                    "/internal/tasks/send-digest",
-                    json={"digest_id": "dgst_001"},
-                )
+        assert response.json() == {"status": "success", "content_id": "cnt_001"}
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert data["digest_id"] == "dgst_001"
-
-    def test_send_digest_task_not_found(self, client: TestClient) -> None:
-        """존재하지 않는 다이제스트 발송 요청."""
-        with patch("src.api.internal_tasks.get_digest_repo") as mock_repo_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_repo_get.return_value = mock_repo
-
-            response = client.post(
-                "/internal/tasks/send-digest",
-                json={"digest_id": "dgst_999"},
-            )
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    def test_send_digest_task_failure(self, client: TestClient) -> None:
-        """다이제스트 발송 실패 시 에러 응답."""
-        with patch("src.api.internal_tasks.get_digest_service") as mock_get:
-            mock_service = MagicMock()
-            mock_service.send_digest.return_value = False
-            mock_get.return_value = mock_service
-
-            with patch("src.api.internal_tasks.get_digest_repo") as mock_repo_get:
-                mock_repo = MagicMock()
-                mock_digest = MagicMock()
-                mock_digest.id = "dgst_001"
-                mock_repo.get_by_id.return_value = mock_digest
-                mock_repo_get.return_value = mock_repo
-
-                response = client.post(
-                    "/internal/tasks/send-digest",
-                    json={"digest_id": "dgst_001"},
-                )
-
-        assert response.status_code == 500
-        data = response.json()
-        assert "failed" in data["detail"]["error"].lower()
-
-    def test_collect_source_task(self, client: TestClient) -> None:
-        """POST /internal/tasks/collect-source 단일 소스 수집."""
-        with patch("src.api.internal_tasks.get_content_pipeline") as mock_get:
-            mock_pipeline = MagicMock()
-            # 반환값이 list[str]로 변경됨
-            mock_pipeline._collect_from_source.return_value = [
-                "cnt_001",
-                "cnt_002",
-                "cnt_003",
-                "cnt_004",
-                "cnt_005",
-            ]
-            mock_get.return_value = mock_pipeline
-
-            with patch("src.api.internal_tasks.get_source_repo") as mock_repo_get:
-                mock_repo = MagicMock()
-                mock_source = MagicMock()
-                mock_source.id = "src_001"
-                mock_repo.get_by_id.return_value = mock_source
-                mock_repo_get.return_value = mock_repo
-
-                response = client.post(
-                    "/internal/tasks/collect-source",
-                    json={"source_id": "src_001"},
-                )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
-        assert data["source_id"] == "src_001"
-        assert data["collected"] == 5
-
-    def test_collect_source_task_not_found(self, client: TestClient) -> None:
-        """존재하지 않는 소스 수집 요청."""
-        with patch("src.api.internal_tasks.get_source_repo") as mock_repo_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_repo_get.return_value = mock_repo
-
-            response = client.post(
-                "/internal/tasks/collect-source",
-                json={"source_id": "src_999"},
-            )
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+class TestInternalTasksEndpoints:
+    """Tests for internal tasks endpoint functions (ASGI 스택 없이 직접 호출)."""
+
+    @pytest.mark.parametrize(
+        ("content_exists", "processed", "expected_status"),
+        [
+            pytest.param(True, True, 200, id="success"),
+            pytest.param(False, None, 404, id="not-found"),
+            pytest.param(True, False, 500, id="failure"),
+        ],
+    )
+    async def test_process_content_task(
+        self,
+        mock_pipeline: MagicMock,
+        mock_content_repo: MagicMock,
+        content_exists: bool,
+        processed: bool | None,
+        expected_status: int,
+    ) -> None:
+        """process_content_task 단일 콘텐츠 처리."""
+        mock_pipeline._process_single_content.return_value = processed
+        mock_content = MagicMock()
+        mock_content.id = "cnt_001"
+        mock_content_repo.get_by_id.return_value = (
+            mock_content if content_exists else None
+        )
+
+        status, payload = await _run_task(
+            process_content_task, ProcessContentRequest(content_id="cnt_001")
+        )
+
+        _assert_task_response(status, payload, "content_id", "cnt_001", expected_status)
+        if not content_exists:
+            mock_pipeline._process_single_content.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("digest_exists", "sent", "expected_status"),
+        [
+            pytest.param(True, True, 200, id="success"),
+            pytest.param(False, None, 404, id="not-found"),
+            pytest.param(True, False, 500, id="failure"),
+        ],
+    )
+    async def test_send_digest_task(
+        self,
+        mock_service: MagicMock,
+        mock_digest_repo: MagicMock,
+        digest_exists: bool,
+        sent: bool | None,
+        expected_status: int,
+    ) -> None:
+        """send_digest_task 단일 다이제스트 발송."""
+        mock_service.send_digest.return_value = sent
+        mock_digest = MagicMock()
+        mock_digest.id = "dgst_001"
+        mock_digest_repo.get_by_id.return_value = mock_digest if digest_exists else None
+
+        status, payload = await _run_task(
+            send_digest_task, SendDigestRequest(digest_id="dgst_001")
+        )
+
+        _assert_task_response(status, payload, "digest_id", "dgst_001", expected_status)
+        if not digest_exists:
+            mock_service.send_digest.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("source_exists", "expected_status"),
+        [
+            pytest.param(True, 200, id="success"),
+            pytest.param(False, 404, id="not-found"),
+        ],
+    )
+    async def test_collect_source_task(
+        self,
+        mock_pipeline: MagicMock,
+        mock_source_repo: MagicMock,
+        source_exists: bool,
+        expected_status: int,
+    ) -> None:
+        """collect_source_task 단일 소스 수집."""
+        # 반환값이 list[str]로 변경됨
+        mock_pipeline._collect_from_source.return_value = [
+            "cnt_001",
+            "cnt_002",
+            "cnt_003",
+            "cnt_004",
+            "cnt_005",
+        ]
+        mock_source = MagicMock()
+        mock_source.id = "src_001"
+        mock_source_repo.get_by_id.return_value = mock_source if source_exists else None
+
+        status, payload = await _run_task(
+            collect_source_task, CollectSourceRequest(source_id="src_001")
+        )
+
+        _assert_task_response(status, payload, "source_id", "src_001", expected_status)
+        if source_exists:
+            assert payload["collected"] == 5
+        else:
+            mock_pipeline._collect_from_source.assert_not_called()
@@ -1,42 +1,64 @@
 """Tests for scheduler endpoints."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from src.api import scheduler
+from src.repositories.subscription_repo import SubscriptionRepository
+from src.services.content_pipeline import ContentPipeline
+from src.services.digest_service import DigestService
 
-class TestSchedulerEndpoints:
-    """Tests for scheduler API endpoints."""
 
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """테스트용 FastAPI 앱."""
-        from src.api.scheduler import router
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """테스트용 FastAPI 앱."""
+    app = FastAPI()
+    app.include_router(scheduler.router)
+    return app
+
+
+@pytest.fixture(scope="module")
+def client(app: FastAPI) -> TestClient:
+    """테스트 클라이언트."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def mock_pipeline(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_content_pipeline이 반환하는 Mock."""
+    mock = MagicMock(spec=ContentPipeline)
+    monkeypatch.setattr(scheduler, "get_content_pipeline", lambda request=None: mock)
+    return mock
+
 
-        app = FastAPI()
-        app.include_router(router)
-        return app
+@pytest.fixture
+def mock_service(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_digest_service가 반환하는 Mock."""
+    mock = MagicMock(spec=DigestService)
+    # 인스턴스 속성은 클래스 spec에 없으므로 직접 지정
+    mock.subscription_repo = MagicMock(spec=SubscriptionRepository)
+    monkeypatch.setattr(scheduler, "get_digest_service", lambda request=None: mock)
+    return mock
 
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """테스트 클라이언트."""
-        return TestClient(app)
 
-    def test_collect_endpoint(self, client: TestClient) -> None:
+class TestSchedulerEndpoints:
+    """Tests for scheduler API endpoints."""
+
+    def test_collect_endpoint(
+        self, client: TestClient, mock_pipeline: MagicMock
+    ) -> None:
         """POST /internal/collect 콘텐츠 수집 및 처리 enqueue."""
-        with patch("src.api.scheduler.get_content_pipeline") as mock_get:
-            mock_pipeline = MagicMock()
-            mock_pipeline.collect_from_sources.return_value = {
-                "total_sources": 5,
-                "collected": 10,
-                "enqueued": 10,
-                "errors": 0,
-            }
-            mock_get.return_value = mock_pipeline
-
-            response = client.post("/internal/collect")
+        mock_pipeline.collect_from_sources.return_value = {
+            "total_sources": 5,
+            "collected": 10,
+            "enqueued": 10,
+            "errors": 0,
+        }
+
+        response = client.post("/internal/collect")
 
         assert response.status_code == 200
         data = response.json()
@@ -44,45 +66,77 @@ class TestSchedulerEndpoints:
         assert data["result"]["total_sources"] == 5
         assert data["result"]["enqueued"] == 10
 
-    def test_distribute_endpoint(self, client: TestClient) -> None:
+    def test_distribute_endpoint(
+        self, client: TestClient, mock_service: MagicMock
+    ) -> None:
         """POST /internal/distribute 다이제스트 생성 및 발송."""
-        with patch("src.api.scheduler.get_digest_service") as mock_get:
-            mock_service = MagicMock()
+        # Mock subscription_repo
+        mock_subscription = MagicMock()
+        mock_subscription.id = "sub_001"
+        mock_subscription.preferences.min_relevance = 0.3
+        mock_service.subscription_repo.find_active_subscriptions.return_value = [
+            mock_subscription
+        ]
 
-            # Mock subscription_repo
-            mock_subscription = MagicMock()
-            mock_subscription.id = "sub_001"
-            mock_subscription.preferences.min_relevance = 0.3
-            mock_service.subscription_repo.find_active_subscriptions.return_value = [
-                mock_subscription
-            ]
+        # Mock digest creation
+        mock_digest = MagicMock()
+        mock_digest.status.value = "pending"
+        mock_service.create_digest.return_value = mock_digest
 
-            # Mock digest creation
-            mock_digest = MagicMock()
-            mock_digest.status.value = "pending"
-            mock_service.create_digest.return_value = mock_digest
+        # Mock digest sending
+        mock_service.send_digests.return_value = [True]
 
-            # Mock digest sending
-            mock_service.send_digest.return_value = True
-
-            mock_get.return_value = mock_service
-
-            response = client.post("/internal/distribute")
+        response = client.post("/internal/distribute")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         assert data["result"]["total_subscriptions"] == 1
         assert data["result"]["sent"] == 1
+        mock_service.send_digests.assert_called_once_with([mock_digest])
+        mock_service.send_digest.assert_not_called()
+
+    def test_distribute_sends_created_digests_together(
+        self, client: TestClient, mock_service: MagicMock
+    ) -> None:
+        """생성된 다이제스트를 모아 한 번에 발송하고, 건너뜀/실패를 집계."""
+        subscriptions = [MagicMock(id=f"sub_00{i}") for i in range(4)]
+        mock_service.subscription_repo.find_active_subscriptions.return_value = (
+            subscriptions
+        )
+
+        pending = [MagicMock(), MagicMock()]
+        for digest in pending:
+            digest.status.value = "pending"
+        sent = MagicMock()
+        sent.status.value = "sent"
+        mock_service.create_digest.side_effect = [
+            pending[0],
+            sent,
+            ValueError("Missing channel_id"),
+            pending[1],
+        ]
+        mock_service.send_digests.return_value = [True, False]
+
+        response = client.post("/internal/distribute")
 
-    def test_collect_with_error(self, client: TestClient) -> None:
+        assert response.status_code == 200
+        assert response.json()["result"] == {
+            "total_subscriptions": 4,
+            "created": 2,
+            "sent": 1,
+            "skipped": 1,
+            "failed": 2,
+        }
+        mock_service.send_digests.assert_called_once_with(pending)
+
+    def test_collect_with_error(
+        self, client: TestClient, mock_pipeline: MagicMock
+    ) -> None:
         """수집 중 에러 발생 시 처리."""
-        with patch("src.api.scheduler.get_content_pipeline") as mock_get:
-            mock_pipeline = MagicMock()
-            mock_pipeline.collect_from_sources.side_effect = Exception("Database error")
-            mock_get.return_value = mock_pipeline
+        mock_pipeline.collect_from_sources.side_effect = Exception("Database error")
 
-            response = client.post("/internal/collect")
+        response = client.post("/internal/collect")
 
         assert response.status_code == 500
         data = response.json()
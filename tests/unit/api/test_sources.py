@@ -1,150 +1,163 @@
 """Tests for sources CRUD API endpoints."""
 
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
+from src.api import sources
 from src.models.source import Source, SourceType
+from src.repositories.source_repo import SourceRepository
 
 
-class TestSourcesEndpoints:
-    """Tests for sources API endpoints."""
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """테스트용 FastAPI 앱."""
+    app = FastAPI()
+    app.include_router(sources.router)
+    return app
 
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """테스트용 FastAPI 앱."""
-        from src.api.sources import router
-
-        app = FastAPI()
-        app.include_router(router)
-        return app
-
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """테스트 클라이언트."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def sample_source(self) -> Source:
-        """샘플 소스."""
-        now = datetime.now(UTC)
-        return Source(
-            id="src_001",
-            name="TechCrunch",
-            type=SourceType.RSS,
-            url="https://techcrunch.com/feed/",
-            category="TECH_NEWS",
-            is_active=True,
-            created_at=now,
-            updated_at=now,
-        )
 
-    def test_list_sources(
-        self,
-        client: TestClient,
-        sample_source: Source,
-    ) -> None:
-        """GET /sources 소스 목록 조회."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.find_all.return_value = [sample_source]
-            mock_get.return_value = mock_repo
+@pytest_asyncio.fixture(scope="module")
+async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """테스트 클라이언트 (TestClient의 스레드 포털 없이 이벤트 루프에서 ASGI 앱 호출)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
 
-            response = client.get("/sources")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["sources"]) == 1
-        assert data["sources"][0]["id"] == "src_001"
+@pytest.fixture
+def mock_repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_source_repo가 반환하는 Mock (호출 검증이 필요한 테스트용)."""
+    mock = MagicMock(spec=SourceRepository)
+    monkeypatch.setattr(sources, "get_source_repo", lambda request=None: mock)
+    return mock
 
-    def test_list_sources_by_type(
-        self,
-        client: TestClient,
-        sample_source: Source,
-    ) -> None:
-        """GET /sources?type=rss 타입별 소스 조회."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.find_by_type.return_value = [sample_source]
-            mock_get.return_value = mock_repo
 
-            response = client.get("/sources?type=rss")
+@pytest.fixture
+def stub_repo(monkeypatch: pytest.MonkeyPatch) -> Callable[..., SimpleNamespace]:
+    """get_source_repo가 반환할 경량 스텁을 설치하는 함수.
 
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["sources"]) == 1
+    호출 검증이 필요 없는 조회 테스트용으로, 넘긴 메서드만 갖는 SimpleNamespace를
+    사용해 MagicMock의 자식 Mock 생성과 호출 기록을 생략합니다.
+    """
+
+    def install(**methods: Callable[..., Any]) -> SimpleNamespace:
+        stub = SimpleNamespace(**methods)
+        monkeypatch.setattr(sources, "get_source_repo", lambda request=None: stub)
+        return stub
+
+    return install
+
+
+@pytest.fixture(scope="module")
+def sample_source() -> Source:
+    """샘플 소스 (모듈 내 공유, 테스트에서 수정하지 않음)."""
+    now = datetime.now(UTC)
+    return Source(
+        id="src_001",
+        name="TechCrunch",
+        type=SourceType.RSS,
+        url="https://techcrunch.com/feed/",
+        category="TECH_NEWS",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestSourcesEndpoints:
+    """Tests for sources API endpoints."""
 
-    def test_list_sources_active_only(
+    @pytest.mark.parametrize(
+        ("query", "repo_method"),
+        [
+            pytest.param("", "find_all", id="all"),
+            pytest.param("?type=rss", "find_by_type", id="by-type"),
+            pytest.param("?active=true", "find_active_sources", id="active-only"),
+        ],
+    )
+    async def test_list_sources(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
         sample_source: Source,
+        query: str,
+        repo_method: str,
     ) -> None:
-        """GET /sources?active=true 활성 소스만 조회."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.find_active_sources.return_value = [sample_source]
-            mock_get.return_value = mock_repo
+        """GET /sources 소스 목록 조회 (쿼리별 리포지토리 메서드)."""
+        # 지정한 메서드만 가진 스텁이므로 다른 메서드를 호출하면 실패
+        stub_repo(**{repo_method: lambda *args: [sample_source]})
 
-            response = client.get("/sources?active=true")
+        response = await client.get(f"/sources{query}")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["sources"]) == 1
+        assert data["sources"][0]["id"] == "src_001"
 
-    def test_get_source(
+    async def test_get_source(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
         sample_source: Source,
     ) -> None:
         """GET /sources/{source_id} 단일 소스 조회."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_source
-            mock_get.return_value = mock_repo
+        stub_repo(get_by_id=lambda source_id: sample_source)
 
-            response = client.get("/sources/src_001")
+        response = await client.get("/sources/src_001")
 
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == "src_001"
         assert data["name"] == "TechCrunch"
 
-    def test_get_source_not_found(
+    @pytest.mark.parametrize(
+        ("method", "json_body"),
+        [
+            pytest.param("get", None, id="get"),
+            pytest.param("put", {"name": "Updated"}, id="put"),
+            pytest.param("delete", None, id="delete"),
+        ],
+    )
+    async def test_source_not_found(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
+        method: str,
+        json_body: dict[str, Any] | None,
     ) -> None:
-        """GET /sources/{source_id} 존재하지 않는 소스."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_get.return_value = mock_repo
+        """GET/PUT/DELETE /sources/{source_id} 존재하지 않는 소스."""
+        stub_repo(get_by_id=lambda source_id: None)
 
-            response = client.get("/sources/src_999")
+        response = await client.request(method, "/sources/src_999", json=json_body)
 
         assert response.status_code == 404
 
-    def test_create_source(
+    async def test_create_source(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
     ) -> None:
         """POST /sources 새 소스 생성."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.create.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.post(
-                "/sources",
-                json={
-                    "name": "OpenAI Blog",
-                    "type": "rss",
-                    "url": "https://openai.com/blog/rss",
-                    "category": "AI_RESEARCH",
-                },
-            )
+        mock_repo.create.return_value = None
+
+        response = await client.post(
+            "/sources",
+            json={
+                "name": "OpenAI Blog",
+                "type": "rss",
+                "url": "https://openai.com/blog/rss",
+                "category": "AI_RESEARCH",
+            },
+        )
 
         assert response.status_code == 201
         data = response.json()
@@ -152,12 +165,16 @@ class TestSourcesEndpoints:
         assert data["type"] == "rss"
         mock_repo.create.assert_called_once()
 
-    def test_create_source_invalid_type(
+    async def test_create_source_invalid_type(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
     ) -> None:
         """POST /sources 잘못된 타입."""
-        response = client.post(
+        # 검증 단계에서 거부되어야 하므로 메서드 없는 스텁 (엔드포인트에 도달하면 실패)
+        stub_repo()
+
+        response = await client.post(
             "/sources",
             json={
                 "name": "Invalid",
@@ -168,109 +185,72 @@ class TestSourcesEndpoints:
 
         assert response.status_code == 422
 
-    def test_update_source(
+    async def test_update_source(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_source: Source,
     ) -> None:
         """PUT /sources/{source_id} 소스 수정."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_source
-            mock_repo.update.return_value = None
-            mock_get.return_value = mock_repo
+        # 엔드포인트가 조회한 객체를 직접 수정하므로 복사본 반환
+        mock_repo.get_by_id.return_value = sample_source.model_copy()
+        mock_repo.update.return_value = None
 
-            response = client.put(
-                "/sources/src_001",
-                json={"name": "TechCrunch Updated"},
-            )
+        response = await client.put(
+            "/sources/src_001",
+            json={"name": "TechCrunch Updated"},
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["name"] == "TechCrunch Updated"
 
-    def test_update_source_not_found(
-        self,
-        client: TestClient,
-    ) -> None:
-        """PUT /sources/{source_id} 존재하지 않는 소스 수정."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.put(
-                "/sources/src_999",
-                json={"name": "Updated"},
-            )
-
-        assert response.status_code == 404
-
-    def test_delete_source(
+    async def test_delete_source(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_source: Source,
     ) -> None:
         """DELETE /sources/{source_id} 소스 삭제."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_source
-            mock_repo.delete.return_value = None
-            mock_get.return_value = mock_repo
+        mock_repo.get_by_id.return_value = sample_source
+        mock_repo.delete.return_value = None
 
-            response = client.delete("/sources/src_001")
+        response = await client.delete("/sources/src_001")
 
         assert response.status_code == 204
         mock_repo.delete.assert_called_once_with("src_001")
 
-    def test_delete_source_not_found(
-        self,
-        client: TestClient,
-    ) -> None:
-        """DELETE /sources/{source_id} 존재하지 않는 소스 삭제."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.delete("/sources/src_999")
-
-        assert response.status_code == 404
-
-    def test_activate_source(
+    async def test_activate_source(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_source: Source,
     ) -> None:
         """POST /sources/{source_id}/activate 소스 활성화."""
         inactive_source = sample_source.model_copy()
         inactive_source.is_active = False
 
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = inactive_source
-            mock_repo.update.return_value = None
-            mock_get.return_value = mock_repo
+        mock_repo.get_by_id.return_value = inactive_source
+        mock_repo.update.return_value = None
 
-            response = client.post("/sources/src_001/activate")
+        response = await client.post("/sources/src_001/activate")
 
         assert response.status_code == 200
         data = response.json()
         assert data["is_active"] is True
 
-    def test_deactivate_source(
+    async def test_deactivate_source(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_source: Source,
     ) -> None:
         """POST /sources/{source_id}/deactivate 소스 비활성화."""
-        with patch("src.api.sources.get_source_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_source
-            mock_repo.deactivate.return_value = None
-            mock_get.return_value = mock_repo
+        # 엔드포인트가 조회한 객체를 직접 수정하므로 복사본 반환
+        mock_repo.get_by_id.return_value = sample_source.model_copy()
+        mock_repo.deactivate.return_value = None
 
-            response = client.post("/sources/src_001/deactivate")
+        response = await client.post("/sources/src_001/deactivate")
 
         assert response.status_code == 200
         data = response.json()
@@ -1,105 +1,132 @@
 """Tests for subscriptions CRUD API endpoints."""
 
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
+from src.api import subscriptions
 from src.models.subscription import (
     DeliveryFrequency,
     Subscription,
     SubscriptionPreferences,
 )
+from src.repositories.subscription_repo import SubscriptionRepository
 
 
-class TestSubscriptionsEndpoints:
-    """Tests for subscriptions API endpoints."""
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """테스트용 FastAPI 앱."""
+    app = FastAPI()
+    app.include_router(subscriptions.router)
+    return app
 
-    @pytest.fixture
-    def app(self) -> FastAPI:
-        """테스트용 FastAPI 앱."""
-        from src.api.subscriptions import router
-
-        app = FastAPI()
-        app.include_router(router)
-        return app
-
-    @pytest.fixture
-    def client(self, app: FastAPI) -> TestClient:
-        """테스트 클라이언트."""
-        return TestClient(app)
-
-    @pytest.fixture
-    def sample_subscription(self) -> Subscription:
-        """샘플 구독."""
-        now = datetime.now(UTC)
-        return Subscription(
-            id="sub_001",
-            platform="slack",
-            platform_config={
-                "team_id": "T12345",
-                "channel_id": "C12345678",
-            },
-            preferences=SubscriptionPreferences(
-                frequency=DeliveryFrequency.DAILY,
-                delivery_time="09:00",
-                min_relevance=0.3,
-                categories=["AI", "Technology"],
-            ),
-            is_active=True,
-            created_at=now,
-            updated_at=now,
-        )
 
-    def test_list_subscriptions(
-        self,
-        client: TestClient,
-        sample_subscription: Subscription,
-    ) -> None:
-        """GET /subscriptions 구독 목록 조회."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.find_all.return_value = [sample_subscription]
-            mock_get.return_value = mock_repo
+@pytest_asyncio.fixture(scope="module")
+async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """테스트 클라이언트 (TestClient의 스레드 포털 없이 이벤트 루프에서 ASGI 앱 호출)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
 
-            response = client.get("/subscriptions")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["subscriptions"]) == 1
-        assert data["subscriptions"][0]["id"] == "sub_001"
+@pytest.fixture
+def mock_repo(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """get_subscription_repo가 반환하는 Mock (호출 검증이 필요한 테스트용)."""
+    mock = MagicMock(spec=SubscriptionRepository)
+    monkeypatch.setattr(
+        subscriptions, "get_subscription_repo", lambda request=None: mock
+    )
+    return mock
 
-    def test_list_subscriptions_active_only(
+
+@pytest.fixture
+def stub_repo(monkeypatch: pytest.MonkeyPatch) -> Callable[..., SimpleNamespace]:
+    """get_subscription_repo가 반환할 경량 스텁을 설치하는 함수.
+
+    호출 검증이 필요 없는 조회 테스트용으로, 넘긴 메서드만 갖는 SimpleNamespace를
+    사용해 MagicMock의 자식 Mock 생성과 호출 기록을 생략합니다.
+    """
+
+    def install(**methods: Callable[..., Any]) -> SimpleNamespace:
+        stub = SimpleNamespace(**methods)
+        monkeypatch.setattr(
+            subscriptions, "get_subscription_repo", lambda request=None: stub
+        )
+        return stub
+
+    return install
+
+
+@pytest.fixture(scope="module")
+def sample_subscription() -> Subscription:
+    """샘플 구독 (모듈 내 공유, 테스트에서 수정하지 않음)."""
+    now = datetime.now(UTC)
+    return Subscription(
+        id="sub_001",
+        platform="slack",
+        platform_config={
+            "team_id": "T12345",
+            "channel_id": "C12345678",
+        },
+        preferences=SubscriptionPreferences(
+            frequency=DeliveryFrequency.DAILY,
+            delivery_time="09:00",
+            min_relevance=0.3,
+            categories=["AI", "Technology"],
+        ),
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestSubscriptionsEndpoints:
+    """Tests for subscriptions API endpoints."""
+
+    @pytest.mark.parametrize(
+        ("query", "repo_method"),
+        [
+            pytest.param("", "find_all", id="all"),
+            pytest.param("?active=true", "find_active_subscriptions", id="active-only"),
+        ],
+    )
+    async def test_list_subscriptions(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
         sample_subscription: Subscription,
+        query: str,
+        repo_method: str,
     ) -> None:
-        """GET /subscriptions?active=true 활성 구독만 조회."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.find_active_subscriptions.return_value = [sample_subscription]
-            mock_get.return_value = mock_repo
+        """GET /subscriptions 구독 목록 조회 (쿼리별 리포지토리 메서드)."""
+        # 지정한 메서드만 가진 스텁이므로 다른 메서드를 호출하면 실패
+        stub_repo(**{repo_method: lambda *args: [sample_subscription]})
 
-            response = client.get("/subscriptions?active=true")
+        response = await client.get(f"/subscriptions{query}")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["subscriptions"]) == 1
+        assert data["subscriptions"][0]["id"] == "sub_001"
 
-    def test_get_subscription(
+    async def test_get_subscription(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
         sample_subscription: Subscription,
     ) -> None:
         """GET /subscriptions/{subscription_id} 단일 구독 조회."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_subscription
-            mock_get.return_value = mock_repo
+        stub_repo(get_by_id=lambda subscription_id: sample_subscription)
 
-            response = client.get("/subscriptions/sub_001")
+        response = await client.get("/subscriptions/sub_001")
 
         assert response.status_code == 200
         data = response.json()
@@ -107,39 +134,47 @@ class TestSubscriptionsEndpoints:
         assert data["platform"] == "slack"
         assert data["platform_config"]["channel_id"] == "C12345678"
 
-    def test_get_subscription_not_found(
+    @pytest.mark.parametrize(
+        ("method", "json_body"),
+        [
+            pytest.param("get", None, id="get"),
+            pytest.param("put", {"preferences": {"delivery_time": "10:00"}}, id="put"),
+            pytest.param("delete", None, id="delete"),
+        ],
+    )
+    async def test_subscription_not_found(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        stub_repo: Callable[..., SimpleNamespace],
+        method: str,
+        json_body: dict[str, Any] | None,
     ) -> None:
-        """GET /subscriptions/{subscription_id} 존재하지 않는 구독."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_get.return_value = mock_repo
+        """GET/PUT/DELETE /subscriptions/{subscription_id} 존재하지 않는 구독."""
+        stub_repo(get_by_id=lambda subscription_id: None)
 
-            response = client.get("/subscriptions/sub_999")
+        response = await client.request(
+            method, "/subscriptions/sub_999", json=json_body
+        )
 
         assert response.status_code == 404
 
-    def test_create_subscription(
+    async def test_create_subscription(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
     ) -> None:
         """POST /subscriptions 새 구독 생성."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.create.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.post(
-                "/subscriptions",
-                json={
-                    "platform_config": {
-                        "team_id": "T12345",
-                        "channel_id": "C12345678",
-                    },
+        mock_repo.create.return_value = None
+
+        response = await client.post(
+            "/subscriptions",
+            json={
+                "platform_config": {
+                    "team_id": "T12345",
+                    "channel_id": "C12345678",
                 },
-            )
+            },
+        )
 
         assert response.status_code == 201
         data = response.json()
@@ -147,145 +182,106 @@ class TestSubscriptionsEndpoints:
         assert data["platform_config"]["channel_id"] == "C12345678"
         mock_repo.create.assert_called_once()
 
-    def test_create_subscription_with_preferences(
+    async def test_create_subscription_with_preferences(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
     ) -> None:
         """POST /subscriptions 선호도 설정 포함 구독 생성."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.create.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.post(
-                "/subscriptions",
-                json={
-                    "platform_config": {
-                        "team_id": "T12345",
-                        "channel_id": "C12345678",
-                    },
-                    "preferences": {
-                        "frequency": "daily",
-                        "delivery_time": "10:00",
-                        "min_relevance": 0.5,
-                        "categories": ["AI"],
-                    },
+        mock_repo.create.return_value = None
+
+        response = await client.post(
+            "/subscriptions",
+            json={
+                "platform_config": {
+                    "team_id": "T12345",
+                    "channel_id": "C12345678",
                 },
-            )
+                "preferences": {
+                    "frequency": "daily",
+                    "delivery_time": "10:00",
+                    "min_relevance": 0.5,
+                    "categories": ["AI"],
+                },
+            },
+        )
 
         assert response.status_code == 201
         data = response.json()
         assert data["preferences"]["min_relevance"] == 0.5
         assert data["preferences"]["delivery_time"] == "10:00"
 
-    def test_update_subscription(
+    async def test_update_subscription(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_subscription: Subscription,
     ) -> None:
         """PUT /subscriptions/{subscription_id} 구독 수정."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_subscription
-            mock_repo.update.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.put(
-                "/subscriptions/sub_001",
-                json={
-                    "preferences": {
-                        "delivery_time": "10:00",
-                    },
+        # 엔드포인트가 조회한 객체를 직접 수정하므로 복사본 반환
+        mock_repo.get_by_id.return_value = sample_subscription.model_copy()
+        mock_repo.update.return_value = None
+
+        response = await client.put(
+            "/subscriptions/sub_001",
+            json={
+                "preferences": {
+                    "delivery_time": "10:00",
                 },
-            )
+            },
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["preferences"]["delivery_time"] == "10:00"
 
-    def test_update_subscription_not_found(
-        self,
-        client: TestClient,
-    ) -> None:
-        """PUT /subscriptions/{subscription_id} 존재하지 않는 구독 수정."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.put(
-                "/subscriptions/sub_999",
-                json={"preferences": {"delivery_time": "10:00"}},
-            )
-
-        assert response.status_code == 404
-
-    def test_delete_subscription(
+    async def test_delete_subscription(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_subscription: Subscription,
     ) -> None:
         """DELETE /subscriptions/{subscription_id} 구독 삭제."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_subscription
-            mock_repo.delete.return_value = None
-            mock_get.return_value = mock_repo
+        mock_repo.get_by_id.return_value = sample_subscription
+        mock_repo.delete.return_value = None
 
-            response = client.delete("/subscriptions/sub_001")
+        response = await client.delete("/subscriptions/sub_001")
 
         assert response.status_code == 204
         mock_repo.delete.assert_called_once_with("sub_001")
 
-    def test_delete_subscription_not_found(
-        self,
-        client: TestClient,
-    ) -> None:
-        """DELETE /subscriptions/{subscription_id} 존재하지 않는 구독 삭제."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = None
-            mock_get.return_value = mock_repo
-
-            response = client.delete("/subscriptions/sub_999")
-
-        assert response.status_code == 404
-
-    def test_activate_subscription(
+    async def test_activate_subscription(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_subscription: Subscription,
     ) -> None:
         """POST /subscriptions/{subscription_id}/activate 구독 활성화."""
         inactive_sub = sample_subscription.model_copy()
         inactive_sub.is_active = False
 
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = inactive_sub
-            mock_repo.activate.return_value = None
-            mock_get.return_value = mock_repo
+        mock_repo.get_by_id.return_value = inactive_sub
+        mock_repo.activate.return_value = None
 
-            response = client.post("/subscriptions/sub_001/activate")
+        response = await client.post("/subscriptions/sub_001/activate")
 
         assert response.status_code == 200
         data = response.json()
         assert data["is_active"] is True
         mock_repo.activate.assert_called_once_with("sub_001")
 
-    def test_deactivate_subscription(
+    async def test_deactivate_subscription(
         self,
-        client: TestClient,
+        client: AsyncClient,
+        mock_repo: MagicMock,
         sample_subscription: Subscription,
     ) -> None:
         """POST /subscriptions/{subscription_id}/deactivate 구독 비활성화."""
-        with patch("src.api.subscriptions.get_subscription_repo") as mock_get:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id.return_value = sample_subscription
-            mock_repo.deactivate.return_value = None
-            mock_get.return_value = mock_repo
+        # 엔드포인트가 조회한 객체를 직접 수정하므로 복사본 반환
+        mock_repo.get_by_id.return_value = sample_subscription.model_copy()
+        mock_repo.deactivate.return_value = None
 
-            response = client.post("/subscriptions/sub_001/deactivate")
+        response = await client.post("/subscriptions/sub_001/deactivate")
 
         assert response.status_code == 200
         data = response.json()
@@ -1,65 +1,78 @@
 """Tests for logging configuration."""
 
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
 import structlog
 
+from src.config.logging import configure_logging, get_logger
+
+
+@pytest.fixture(scope="module")
+def json_logging_config() -> Iterator[dict[str, Any]]:
+    """JSON 출력으로 한 번만 설정한 structlog 설정 (모듈 내 공유).
+
+    이후 다른 픽스처가 전역 설정을 바꿔도 검사할 수 있도록 설정 시점의 스냅샷을 반환합니다.
+    """
+    configure_logging(json_logs=True)
+    yield structlog.get_config()
+
+
+@pytest.fixture(scope="module")
+def console_logging() -> Iterator[None]:
+    """콘솔 출력으로 한 번만 설정 (모듈 내 공유)."""
+    configure_logging(json_logs=False)  # Use console for easier testing
+    yield
+
 
 class TestLoggingConfiguration:
     """Test logging configuration."""
 
-    def test_configure_logging_json_output(self) -> None:
+    def test_configure_logging_json_output(
+        self, json_logging_config: dict[str, Any]
+    ) -> None:
         """Configured logger should output JSON format."""
-        from src.config.logging import configure_logging
-
-        configure_logging(json_logs=True)
-
         # Get a logger to verify configuration works
         _logger = structlog.get_logger()
 
         # structlog with JSON renderer should produce valid JSON
         # We test the configuration was applied
         assert structlog.is_configured()
+        assert isinstance(
+            json_logging_config["processors"][-1], structlog.processors.JSONRenderer
+        )
 
-    def test_configure_logging_adds_timestamp(self) -> None:
+    def test_configure_logging_adds_timestamp(
+        self, json_logging_config: dict[str, Any]
+    ) -> None:
         """Logs should include timestamp."""
-        from src.config.logging import configure_logging
-
-        configure_logging(json_logs=True)
-
         # Verify the processors include TimeStamper
-        config = structlog.get_config()
-        processor_names = [p.__class__.__name__ for p in config["processors"]]
+        processors = json_logging_config["processors"]
+        processor_names = [p.__class__.__name__ for p in processors]
 
         assert "TimeStamper" in processor_names or any(
-            "timestamp" in str(p) for p in config["processors"]
+            "timestamp" in str(p) for p in processors
         )
 
-    def test_configure_logging_adds_log_level(self) -> None:
+    def test_configure_logging_adds_log_level(
+        self, json_logging_config: dict[str, Any]
+    ) -> None:
         """Logs should include log level."""
-        from src.config.logging import configure_logging
-
-        configure_logging(json_logs=True)
-
-        config = structlog.get_config()
-        processor_names = [str(p) for p in config["processors"]]
+        processor_names = [str(p) for p in json_logging_config["processors"]]
 
         # Check that add_log_level is in the processors
         assert any("add_log_level" in name for name in processor_names)
 
-    def test_get_logger_returns_bound_logger(self) -> None:
+    def test_get_logger_returns_bound_logger(self, console_logging: None) -> None:
         """get_logger should return a logger that can be used."""
-        from src.config.logging import configure_logging, get_logger
-
-        configure_logging(json_logs=False)  # Use console for easier testing
         logger = get_logger()
 
         # Should not raise
         logger.info("test message", extra_field="value")
 
-    def test_logger_with_context(self) -> None:
+    def test_logger_with_context(self, console_logging: None) -> None:
         """Logger should support context binding."""
-        from src.config.logging import configure_logging, get_logger
-
-        configure_logging(json_logs=False)
         logger = get_logger()
 
         # Bind context
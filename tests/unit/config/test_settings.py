@@ -3,19 +3,24 @@
 import pytest
 from pydantic import ValidationError
 
+from src.config.settings import Settings
+
+
+@pytest.fixture
+def base_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """필수 환경 변수 4개를 설정한 monkeypatch."""
+    monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
+    monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+    monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
+    return monkeypatch
+
 
 class TestSettings:
     """Test Settings class."""
 
-    def test_settings_loads_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_settings_loads_from_env(self, base_env: pytest.MonkeyPatch) -> None:
         """Settings should load values from environment variables."""
-        monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
-        monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
-        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
-        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
-
-        from src.config.settings import Settings
-
         settings = Settings()
 
         assert settings.GCP_PROJECT_ID == "test-project"
@@ -33,50 +38,37 @@ class TestSettings:
         monkeypatch.delenv("SLACK_BOT_TOKEN", raising=False)
         monkeypatch.delenv("SLACK_SIGNING_SECRET", raising=False)
 
-        from src.config.settings import Settings
-
         with pytest.raises(ValidationError):
             # _env_file=None으로 .env 파일 로딩 비활성화
             Settings(_env_file=None)
 
-    def test_settings_is_local_property(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """is_local should return True when FIRESTORE_EMULATOR_HOST is set."""
-        monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
-        monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
-        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
-        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
-        monkeypatch.setenv("FIRESTORE_EMULATOR_HOST", "localhost:8086")
-
-        from src.config.settings import Settings
-
-        settings = Settings()
-        assert settings.is_local is True
-
-    def test_settings_is_local_false_when_no_emulator(
-        self, monkeypatch: pytest.MonkeyPatch
+    @pytest.mark.parametrize(
+        ("extra_env", "expected"),
+        [
+            pytest.param(
+                {"FIRESTORE_EMULATOR_HOST": "localhost:8086"}, True, id="emulator_set"
+            ),
+            pytest.param({}, False, id="no_emulator"),
+        ],
+    )
+    def test_settings_is_local(
+        self,
+        base_env: pytest.MonkeyPatch,
+        extra_env: dict[str, str],
+        expected: bool,
     ) -> None:
-        """is_local should return False when FIRESTORE_EMULATOR_HOST is not set."""
-        monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
-        monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
-        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
-        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
-        monkeypatch.delenv("FIRESTORE_EMULATOR_HOST", raising=False)
-
-        from src.config.settings import Settings
+        """is_local should be True only when FIRESTORE_EMULATOR_HOST is set."""
+        base_env.delenv("FIRESTORE_EMULATOR_HOST", raising=False)
+        for key, value in extra_env.items():
+            base_env.setenv(key, value)
 
         # _env_file=None으로 .env 파일 로딩 비활성화 (FIRESTORE_EMULATOR_HOST 방지)
         settings = Settings(_env_file=None)
-        assert settings.is_local is False
+        assert settings.is_local is expected
 
-    def test_settings_default_tasks_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_settings_default_tasks_mode(self, base_env: pytest.MonkeyPatch) -> None:
         """TASKS_MODE should default to 'direct'."""
-        monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
-        monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key")
-        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
-        monkeypatch.setenv("SLACK_SIGNING_SECRET", "test-secret")
-        monkeypatch.delenv("TASKS_MODE", raising=False)
-
-        from src.config.settings import Settings
+        base_env.delenv("TASKS_MODE", raising=False)
 
         settings = Settings()
         assert settings.TASKS_MODE == "direct"
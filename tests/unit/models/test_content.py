@@ -8,8 +8,11 @@ from pydantic import ValidationError
 from src.models.content import (
     Content,
     ProcessingStatus,
+    generate_content_hash,
     generate_content_key,
+    generate_simhash,
     normalize_url,
+    simhash_distance,
 )
 
 
@@ -115,6 +118,63 @@ class TestGenerateContentKey:
         assert len(hash_part) == 16
 
 
+class TestGenerateContentHash:
+    """Tests for content hash generation."""
+
+    def test_whitespace_normalized(self) -> None:
+        """공백 차이만 있는 본문은 동일 해시."""
+        assert generate_content_hash("Hello  world\n") == generate_content_hash(
+            " Hello world"
+        )
+
+    def test_different_body_different_hash(self) -> None:
+        """다른 본문은 다른 해시 (sha256 hex)."""
+        hash1 = generate_content_hash("Hello world")
+        hash2 = generate_content_hash("Hello there")
+        assert hash1 != hash2
+        assert len(hash1) == 64
+
+    def test_hash_is_stable(self) -> None:
+        """저장된 해시와 호환되는 sha256 값 유지."""
+        assert generate_content_hash("Hello  world") == (
+            "64ec88ca00b268e5ba1a35678a1b5316d212f4f366b2477232534a8aeca37f3c"
+        )
+
+
+class TestGenerateSimhash:
+    """Tests for SimHash generation."""
+
+    ARTICLE = " ".join(
+        f"Large language models keep improving at reasoning task {i}."
+        for i in range(60)
+    )
+
+    def test_near_duplicate_small_distance(self) -> None:
+        """한 줄만 다른 본문은 해밍 거리가 작음."""
+        original = generate_simhash(self.ARTICLE + " Visitors: 1024.")
+        updated = generate_simhash(self.ARTICLE + " Visitors: 2048.")
+        assert simhash_distance(original, updated) <= 3
+
+    def test_different_body_large_distance(self) -> None:
+        """전혀 다른 본문은 해밍 거리가 큼."""
+        other = " ".join(
+            f"Cloud providers announced new pricing for region {i}." for i in range(60)
+        )
+        assert (
+            simhash_distance(generate_simhash(self.ARTICLE), generate_simhash(other))
+            > 10
+        )
+
+    def test_case_and_punctuation_ignored(self) -> None:
+        """대소문자/구두점 차이는 무시."""
+        assert generate_simhash("Hello, World!") == generate_simhash("hello world")
+
+    def test_empty_body(self) -> None:
+        """단어가 없으면 0."""
+        assert generate_simhash("  ...  ") == 0
+        assert generate_simhash("single") < 2**64
+
+
 class TestContent:
     """Tests for Content model."""
 
@@ -86,6 +86,32 @@ class TestBaseRepository:
         assert call_args[0][2]["name"] == "New Sample"
         assert call_args[0][2]["value"] == 100
 
+    def test_create_many(
+        self, repo: SampleRepository, mock_firestore: MagicMock
+    ) -> None:
+        """여러 문서를 batch write 한 번으로 생성."""
+        models = [
+            SampleModel(id="sample_002", name="First", value=1),
+            SampleModel(id="sample_003", name="Second", value=2),
+        ]
+
+        repo.create_many(models)
+
+        mock_firestore.set_many.assert_called_once()
+        collection, documents = mock_firestore.set_many.call_args[0]
+        assert collection == "samples"
+        assert [doc_id for doc_id, _ in documents] == ["sample_002", "sample_003"]
+        assert documents[1][1]["name"] == "Second"
+        mock_firestore.set.assert_not_called()
+
+    def test_create_many_empty(
+        self, repo: SampleRepository, mock_firestore: MagicMock
+    ) -> None:
+        """빈 목록이면 쓰기 호출 없음."""
+        repo.create_many([])
+
+        mock_firestore.set_many.assert_not_called()
+
     def test_update(self, repo: SampleRepository, mock_firestore: MagicMock) -> None:
         """문서 업데이트."""
         model = SampleModel(id="sample_001", name="Updated Sample", value=200)
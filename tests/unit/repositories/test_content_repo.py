@@ -89,6 +89,41 @@ class TestContentRepository:
 
         assert repo.exists_by_content_key("src_001:abcd1234") is True
 
+    def test_exists_by_content_hash(
+        self, repo: ContentRepository, mock_firestore: MagicMock
+    ) -> None:
+        """소스 내 content_hash 존재 여부를 projection 조회로 확인."""
+        mock_firestore.query.return_value = [{"content_hash": "abc"}]
+
+        assert repo.exists_by_content_hash("src_001", "abc") is True
+        mock_firestore.query.assert_called_once_with(
+            "contents",
+            [("source_id", "==", "src_001"), ("content_hash", "==", "abc")],
+            fields=["content_hash"],
+        )
+
+        mock_firestore.query.return_value = []
+        assert repo.exists_by_content_hash("src_001", "def") is False
+
+    def test_load_simhashes(
+        self, repo: ContentRepository, mock_firestore: MagicMock
+    ) -> None:
+        """소스의 최근 limit건 simhash만 projection 조회 (없는 콘텐츠는 제외)."""
+        mock_firestore.query.return_value = [
+            {"simhash": "00000000000000ff"},
+            {},
+        ]
+
+        assert repo.load_simhashes("src_001", limit=50) == [0xFF]
+        mock_firestore.query.assert_called_once_with(
+            "contents",
+            [("source_id", "==", "src_001")],
+            fields=["simhash"],
+            order_by="collected_at",
+            descending=True,
+            limit=50,
+        )
+
     def test_find_by_status(
         self,
         repo: ContentRepository,
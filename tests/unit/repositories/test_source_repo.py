@@ -148,6 +148,23 @@ class TestSourceRepository:
         assert "last_fetched_at" in call_args[0][2]
         assert "updated_at" in call_args[0][2]
 
+    def test_update_cache_headers(
+        self,
+        repo: SourceRepository,
+        mock_firestore: MagicMock,
+    ) -> None:
+        """HTTP 조건부 요청 검증자 업데이트."""
+        repo.update_cache_headers(
+            "src_001", '"abc123"', "Fri, 26 Dec 2025 09:00:00 GMT"
+        )
+
+        mock_firestore.update.assert_called_once()
+        call_args = mock_firestore.update.call_args
+        assert call_args[0][:2] == ("sources", "src_001")
+        assert call_args[0][2]["etag"] == '"abc123"'
+        assert call_args[0][2]["last_modified"] == "Fri, 26 Dec 2025 09:00:00 GMT"
+        assert "updated_at" in call_args[0][2]
+
     def test_increment_error_count(
         self,
         repo: SourceRepository,
@@ -1,6 +1,7 @@
 """Tests for ContentPipeline."""
 
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -138,14 +139,16 @@ class TestContentPipeline:
         mock_source_repo.find_active_sources.return_value = [sample_rss_source]
 
         with patch.object(
-            content_pipeline, "_collect_from_rss", return_value=["cnt_001", "cnt_002"]
+            content_pipeline,
+            "_collect_from_rss_many",
+            return_value={"src_001": ["cnt_001", "cnt_002"]},
         ) as mock_collect:
             result = content_pipeline.collect_from_sources()
 
         assert result["total_sources"] == 1
         assert result["collected"] == 2
         assert result["enqueued"] == 0  # TasksClient 없으므로 0
-        mock_collect.assert_called_once()
+        mock_collect.assert_called_once_with([sample_rss_source])
 
     def test_collect_from_sources_with_enqueue(
         self,
@@ -159,8 +162,8 @@ class TestContentPipeline:
 
         with patch.object(
             content_pipeline_with_tasks,
-            "_collect_from_rss",
-            return_value=["cnt_001", "cnt_002", "cnt_003"],
+            "_collect_from_rss_many",
+            return_value={"src_001": ["cnt_001", "cnt_002", "cnt_003"]},
         ):
             result = content_pipeline_with_tasks.collect_from_sources()
 
@@ -185,8 +188,8 @@ class TestContentPipeline:
         with (
             patch.object(
                 content_pipeline,
-                "_collect_from_rss",
-                return_value=["cnt_001", "cnt_002"],
+                "_collect_from_rss_many",
+                return_value={"src_001": ["cnt_001", "cnt_002"]},
             ),
             patch.object(
                 content_pipeline, "_collect_from_youtube", return_value=["cnt_003"]
@@ -208,14 +211,37 @@ class TestContentPipeline:
 
         with patch.object(
             content_pipeline,
-            "_collect_from_web",
-            return_value=["cnt_web_001", "cnt_web_002"],
+            "_collect_from_web_many",
+            return_value={"src_003": ["cnt_web_001", "cnt_web_002"]},
         ) as mock_collect:
             result = content_pipeline.collect_from_sources()
 
         assert result["total_sources"] == 1
         assert result["collected"] == 2
-        mock_collect.assert_called_once_with(sample_web_source)
+        mock_collect.assert_called_once_with([sample_web_source])
+
+    def test_collect_from_web_many(
+        self,
+        content_pipeline: ContentPipeline,
+        mock_content_repo: MagicMock,
+        sample_web_source: Source,
+    ) -> None:
+        """WEB 소스를 fetch_web_many로 한 번에 수집하고 실패는 예외로 반환."""
+        failing_source = sample_web_source.model_copy(update={"id": "src_009"})
+        error = RuntimeError("All extraction stages failed")
+
+        with patch(
+            "src.agent.domains.collector.tools.web_scraper_tool.fetch_web_many",
+            return_value=[[MagicMock(id="cnt_web_001")], error],
+        ) as mock_fetch:
+            results = content_pipeline._collect_from_web_many(
+                [sample_web_source, failing_source]
+            )
+
+        assert results == {"src_003": ["cnt_web_001"], "src_009": error}
+        mock_fetch.assert_called_once_with(
+            [sample_web_source, failing_source], mock_content_repo
+        )
 
     def test_collect_with_error_handling(
         self,
@@ -228,14 +254,86 @@ class TestContentPipeline:
 
         with patch.object(
             content_pipeline,
-            "_collect_from_rss",
-            side_effect=Exception("RSS fetch error"),
+            "_collect_from_rss_many",
+            return_value={"src_001": Exception("RSS fetch error")},
         ):
             result = content_pipeline.collect_from_sources()
 
         # 에러가 발생해도 결과 반환
         assert result["total_sources"] == 1
         assert result["errors"] >= 1
+        mock_source_repo.increment_error_count.assert_called_once_with("src_001")
+        mock_source_repo.update_last_fetched.assert_not_called()
+
+    def test_collect_from_rss_many_uses_and_persists_cache_headers(
+        self,
+        content_pipeline: ContentPipeline,
+        mock_source_repo: MagicMock,
+        sample_rss_source: Source,
+    ) -> None:
+        """RSS 동시 수집에 저장된 검증자를 전달하고 성공한 소스만 새 값을 저장."""
+        failing_source = sample_rss_source.model_copy(update={"id": "src_009"})
+        sample_rss_source.etag = '"old-etag"'
+
+        async def _fetch_rss_many(
+            sources: list[Source], content_repo: object, **kwargs: Any
+        ) -> list[object]:
+            cache_headers = kwargs["cache_headers"]
+            assert cache_headers["src_001"].etag == '"old-etag"'
+            cache_headers["src_001"].etag = '"new-etag"'
+            cache_headers["src_009"].etag = '"ignored"'
+            return [[MagicMock(id="cnt_001")], ValueError("bad feed")]
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.fetch_rss_many",
+            side_effect=_fetch_rss_many,
+        ):
+            results = content_pipeline._collect_from_rss_many(
+                [sample_rss_source, failing_source]
+            )
+
+        assert results["src_001"] == ["cnt_001"]
+        assert isinstance(results["src_009"], ValueError)
+        mock_source_repo.update_cache_headers.assert_called_once_with(
+            "src_001", '"new-etag"', None
+        )
+
+    def test_collect_from_rss_persists_cache_headers(
+        self,
+        content_pipeline: ContentPipeline,
+        mock_source_repo: MagicMock,
+        sample_rss_source: Source,
+    ) -> None:
+        """RSS 응답의 새 ETag/Last-Modified를 소스에 저장."""
+
+        def _fetch_rss(**kwargs: object) -> list[Content]:
+            kwargs["cache_headers"].etag = '"new-etag"'  # type: ignore[attr-defined]
+            return []
+
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.fetch_rss",
+            side_effect=_fetch_rss,
+        ):
+            content_pipeline._collect_from_rss(sample_rss_source)
+
+        mock_source_repo.update_cache_headers.assert_called_once_with(
+            "src_001", '"new-etag"', None
+        )
+
+    def test_collect_from_rss_skips_unchanged_cache_headers(
+        self,
+        content_pipeline: ContentPipeline,
+        mock_source_repo: MagicMock,
+        sample_rss_source: Source,
+    ) -> None:
+        """검증자가 바뀌지 않으면 소스를 갱신하지 않음."""
+        with patch(
+            "src.agent.domains.collector.tools.rss_tool.fetch_rss",
+            return_value=[],
+        ):
+            content_pipeline._collect_from_rss(sample_rss_source)
+
+        mock_source_repo.update_cache_headers.assert_not_called()
 
     def test_process_single_content_success(
         self,
@@ -1,5 +1,7 @@
 """Tests for DigestService."""
 
+import threading
+import time
 from datetime import UTC, date, datetime
 from unittest.mock import MagicMock
 
@@ -226,6 +228,41 @@ class TestDigestService:
         assert mock_slack_client.post_message.call_count == 2
         mock_digest_repo.update_sent_info.assert_called_once()
 
+    def test_send_digest_batched(
+        self,
+        mock_content_repo: MagicMock,
+        mock_digest_repo: MagicMock,
+        mock_subscription_repo: MagicMock,
+        mock_slack_client: MagicMock,
+        sample_contents: list[Content],
+    ) -> None:
+        """batch_messages=True면 콘텐츠를 한 메시지로 묶어 발송."""
+        service = DigestService(
+            content_repo=mock_content_repo,
+            digest_repo=mock_digest_repo,
+            subscription_repo=mock_subscription_repo,
+            slack_client=mock_slack_client,
+            batch_messages=True,
+        )
+        digest = Digest(
+            id="dgst_001",
+            subscription_id="sub_001",
+            digest_key="sub_001:2025-12-26",
+            digest_date=date(2025, 12, 26),
+            content_ids=["cnt_001", "cnt_002"],
+            content_count=2,
+            channel_id="C123456789",
+            status=DigestStatus.PENDING,
+            created_at=datetime.now(UTC),
+        )
+        mock_content_repo.find_by_ids.return_value = sample_contents
+
+        result = service.send_digest(digest)
+
+        assert result is True
+        mock_slack_client.post_message.assert_called_once()
+        mock_digest_repo.update_sent_info.assert_called_once()
+
     def test_send_digest_failure(
         self,
         digest_service: DigestService,
@@ -344,6 +381,106 @@ class TestDigestService:
         assert results["sent"] == 1
         assert results["failed"] == 1
 
+    def test_process_pending_digests_sends_concurrently(
+        self,
+        digest_service: DigestService,
+        mock_content_repo: MagicMock,
+        mock_digest_repo: MagicMock,
+        mock_slack_client: MagicMock,
+        sample_contents: list[Content],
+    ) -> None:
+        """서로 다른 다이제스트는 동시에 발송."""
+        pending_digests = [
+            Digest(
+                id=f"dgst_00{i}",
+                subscription_id=f"sub_00{i}",
+                digest_key=f"sub_00{i}:2025-12-26",
+                digest_date=date(2025, 12, 26),
+                content_ids=["cnt_001"],
+                content_count=1,
+                channel_id=f"C00{i}",
+                status=DigestStatus.PENDING,
+                created_at=datetime.now(UTC),
+            )
+            for i in range(2)
+        ]
+        mock_digest_repo.find_pending_for_sending.return_value = pending_digests
+        mock_content_repo.find_by_ids.return_value = sample_contents[:1]
+
+        # 두 발송이 동시에 진행 중이어야 barrier를 통과 (순차면 타임아웃)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _post_message(**kwargs: object) -> dict[str, object]:
+            barrier.wait()
+            return {"ok": True, "ts": "1234567890.123456"}
+
+        mock_slack_client.post_message.side_effect = _post_message
+
+        results = digest_service.process_pending_digests()
+
+        assert results == {"total": 2, "sent": 2, "failed": 0}
+
+    def test_send_digests_keeps_channel_order(
+        self,
+        digest_service: DigestService,
+        mock_content_repo: MagicMock,
+        mock_slack_client: MagicMock,
+        sample_contents: list[Content],
+    ) -> None:
+        """같은 채널의 다이제스트는 순차 발송, 다른 채널은 동시에 발송."""
+        channels = ["C_SHARED", "C_OTHER", "C_SHARED"]
+        digests = [
+            Digest(
+                id=f"dgst_00{i}",
+                subscription_id=f"sub_00{i}",
+                digest_key=f"sub_00{i}:2025-12-26",
+                digest_date=date(2025, 12, 26),
+                content_ids=["cnt_001"],
+                content_count=1,
+                channel_id=channel,
+                status=DigestStatus.PENDING,
+                created_at=datetime.now(UTC),
+            )
+            for i, channel in enumerate(channels)
+        ]
+        mock_content_repo.find_by_ids.return_value = sample_contents[:1]
+
+        # 처음 두 발송(C_SHARED 첫 번째, C_OTHER)이 동시에 진행 중이어야 barrier 통과
+        barrier = threading.Barrier(2, timeout=5)
+        lock = threading.Lock()
+        arrivals = 0
+        in_flight: dict[str, int] = {}
+
+        def _post_message(**kwargs: object) -> dict[str, object]:
+            nonlocal arrivals
+            channel = str(kwargs["channel"])
+            with lock:
+                arrivals += 1
+                arrival = arrivals
+                in_flight[channel] = in_flight.get(channel, 0) + 1
+                # 같은 채널에 겹쳐 발송하면 실패로 처리됨
+                assert in_flight[channel] == 1
+            try:
+                if arrival <= 2:
+                    barrier.wait()
+                # 겹치는 발송이 있으면 드러나도록 잠시 유지
+                time.sleep(0.05)
+            finally:
+                with lock:
+                    in_flight[channel] -= 1
+            return {"ok": True, "ts": "1234567890.123456"}
+
+        mock_slack_client.post_message.side_effect = _post_message
+
+        outcomes = digest_service.send_digests(digests)
+
+        assert outcomes == [True, True, True]
+        assert mock_slack_client.post_message.call_count == 3
+
+    def test_send_digests_empty(self, digest_service: DigestService) -> None:
+        """발송할 다이제스트가 없으면 빈 목록."""
+        assert digest_service.send_digests([]) == []
+
     def test_get_due_subscriptions(
         self,
         digest_service: DigestService,
@@ -1,14 +1,22 @@
 """Test utilities shared across test modules."""
 
+import functools
 import os
 import socket
 
+from src.adapters.firestore_client import FirestoreClient
 
+# 에뮬레이터 미기동 시 기본 소켓 타임아웃까지 기다리지 않도록 짧게 설정
+_EMULATOR_PROBE_TIMEOUT = 0.2
+
+
+@functools.lru_cache(maxsize=1)
 def is_emulator_available() -> bool:
     """Firestore 에뮬레이터 사용 가능 여부 확인.
 
     환경변수 FIRESTORE_EMULATOR_HOST에서 호스트/포트를 읽어
-    연결 가능 여부를 확인합니다.
+    연결 가능 여부를 확인합니다. 결과는 프로세스 내에서 캐시되어
+    여러 테스트 모듈이 호출해도 프로브는 한 번만 수행됩니다.
 
     Returns:
         에뮬레이터 연결 가능 여부.
@@ -20,8 +28,24 @@ def is_emulator_available() -> bool:
 
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(1)
+            sock.settimeout(_EMULATOR_PROBE_TIMEOUT)
             result = sock.connect_ex((hostname, port))
             return result == 0
     except Exception:
         return False
+
+
+@functools.lru_cache(maxsize=8)
+def get_cached_firestore_client(project_id: str) -> FirestoreClient:
+    """프로젝트 ID별 FirestoreClient 재사용 (프로세스/xdist 워커 단위).
+
+    FirestoreClient 생성 시마다 에뮬레이터와의 gRPC 채널을 새로 여는 비용을
+    피하기 위해 같은 프로젝트 ID에 대해서는 동일한 인스턴스를 반환합니다.
+
+    Args:
+        project_id: GCP 프로젝트 ID.
+
+    Returns:
+        캐시된 FirestoreClient.
+    """
+    return FirestoreClient(project_id=project_id)